@@ -0,0 +1,66 @@
+"""Per-session memory overhead of the catalog cache.
+
+Simulates ``--sessions`` concurrent reruns, each holding the catalog returned
+by the loader, and reports the memory allocated per session for:
+
+* ``cache_data``: the previous loader, which hands every caller a fresh
+  unpickled copy of the three cached tables;
+* ``cache_resource``: the shared read-only :class:`Catalog`.
+
+Run with::
+
+    python benchmarks/bench_catalog_memory.py --sessions 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+logging.disable(logging.WARNING)
+
+import streamlit as st
+
+from src.utils.catalog import build_catalog, load_catalog_frames
+
+
+@st.cache_data
+def load_per_call_copies():
+    return load_catalog_frames()
+
+
+@st.cache_resource
+def load_shared():
+    return build_catalog()
+
+
+def measure(loader, sessions: int) -> float:
+    loader()  # warm the cache, as after the first page load
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [loader() for _ in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / sessions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    for label, loader in [
+        ("cache_data (before)", load_per_call_copies),
+        ("cache_resource (after)", load_shared),
+    ]:
+        per_session = measure(loader, args.sessions)
+        print(f"{label:<24} {per_session / 1024:10.1f} KiB per session")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Latency of :func:`generate_item` for every part.
+
+Each part is generated ``--repeat`` times from the same spec — the values
+the UI would submit with a CG3M material and every quality flag set — and
+the script reports the mean time per item.  No Streamlit is involved, so
+this is the cost of the item logic alone.
+
+Run with::
+
+    python benchmarks/bench_generate_item.py --repeat 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import generate_item, part_names
+from src.engine.common import SERVICE_FLAGS
+from src.utils.catalog import build_catalog
+
+SPEC = {
+    "model": "HPX",
+    "size": "3HPX10A",
+    "note": "NOTE",
+    "dwg": "DWG-001",
+    "material_type": "ASTM",
+    "material_prefix": "A351_",
+    "material_name": "CG3M",
+    "material_note": "MATERIAL NOTE",
+    **{name: True for name in SERVICE_FLAGS},
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    catalog = build_catalog()
+    total = 0.0
+    for part in part_names():
+        generate_item(part, SPEC, catalog)
+        seconds = timeit.timeit(lambda: generate_item(part, SPEC, catalog), number=args.repeat)
+        total += seconds
+        print(f"{part:<36} {seconds / args.repeat * 1e6:10.1f} us per item")
+    print(f"{'mean':<36} {total / args.repeat / len(part_names()) * 1e6:10.1f} us per item")
+
+
+if __name__ == "__main__":
+    main()
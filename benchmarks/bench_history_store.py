@@ -0,0 +1,97 @@
+"""Lookup latency of the item history at ``--records`` items.
+
+Fills a fresh history database with synthetic items and ``--codes`` item
+codes (skipped when the file already holds them) and times the indexed
+lookups: by part, FPD material code, drawing number, normalized
+description, full-text search and the item code of an equivalent spec.
+
+Run with::
+
+    python benchmarks/bench_history_store.py --records 1000000 --db /tmp/history.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import OutputRecord, part_names, spec_hash
+from src.utils.history_store import ItemHistory
+
+MATERIALS = ("ASTM A351_ CG3M", "ASTM A743_ CF8M", "ASTM A182_ F51", "EN 1.4462", "DIN GGG40")
+
+
+def synthetic_items(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    parts = part_names()
+    for n in range(count):
+        part = rng.choice(parts)
+        material = rng.choice(MATERIALS)
+        fields = {
+            "Description": f"*{part.upper()} - HPX - {rng.randint(1, 12)}HPX{rng.randint(5, 40)}A"
+                           f" - {material} - NOTE {n}",
+            "Disegno": f"D{rng.randint(0, 200_000):06d}",
+            "Material": material,
+            "FPD material code": f"C{rng.randint(1000, 9999)}",
+            "Catalog version": "v1 (bench)",
+        }
+        spec = {"model": "HPX", "note": str(n)}
+        yield OutputRecord(part, fields, spec_hash(part, spec)), spec, f"user{n % 40}"
+
+
+def fill(history: ItemHistory, count: int, chunk: int = 50_000) -> None:
+    items = synthetic_items(count)
+    start = time.perf_counter()
+    done = 0
+    while done < count:
+        done += history.append_many(next(items) for _ in range(min(chunk, count - done)))
+    print(f"inserted {count} items in {time.perf_counter() - start:.1f} s")
+
+
+def timed(label: str, fn, repeat: int = 50) -> None:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = fn()
+    seconds = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {seconds * 1e3:7.2f} ms  ({len(found)} items)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--codes", type=int, default=200_000)
+    parser.add_argument("--db", type=Path, default=Path("/tmp/bench_history.db"))
+    args = parser.parse_args(argv)
+
+    history = ItemHistory(args.db)
+    if len(history) < args.records:
+        fill(history, args.records - len(history))
+    codes = history._connection().execute("SELECT count(*) FROM item_codes").fetchone()[0]
+    if codes < args.codes:
+        start = time.perf_counter()
+        for item_id in range(codes + 1, args.codes + 1):
+            item = history.get(item_id)
+            history.record_code(f"{item_id:010d}", item.spec_hash, item_id)
+        print(f"recorded {args.codes - codes} item codes in {time.perf_counter() - start:.1f} s")
+    sample = history.get(args.records // 2)
+
+    timed("find(part=...)", lambda: history.find(part=sample.part))
+    timed("find(fpd_code=...)", lambda: history.find(fpd_code=sample.fpd_code))
+    timed("find(drawing=...)", lambda: history.find(drawing=sample.drawing))
+    timed("find(description=...)", lambda: history.find(description=sample.description))
+    timed("search('cg3m hpx')", lambda: history.search("cg3m hpx"))
+    timed("search('casing cg3m', part=...)",
+          lambda: history.search("casing cg3m", part="Casing, Pump"))
+    timed(f"search('note {sample.id - 1}')", lambda: history.search(f"note {sample.id - 1}"))
+    coded = history.get(args.codes // 2)
+    timed("existing_code(spec_hash)", lambda: [history.existing_code(coded.spec_hash)], repeat=1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Latency of reserving the next free item codes of a prefix.
+
+Imports a synthetic ``--rows`` item master (every third number
+of prefixes 4000 to 4099 taken; reused when present) and times reserving ``--count``
+codes after the highest one and from the gaps, in a fresh item history, for
+a usual prefix and for one holding every code.
+
+Run with::
+
+    python benchmarks/bench_item_codes.py --rows 3000000 --count 1000 --dir /tmp/bench_item_codes
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.history_store import ItemHistory
+from src.utils.item_codes import allocate
+from src.utils.item_master import import_export, open_index
+
+
+def write_export(path: Path, rows: int) -> None:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Item", "Description"])
+        for n in range(rows):
+            # 100 prefixes 4000-4099, every third number of each taken
+            writer.writerow([f"40{n % 100:02d}{n // 100 * 3:06d}", f"*ITEM {n}"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--dir", type=Path, default=Path("/tmp/bench_item_codes"))
+    args = parser.parse_args(argv)
+
+    args.dir.mkdir(parents=True, exist_ok=True)
+    if not (args.dir / "index" / "manifest.json").exists():
+        write_export(args.dir / "export.csv", args.rows)
+        import_export(args.dir / "export.csv", args.dir / "index")
+    index = open_index(args.dir / "index")
+    history_path = args.dir / "items.db"
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{history_path}{suffix}").unlink(missing_ok=True)
+    history = ItemHistory(history_path)
+    print(f"{len(index)} codes in the item master")
+
+    # A usual prefix, then one holding the whole item master
+    for prefix in ("4017", "40"):
+        print(f"prefix {prefix}: {len(index.codes_with_prefix(prefix))} codes")
+        for label, fill_gaps in (("after the highest", False), ("from the gaps", True)):
+            for run in range(3):
+                start = time.perf_counter()
+                codes = allocate(prefix, args.count, history=history, index=index, fill_gaps=fill_gaps)
+                seconds = time.perf_counter() - start
+                print(f"  {args.count} codes {label} (run {run + 1}): {seconds * 1e3:7.2f} ms "
+                      f"[{codes[0]} .. {codes[-1]}]")
+
+
+if __name__ == "__main__":
+    main()
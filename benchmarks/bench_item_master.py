@@ -0,0 +1,74 @@
+"""Import time and lookup latency of the item-master index.
+
+Writes a synthetic ``--rows`` item-master export (reused when present),
+imports it, applies a 1% delta and times the code and description checks
+of the memory-mapped index.
+
+Run with::
+
+    python benchmarks/bench_item_master.py --rows 3000000 --dir /tmp/bench_item_master
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.item_master import import_export, open_index
+
+
+def description(n: int) -> str:
+    return f"*CASING, PUMP - HPX - {n % 40}HPX{n % 17}A - ASTM A351_ CG3M - NOTE {n}"
+
+
+def write_export(path: Path, rows: int, start: int = 0, day: int = 1, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Item", "Description", "Last Update Date", "UOM", "Item Status"])
+        for n in range(start, start + rows):
+            writer.writerow([f"{4_000_000_000 + 3 * n}", description(n),
+                             f"2024-{rng.randint(1, 6):02d}-{day:02d} 10:00:00", "EA", "Active"])
+
+
+def timed(label: str, fn, repeat: int = 20_000) -> None:
+    seconds = timeit.timeit(fn, number=repeat) / repeat
+    print(f"{label:<32} {seconds * 1e6:7.2f} us")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--dir", type=Path, default=Path("/tmp/bench_item_master"))
+    args = parser.parse_args(argv)
+
+    args.dir.mkdir(parents=True, exist_ok=True)
+    export, delta = args.dir / "export.csv", args.dir / "delta.csv"
+    if not export.exists():
+        write_export(export, args.rows)
+    write_export(delta, args.rows // 100, start=args.rows, day=28)
+
+    for label, path, is_delta in (("full import", export, False), ("delta import", delta, True)):
+        start = time.perf_counter()
+        result = import_export(path, args.dir / "index", delta=is_delta)
+        seconds = time.perf_counter() - start
+        print(f"{label}: {result.rows} rows in {seconds:.1f} s -> {result.codes} codes")
+
+    index = open_index(args.dir / "index")
+    size = sum(p.stat().st_size for p in (args.dir / "index").rglob("*.bin"))
+    print(f"index files: {size / 2**20:.1f} MiB")
+    timed("has_code (present)", lambda: index.has_code(f"{4_000_000_000 + 3 * 12345}"))
+    timed("has_code (absent)", lambda: index.has_code(f"{4_000_000_000 + 3 * 12345 + 1}"))
+    timed("code_for_description (present)", lambda: index.code_for_description(description(12345)))
+    timed("code_for_description (absent)", lambda: index.code_for_description("*NOT AN ITEM"))
+
+
+if __name__ == "__main__":
+    main()
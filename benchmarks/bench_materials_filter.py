@@ -0,0 +1,74 @@
+"""Memory footprint and filter latency of the materials table layouts.
+
+The catalog materials table is repeated ``--scale`` times and stored as:
+
+* ``object``: Python strings, as the workbook was originally loaded;
+* ``str``: the pandas string dtype;
+* ``category``: the categorical key columns used by the catalog loader.
+
+For each layout the script reports the deep memory usage of the three key
+columns and the time of a ``(type, prefix, name)`` equality filter — string
+masks for the first two, :func:`filter_materials` for the categoricals.
+
+Run with::
+
+    python benchmarks/bench_materials_filter.py --scale 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+
+from src.utils.catalog import CATEGORICAL_COLUMNS, build_catalog
+from src.utils.materials_index import filter_materials
+
+KEYS = CATEGORICAL_COLUMNS["materials"]
+
+
+def string_filter(df, mtype, mprefix, mname):
+    return df[
+        (df["Material Type"] == mtype)
+        & (df["Prefix"] == mprefix)
+        & (df["Name"] == mname)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    materials = build_catalog().table("materials")
+    scaled = pd.concat([materials] * args.scale, ignore_index=True)
+    query = ("ASTM", "A351_", "CG3M")
+
+    layouts = [
+        ("object", scaled.astype({c: object for c in KEYS}), string_filter),
+        ("str", scaled.astype({c: "str" for c in KEYS}), string_filter),
+        ("category", scaled, filter_materials),
+    ]
+    print(f"{len(scaled):,} rows ({args.scale}x the catalog materials table)")
+    expected = None
+    for label, df, fn in layouts:
+        result = fn(df, *query)
+        if expected is None:
+            expected = result.index.tolist()
+        assert result.index.tolist() == expected, label
+        memory = df[KEYS].memory_usage(deep=True, index=False).sum()
+        seconds = timeit.timeit(lambda: fn(df, *query), number=args.repeat)
+        print(
+            f"{label:<10} {memory / 1024:10.1f} KiB"
+            f" {seconds / args.repeat * 1e3:10.3f} ms per filter"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Wall time of a Streamlit rerun with each part selected.
+
+The app is driven headless with :class:`streamlit.testing.v1.AppTest`: the
+part is selected once, then the script is rerun ``--reruns`` times with no
+input change and the mean time per rerun is reported.  This is the cost of
+every widget interaction while the part is on screen.
+
+Pass ``--app`` to time another checkout of the app, e.g. a ``git worktree``
+of an older revision::
+
+    python benchmarks/bench_part_rerun.py --reruns 20
+    python benchmarks/bench_part_rerun.py --app ../before/Oracle_app.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+logging.disable(logging.WARNING)
+
+from streamlit.testing.v1 import AppTest
+
+
+def categories(app: Path) -> dict:
+    """The ``categories`` table of the app, read without running it."""
+    for node in ast.parse(app.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", "") == "categories":
+            return ast.literal_eval(node.value)
+    raise ValueError(f"No categories table in {app}")
+
+
+def time_part(app: Path, category: str, part: str, reruns: int) -> float:
+    at = AppTest.from_file(str(app), default_timeout=120)
+    at.run()
+    at.selectbox[0].select(category).run()
+    at.selectbox(key="selected_part").select(part).run()
+    if at.exception:
+        raise RuntimeError(f"{part}: {at.exception[0].message}")
+    start = time.perf_counter()
+    for _ in range(reruns):
+        at.run()
+    return (time.perf_counter() - start) / reruns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", type=Path, default=ROOT / "Oracle_app.py")
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--parts", nargs="*", help="only these parts")
+    args = parser.parse_args(argv)
+
+    app = args.app.resolve()
+    # The app loads its assets and modules relative to its own folder
+    os.chdir(app.parent)
+    sys.path.insert(0, str(app.parent))
+
+    times = []
+    for category, parts in categories(app).items():
+        for part in parts:
+            if args.parts and part not in args.parts:
+                continue
+            seconds = time_part(app, category, part, args.reruns)
+            times.append(seconds)
+            print(f"{part:<36} {seconds * 1e3:8.1f} ms per rerun")
+    if times:
+        print(f"{'mean':<36} {sum(times) / len(times) * 1e3:8.1f} ms per rerun")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Cost of the quality rules, per item and for a table of specs.
+
+The rules of ``assets/quality_rules.json`` are compiled once; the script
+then times :meth:`~src.utils.quality_rules.PartRules.evaluate` on random
+specs of a few parts, and
+:meth:`~src.utils.quality_rules.PartRules.evaluate_frame` on a table of
+``--rows`` random specs of the same parts.
+
+Run with::
+
+    python benchmarks/bench_quality_rules.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+
+from src.engine.common import SERVICE_FLAGS
+from src.utils.quality_rules import default_rules
+
+PARTS = ("Impeller, Pump", "Shaft, Pump", "Impeller casting", "Stud, Threaded")
+MATERIALS = (
+    ("ASTM", "A351_", "CG3M"),
+    ("ASTM", "A351_", "CF3M"),
+    ("ASTM", "A747_", "Tp. CB7Cu-1 (H1150 DBL)"),
+    ("ASTM", "A276_", "Tp. 410 HB 300-350"),
+    ("EN", "", ""),
+)
+
+
+def random_specs(rows: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    specs = []
+    for _ in range(rows):
+        mtype, mprefix, mname = rng.choice(MATERIALS)
+        spec = {"material_type": mtype, "material_prefix": mprefix, "material_name": mname,
+                "model": rng.choice(("QL", "HPX", "DMX")),
+                "impeller_pump_type": rng.choice(("DMX", "Other"))}
+        spec.update({name: rng.random() < 0.2 for name in SERVICE_FLAGS})
+        specs.append(spec)
+    return specs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rules = default_rules()
+    specs = random_specs(args.rows)
+    frame = pd.DataFrame(specs)
+    print(f"{'part':<24} {'per item':>12} {'frame':>12} {'per row':>12}")
+    for part in PARTS:
+        part_rules = rules.part(part)
+        start = time.perf_counter()
+        for spec in specs:
+            part_rules.evaluate(spec)
+        per_item = (time.perf_counter() - start) / len(specs)
+
+        start = time.perf_counter()
+        part_rules.evaluate_frame(frame)
+        whole = time.perf_counter() - start
+        print(f"{part:<24} {per_item * 1e6:9.2f} us {whole * 1e3:9.1f} ms "
+              f"{whole / len(specs) * 1e6:9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
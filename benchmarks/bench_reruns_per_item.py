@@ -0,0 +1,94 @@
+"""Script reruns needed to generate one item, per part and input mode.
+
+A user fills every input of the part once, presses "Generate Output", then
+types the item code and presses a DataLoad button.  Streamlit reruns the
+whole script for every widget change outside a form; widgets inside a form
+only rerun on submit, and widgets inside a fragment rerun the fragment
+alone.  The script opens each part headless with
+:class:`streamlit.testing.v1.AppTest`, counts the input widgets of its
+input column that are not in a form, and reports:
+
+* ``before``: every interaction is a full rerun (no form, no fragments);
+* ``widgets``: default input mode, DataLoad column in a fragment;
+* ``form``: form input mode, DataLoad column in a fragment.  The selects
+  that fill the options of other inputs stay above the form
+  (:func:`src.utils.layout.option_inputs`) and rerun once each; the rest of
+  the inputs are sent with the one submit.
+
+Run with::
+
+    python benchmarks/bench_reruns_per_item.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+logging.disable(logging.WARNING)
+
+from streamlit.testing.v1 import AppTest
+
+from src.utils.layout import FORM_INPUT_KEY
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_part_rerun import categories  # noqa: E402
+
+APP = ROOT / "Oracle_app.py"
+INPUTS = ("selectbox", "multiselect", "text_input", "text_area", "number_input",
+          "checkbox", "toggle", "radio")
+# Item code and DataLoad button
+DATALOAD_INTERACTIONS = 2
+
+
+def input_widgets(category: str, part: str, form: bool) -> tuple[int, int]:
+    """``(outside a form, inside a form)`` input widgets of the part."""
+    at = AppTest.from_file(str(APP), default_timeout=120)
+    at.session_state[FORM_INPUT_KEY] = form
+    at.run()
+    at.selectbox[0].select(category).run()
+    at.selectbox(key="selected_part").select(part).run()
+    column = next(col for col in at.columns
+                  if any(b.label == "Generate Output" for b in col.button))
+    widgets = [w for kind in INPUTS for w in getattr(column, kind)]
+    in_form = sum(1 for w in widgets if w.form_id)
+    return len(widgets) - in_form, in_form
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parts", nargs="*", help="only these parts")
+    args = parser.parse_args(argv)
+    os.chdir(ROOT)
+
+    print(f"{'part':<36} {'inputs':>6} {'before':>8} {'widgets':>12} {'form':>12}")
+    totals = [0, 0, 0, 0]
+    count = 0
+    for category, parts in categories(APP).items():
+        for part in parts:
+            if args.parts and part not in args.parts:
+                continue
+            inputs, _ = input_widgets(category, part, form=False)
+            free, _ = input_widgets(category, part, form=True)
+            before = inputs + 1 + DATALOAD_INTERACTIONS
+            widgets = inputs + 1
+            form = free + 1
+            print(f"{part:<36} {inputs:>6} {before:>8} "
+                  f"{widgets:>4} +{DATALOAD_INTERACTIONS} frag {form:>4} +{DATALOAD_INTERACTIONS} frag")
+            for i, value in enumerate((inputs, before, widgets, form)):
+                totals[i] += value
+            count += 1
+    if count:
+        inputs, before, widgets, form = (t / count for t in totals)
+        print(f"{'mean':<36} {inputs:>6.1f} {before:>8.1f} "
+              f"{widgets:>4.1f} +{DATALOAD_INTERACTIONS} frag {form:>4.1f} +{DATALOAD_INTERACTIONS} frag")
+        print("full reruns per generated item; 'frag' are DataLoad fragment reruns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Latency of the type-ahead search over the catalog option lists.
+
+Times :meth:`~src.utils.search_index.SearchIndex.search` (top ``--k``) for
+a few typical queries on the SKF models, bolt sizes and materials of the
+catalog, and on ``--synthetic`` generated material labels to show how the
+index scales past the current lists.
+
+Run with::
+
+    python benchmarks/bench_search_index.py --synthetic 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import build_catalog
+from src.utils.search_index import SearchIndex
+
+QUERIES = {
+    "skf_models": ("7", "72", "6205", "nu2"),
+    "bolt_sizes": ("m", "m12", '1/2"', "unc"),
+    "materials": ("a", "cg3m", "316l", "a351 cg", "duplex"),
+}
+
+
+def synthetic_labels(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    chars = "ABCDEFGHKLMNPRSTUVWXYZ0123456789 -."
+    return [
+        f"{rng.choice(('ASTM', 'EN', 'DIN'))} A{rng.randint(100, 999)}_ "
+        + "".join(rng.choice(chars) for _ in range(rng.randint(4, 30)))
+        for _ in range(count)
+    ]
+
+
+def report(name: str, index: SearchIndex, queries, k: int, repeat: int = 200):
+    for query in queries:
+        seconds = timeit.timeit(lambda: index.search(query, k), number=repeat) / repeat
+        print(f"{name:<12} {len(index):>6} {query!r:<12} {seconds * 1e6:9.1f} us")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--synthetic", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    search = build_catalog().search
+    print(f"{'list':<12} {'size':>6} {'query':<12} {'top-k':>12}")
+    for name, queries in QUERIES.items():
+        report(name, getattr(search, name), queries, args.k)
+
+    if args.synthetic:
+        start = time.perf_counter()
+        index = SearchIndex(synthetic_labels(args.synthetic))
+        print(f"synthetic index built in {(time.perf_counter() - start) * 1e3:.0f} ms")
+        report("synthetic", index, ("a", "astm", "a12", "a123_", "din a5"), args.k, repeat=20)
+
+
+if __name__ == "__main__":
+    main()
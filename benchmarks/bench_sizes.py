@@ -0,0 +1,58 @@
+"""Range filters and batch validation over the parsed size lists.
+
+Times building the ``sizes`` catalog section (every size label parsed),
+a range query on the bolt sizes, and validating ``--lines`` batch labels
+against the bolt sizes, compared with parsing each label.
+
+Run with::
+
+    python benchmarks/bench_sizes.py --lines 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.data import load_data
+from src.utils.sizes import CatalogSizes, parse_size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    bolts = load_data("bolts")
+    start = time.perf_counter()
+    sizes = CatalogSizes(bolts)
+    print(f"section built in {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+    table = sizes.bolt_sizes
+    seconds = timeit.timeit(lambda: table.between("M12", "M24"), number=10_000) / 10_000
+    print(f"between('M12', 'M24'): {seconds * 1e6:.2f} us")
+
+    rng = random.Random(7)
+    labels = [rng.choice(bolts["sizes"]) if rng.random() < 0.99 else "M11x1"
+              for _ in range(args.lines)]
+    start = time.perf_counter()
+    invalid = table.invalid(labels)
+    seconds = time.perf_counter() - start
+    print(f"validated {len(labels)} labels in {seconds * 1e3:.1f} ms ({len(invalid)} invalid)")
+
+    parse_size.cache_clear()
+    start = time.perf_counter()
+    for label in labels[:10_000]:
+        parse_size.__wrapped__(label)
+    seconds = (time.perf_counter() - start) / 10_000
+    print(f"parsing a label: {seconds * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Throughput of the SKF designation decoder on a bearing BOM.
+
+Builds ``--unique`` random designations from ``skf_options.json``, repeats
+them up to ``--lines`` BOM lines and reports the time to decode the list
+with a fresh decoder (every designation parsed once) and again with the
+decoder warm.
+
+Run with::
+
+    python benchmarks/bench_skf_decode.py --lines 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.data import load_data
+from src.utils.skf import OPTION_LISTS, SKF_SUFFIXES, SkfDecoder, short
+
+
+def designations(options, count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    codes = []
+    for _ in range(count):
+        parts = [rng.choice(options["models"])]
+        parts += [short(rng.choice(options[OPTION_LISTS[key]])) for key in SKF_SUFFIXES]
+        codes.append("".join(parts))
+    return codes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--unique", type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    options = load_data("skf_options")
+    unique = designations(options, args.unique)
+    bom = [unique[i % len(unique)] for i in range(args.lines)]
+
+    start = time.perf_counter()
+    decoder = SkfDecoder.from_options(options)
+    built = time.perf_counter() - start
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        decoded = decoder.decode_many(bom)
+        seconds = time.perf_counter() - start
+        print(f"{label}: {len(decoded)} lines in {seconds * 1e3:.1f} ms "
+              f"({seconds / len(decoded) * 1e6:.2f} us per line)")
+    start = time.perf_counter()
+    fresh = SkfDecoder.from_options(options)
+    for code in unique:
+        fresh.decode(code)
+    seconds = time.perf_counter() - start
+    print(f"tries built in {built * 1e3:.1f} ms; "
+          f"{seconds / len(unique) * 1e6:.1f} us per new designation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Cost of sorting the dropdown options at every rerun.
+
+Times :func:`~src.utils.natural_sort.sorted_options` on the longest catalog
+lists (SKF models, bolt sizes and lengths), cold (a fresh list content,
+sorted by natural key) and warm (the same content again, as on a rerun).
+
+Run with::
+
+    python benchmarks/bench_sort_options.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import build_catalog
+from src.utils.natural_sort import _sort, sorted_options
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    catalog = build_catalog()
+    lists = {
+        "skf_models": catalog.skf_options["models"],
+        "bolt_sizes": catalog.bolts["sizes"],
+        "bolt_lengths": catalog.bolts["lengths"],
+    }
+    print(f"{'list':<14} {'size':>6} {'cold':>10} {'warm':>10}")
+    for name, values in lists.items():
+        options = [""] + list(values)
+        cold = timeit.timeit(lambda: _sort(options), number=args.repeat) / args.repeat
+        sorted_options(options)
+        warm = timeit.timeit(lambda: sorted_options([""] + list(values)),
+                             number=args.repeat) / args.repeat
+        print(f"{name:<14} {len(options):>6} {cold * 1e6:8.1f} us {warm * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Peak memory and time of the catalog workbook readers.
+
+Writes a styled copy of the catalog workbook whose Materials sheet is the
+original repeated ``--scale`` times, then parses it with:
+
+* ``read_excel``: ``pd.read_excel`` on every sheet, as the catalog was
+  originally loaded;
+* ``streaming``: :func:`src.utils.catalog.read_workbook`.
+
+Run with::
+
+    python benchmarks/bench_workbook_reader.py --scale 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import Font, PatternFill
+
+from src.utils.catalog import COLUMNS, SHEETS, WORKBOOK_PATH, normalize_table, read_workbook
+
+
+def write_scaled_workbook(target: Path, scale: int) -> None:
+    with pd.ExcelFile(WORKBOOK_PATH) as xls:
+        sheets = {sheet: pd.read_excel(xls, sheet_name=sheet) for sheet in SHEETS.values()}
+    fill = PatternFill("solid", fgColor="FFF2CC")
+    font = Font(bold=True, color="1F4E78")
+    wb = Workbook(write_only=False)
+    wb.remove(wb.active)
+    for sheet, df in sheets.items():
+        ws = wb.create_sheet(sheet)
+        ws.append(list(df.columns))
+        repeat = scale if sheet == SHEETS["materials"] else 1
+        for _ in range(repeat):
+            for row in df.itertuples(index=False, name=None):
+                ws.append([None if pd.isna(v) else v for v in row])
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.fill = fill
+                cell.font = font
+    wb.save(target)
+
+
+def read_with_read_excel(path: Path):
+    with pd.ExcelFile(path) as xls:
+        return {
+            name: normalize_table(name, pd.read_excel(xls, sheet_name=sheet)[list(COLUMNS[name])])
+            for name, sheet in SHEETS.items()
+        }
+
+
+def measure(reader, path: Path):
+    start = time.perf_counter()
+    tables = reader(path)
+    elapsed = time.perf_counter() - start
+    # Separate run: tracing allocations slows the parsers down several times
+    tracemalloc.start()
+    reader(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return tables, elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalog.xlsx"
+        write_scaled_workbook(path, args.scale)
+        print(f"{path.stat().st_size / 1024:,.0f} KiB workbook, Materials x{args.scale}")
+        results = {}
+        for label, reader in [("read_excel", read_with_read_excel), ("streaming", read_workbook)]:
+            tables, elapsed, peak = measure(reader, path)
+            results[label] = tables
+            print(f"{label:<12} {elapsed:8.2f} s {peak / 2**20:10.1f} MiB peak")
+        for name in SHEETS:
+            pd.testing.assert_frame_equal(results["read_excel"][name], results["streaming"][name])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Headless item generation: ``generate_item(part, spec) -> OutputRecord``.
+
+Every part of the configurator has a generator that turns a *spec* — a
+plain mapping of the values entered in the part form — into the Oracle item
+fields.  The Streamlit UI, batch jobs and benchmarks all go through
+:func:`generate_item`, so the same spec always yields the same item.
+
+Spec keys common to most parts are ``model``, ``size``, ``feature_1``,
+``feature_2``, ``note``, ``dwg``, ``material_type``, ``material_prefix``,
+``material_name``, ``material_note`` and the quality flags in
+:data:`~src.engine.common.SERVICE_FLAGS`; missing keys take the default of
+the matching widget.  Each record carries the :func:`spec_hash` of its
+spec, equal for specs that differ only in spacing, case, key order or the
+order of the note entries.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from src.engine import castings, commercial, fasteners, machined, piping  # noqa: F401
+from src.engine.record import OutputRecord, spec_hash
+from src.engine.registry import GENERATORS
+
+__all__ = ["OutputRecord", "default_catalog", "generate_item", "part_names", "spec_hash"]
+
+
+@functools.lru_cache(maxsize=1)
+def default_catalog():
+    """Catalog of the bundled workbook, built once per process."""
+    from src.utils.catalog import build_catalog
+
+    return build_catalog()
+
+
+def part_names() -> tuple:
+    """Every part that :func:`generate_item` accepts."""
+    return tuple(GENERATORS)
+
+
+def generate_item(part: str, spec, catalog=None) -> OutputRecord:
+    """Generate the Oracle item of ``part`` described by ``spec``.
+
+    Parameters
+    ----------
+    part : str
+        Part name as listed in the UI (e.g. ``"Casing, Pump"``).
+    spec : Mapping
+        Values entered for the part; see the module docstring for the keys.
+    catalog : Catalog, optional
+        Catalog version to resolve materials against.  Defaults to the
+        catalog of the bundled workbook, built once per process.
+
+    Raises
+    ------
+    ValueError
+        If ``part`` has no generator.
+    """
+    try:
+        fn = GENERATORS[part]
+    except KeyError:
+        raise ValueError(f"Unknown part {part!r}") from None
+    if catalog is None:
+        catalog = default_catalog()
+    fields = fn(part, spec, catalog)
+    fields["Catalog version"] = catalog.label
+    return OutputRecord(part, fields, spec_hash(part, spec))
@@ -0,0 +1,255 @@
+"""Generate many items at once from a spreadsheet of specs.
+
+The input is a CSV or XLSX file (first worksheet) with one item per row: a
+``Part`` column naming the part as in the UI and one column per spec key of
+:func:`~src.engine.generate_item` (``model``, ``size``, ``material_type``,
+``hf_service`` ...).  Empty cells are left out of the spec, so the part
+falls back to the default of the matching widget; flags accept ``yes``,
+``true``, ``1`` or ``x``; numeric cells are read as text (``120``, not
+``120.0``).  Optional ``Item code`` and ``Mode`` columns are copied to the
+output for :mod:`src.utils.dataload_export`.  A filled column that the part
+never reads (a misspelt header, a key of another part) fails the row, so a
+typo never yields a default item.
+
+Rows are split into chunks and generated by a process pool.  Chunks are
+collected in submission order, so the output rows always follow the input
+rows whatever the number of workers.  Rows that cannot be generated (e.g.
+an unknown part) are reported in the ``Error`` column instead of aborting
+the batch.
+
+Run with::
+
+    python -m src.engine.batch specs.xlsx items.csv --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from src.utils.catalog import SECTIONS, WORKBOOK_PATH, build_catalog
+from src.utils.dataload_export import ITEM_CODE_COLUMN, MODE_COLUMN
+from src.utils.xlsx import XlsxReader
+
+PART_COLUMN = "Part"
+ROW_COLUMN = "Row"
+ERROR_COLUMN = "Error"
+
+DEFAULT_CHUNK_SIZE = 256
+
+# Catalog of the worker process, set by ``_init_worker``
+_catalog = None
+
+
+def _cell(value):
+    # Spec values are text, as entered in the UI; flags keep XLSX booleans
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        # Excel stores 120 as 120.0
+        return str(int(value))
+    return str(value).strip()
+
+
+class _ReadSpec(dict):
+    """Spec that records the keys the generator looks up."""
+
+    def __init__(self, spec):
+        super().__init__(spec)
+        self.read = set()
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.read.add(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+
+def _records(header, rows) -> Iterator[dict]:
+    # ``rows`` are (spreadsheet row, values): the row is numbered before
+    # empty rows are dropped, so it is the line the user has to fix
+    header = [str(h).strip() if h is not None else "" for h in header]
+    if PART_COLUMN not in header:
+        raise ValueError(f"Missing {PART_COLUMN!r} column")
+    for line, row in rows:
+        spec = {}
+        for key, value in zip(header, row):
+            value = _cell(value)
+            if key and key != ROW_COLUMN and value not in (None, ""):
+                spec[key] = value
+        if spec:
+            spec[ROW_COLUMN] = line
+            yield spec
+
+
+def _csv_rows(reader) -> Iterator[tuple]:
+    # A quoted cell may span lines: a record starts after the previous one
+    start = reader.line_num + 1
+    for row in reader:
+        yield start, row
+        start = reader.line_num + 1
+
+
+def read_specs(path) -> list[dict]:
+    """Specs of the CSV or XLSX file at ``path``, one dict per non-empty row.
+
+    Each spec holds its spreadsheet row (the header is row 1) under ``Row``.
+
+    Raises
+    ------
+    ValueError
+        If the file has no ``Part`` column or an unsupported extension.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            return list(_records(next(reader, []), _csv_rows(reader)))
+    if suffix in (".xlsx", ".xlsm"):
+        with XlsxReader(path) as book:
+            rows = book.rows(book.sheet_names[0], numbered=True)
+            return list(_records(next(rows, (0, ()))[1], rows))
+    raise ValueError(f"Unsupported spec file {path.name!r} (expected .csv or .xlsx)")
+
+
+def _init_worker(workbook):
+    global _catalog
+    _catalog = build_catalog(workbook)
+
+
+def _generate_chunk(chunk, catalog=None) -> list[dict]:
+    from src.engine import generate_item
+
+    catalog = catalog or _catalog
+    out = []
+    for row, spec in chunk:
+        spec = dict(spec)
+        spec.pop(ROW_COLUMN, None)
+        part = spec.pop(PART_COLUMN, "")
+        # Passed through to the output for the DataLoad export
+        passthrough = {k: spec.pop(k) for k in (ITEM_CODE_COLUMN, MODE_COLUMN) if k in spec}
+        try:
+            spec = _ReadSpec(spec)
+            fields = generate_item(part, spec, catalog).to_dict()
+            unused = [key for key in spec if key not in spec.read]
+            if unused:
+                raise ValueError(f"Columns not used by {part!r}: {', '.join(unused)}")
+        except Exception as exc:
+            # One bad row is reported, it never stops the batch
+            fields = {ERROR_COLUMN: f"{type(exc).__name__}: {exc}"}
+        out.append({ROW_COLUMN: row, PART_COLUMN: part, **passthrough, **fields})
+    return out
+
+
+def _chunks(specs, chunk_size):
+    numbered = [(spec.get(ROW_COLUMN, position), spec)
+                for position, spec in enumerate(specs, start=1)]
+    for start in range(0, len(numbered), chunk_size):
+        yield numbered[start:start + chunk_size]
+
+
+def generate_batch(specs, workbook=WORKBOOK_PATH, workers=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE) -> list[dict]:
+    """Generate the item of every spec, in input order.
+
+    Parameters
+    ----------
+    specs : list of dict
+        Item specs, each with a ``Part`` key (see :func:`read_specs`).
+    workbook : path, optional
+        Catalog workbook the items are resolved against.
+    workers : int, optional
+        Size of the process pool; defaults to the CPU count.  With ``1`` the
+        batch runs in this process.
+    chunk_size : int, optional
+        Rows handed to a worker at a time.
+
+    Returns
+    -------
+    list of dict
+        One row per spec: ``Row`` (the spreadsheet row of a spec of
+        :func:`read_specs`, else the 1-based position in ``specs``),
+        ``Part`` and the item fields, or an ``Error`` message.
+    """
+    workers = workers or os.cpu_count() or 1
+    catalog = build_catalog(workbook)
+    # Build the snapshot once here, so workers only read it
+    catalog.preload(SECTIONS)
+    chunks = _chunks(specs, chunk_size)
+    if workers == 1 or len(specs) <= chunk_size:
+        results = (_generate_chunk(chunk, catalog) for chunk in chunks)
+        return [row for rows in results for row in rows]
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(workbook,)) as pool:
+        return [row for rows in pool.map(_generate_chunk, chunks) for row in rows]
+
+
+def _columns(rows) -> list[str]:
+    columns = {ROW_COLUMN: None, PART_COLUMN: None}
+    for key in (ITEM_CODE_COLUMN, MODE_COLUMN):
+        if any(key in row for row in rows):
+            columns[key] = None
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    if ERROR_COLUMN in columns:
+        del columns[ERROR_COLUMN]
+        columns[ERROR_COLUMN] = None
+    return list(columns)
+
+
+def _text(value):
+    if isinstance(value, list):
+        return "\n".join(value)
+    return value
+
+
+def write_items(rows, path) -> None:
+    """Write generated rows to a CSV or XLSX file, one column per field."""
+    path = Path(path)
+    columns = _columns(rows)
+    if path.suffix.lower() == ".xlsx":
+        import pandas as pd
+
+        frame = pd.DataFrame([{k: _text(v) for k, v in row.items()} for row in rows],
+                             columns=columns)
+        frame.to_excel(path, index=False)
+        return
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval="")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: _text(v) for k, v in row.items()})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate Oracle items from a CSV/XLSX file of item specs."
+    )
+    parser.add_argument("specs", type=Path, help="input .csv or .xlsx, one item per row")
+    parser.add_argument("out", type=Path, help="output .csv or .xlsx")
+    parser.add_argument("--workbook", type=Path, default=WORKBOOK_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    specs = read_specs(args.specs)
+    rows = generate_batch(specs, args.workbook, args.workers, args.chunk_size)
+    write_items(rows, args.out)
+    errors = sum(1 for row in rows if ERROR_COLUMN in row)
+    print(f"{len(rows) - errors} items written to {args.out}, {errors} errors.")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Generators of the "Casting" category."""
+
+from __future__ import annotations
+
+from src.engine.common import material_keys, quality
+from src.engine.registry import generator
+from src.utils.materials_index import casting_suffix
+
+CASTINGS = (
+    "Casing cover casting",
+    "Casing casting",
+    "Bearing housing casting",
+    "Impeller casting",
+    "Impeller nut casting",
+    "Shaft casting",
+    "Throttling bush casting",
+    "Pump bowl casting",
+    "Bearing bracket casting",
+    "Discharge elbow casting",
+    "Bearing cover casting",
+    "Diffuser casting",
+    "Inducer casting",
+    "Wear plate casting",
+    "Shaft wear sleeve casting",
+)
+
+# Castings not in contact with the pumped fluid: no service flags
+DRY_CASTINGS = ("Bearing housing casting", "Bearing bracket casting", "Bearing cover casting")
+
+HYDRAULIC_CASTINGS = (
+    "Casing cover casting", "Casing casting", "Impeller casting",
+    "Pump bowl casting", "Diffuser casting", "Inducer casting", "Wear plate casting",
+)
+
+
+@generator(*CASTINGS)
+def casting(part, spec, catalog):
+    material_type, prefix, name = material_keys(spec)
+
+    mat_row = catalog.materials.row(material_type, prefix, name)
+    casting_code = casting_suffix(mat_row.casting_code if mat_row else None)
+    fpd_material_code = mat_row.fpd_code if mat_row else "NA"
+
+    mods = [spec.get(f"pattern_mod_{i}", "") for i in range(1, 6)]
+    pattern_full = "/".join(m for m in mods if m.strip())
+
+    parts = [f"*{part.upper()}"]
+    if spec.get("base_pattern"):
+        parts.append(f"BASE PATTERN: {spec['base_pattern']}")
+    if pattern_full:
+        parts.append(f"MODS: {pattern_full}")
+    if spec.get("note"):
+        parts.append(spec["note"])
+    parts.append(f"{prefix} {name}".strip())
+    if spec.get("material_note"):
+        parts.append(spec["material_note"])
+
+    result = quality(part, spec, catalog)
+
+    return {
+        "Item": "7" + casting_code,
+        "Description": ", ".join(parts) + " " + result.tag_text,
+        "Identificativo": part,
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 7",
+        "Catalog": "FUSIONI",
+        "Casting drawing": spec.get("casting_drawing", ""),
+        "Pattern item": pattern_full,
+        "Material": f"{prefix} {name}",
+        "FPD Material Code": fpd_material_code,
+        "Template": "FPD_BUY_CASTING",
+        "ERP L1": "10_CASTING",
+        "ERP L2": "",
+        "To Supplier": "",
+        "Quality": result.text,
+    }
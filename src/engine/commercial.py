@@ -0,0 +1,185 @@
+"""Generators of the "Commercial Parts" category."""
+
+from __future__ import annotations
+
+from src.engine.common import quality, selected_material
+from src.engine.registry import generator
+from src.utils.constants import spiral_filler_colors, spiral_ratings, spiral_winding_colors
+from src.utils.skf import SKF_SUFFIXES
+
+
+def _dimensions(spec) -> str:
+    od, id_, width = spec.get("od", ""), spec.get("id", ""), spec.get("width", "")
+    return " - ".join([
+        f"OD {od}" if od else "",
+        f"ID {id_}" if id_ else "",
+        f"W {width}" if width else "",
+    ]).strip(" -")
+
+
+@generator("Bearing, Hydrostatic/Hydrodynamic")
+def hydro_bearing(part, spec, catalog):
+    materiale, codice_fpd = selected_material(spec, catalog)
+    descr_parts = [
+        "BEARING, HYDROSTATIC/HYDRODYNAMIC",
+        _dimensions(spec),
+        spec.get("note", ""),
+        materiale,
+        spec.get("material_note", ""),
+    ]
+    return {
+        "Item": "50122…",
+        "Description": "*" + " - ".join([p for p in descr_parts if p]),
+        "Identificativo": "3010-ANTI-FRICTION BEARING",
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ALBERO",
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_BUY_1",
+        "ERP_L1": "20_TURNKEY_MACHINING",
+        "ERP_L2": "29_OTHER",
+        "To supplier": "",
+        "Quality": "",
+    }
+
+
+@generator("Bearing, Rolling")
+def rolling_bearing(part, spec, catalog):
+    skf = catalog.skf_decoder
+    model = spec.get("model", "")
+    codes = {key: skf.code(spec.get(key, "")) for key in SKF_SUFFIXES}
+    parts_no_space = [model] + [codes[key] for key in SKF_SUFFIXES]
+    parts_no_space.append(spec.get("extra_suffix", "").strip())
+    skf_full_code = "".join([p for p in parts_no_space if p]).upper()
+
+    full_desc_list = skf.describe(model, codes)
+    human_suffix = f" ({'; '.join(full_desc_list)})" if full_desc_list else ""
+
+    descr_parts = [
+        "BEARING, ROLLING",
+        skf_full_code + human_suffix,
+        _dimensions(spec),
+        spec.get("note", ""),
+    ]
+    return {
+        "Item": "50122…",
+        "Description": "*" + " - ".join([p for p in descr_parts if p]),
+        "Identificativo": "3010-ANTI-FRICTION BEARING",
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": "",
+        "Material": "COMMERCIAL BEARING",
+        "FPD material code": "NA",
+        "Template": "FPD_BUY_2",
+        "ERP_L1": "31_COMMERCIAL_BEARING",
+        "ERP_L2": "18_OTHER",
+        "To supplier": "",
+        "Quality": "",
+    }
+
+
+def _with_material(descr: str, spec, materiale: str) -> str:
+    """``descr, note, material, material note`` as used by gussets and keys."""
+    if spec.get("note"):
+        descr += f", {spec['note']}"
+    descr += f", {materiale}"
+    if spec.get("material_note"):
+        descr += f", {spec['material_note']}"
+    return "*" + descr
+
+
+@generator("Gusset, Other")
+def gusset(part, spec, catalog):
+    materiale, codice_fpd = selected_material(spec, catalog)
+    uom = spec.get("uom", "mm")
+    descr = (
+        f"GUSSET, OTHER - WIDTH: {int(spec.get('width', 0))}{uom}, "
+        f"THK: {int(spec.get('thickness', 0))}{uom}"
+    )
+    return {
+        "Item": "565G…",
+        "Description": _with_material(descr, spec, materiale),
+        "Identificativo": "GUSSETING",
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": "",
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_BUY_1",
+        "ERP_L1": "21_FABRICATION_OR_BASEPLATES",
+        "ERP_L2": "29_OTHER",
+        "To supplier": "",
+        "Quality": "",
+    }
+
+
+@generator("Key, Parallel")
+def parallel_key(part, spec, catalog):
+    materiale, codice_fpd = selected_material(spec, catalog)
+    uom = spec.get("uom", "mm")
+    descr = (
+        f"KEY, PARALLEL - WIDTH: {int(spec.get('width', 0))}{uom}, "
+        f"HEIGHT: {int(spec.get('height', 0))}{uom}, "
+        f"LENGTH: {int(spec.get('length', 0))}{uom}"
+    )
+    return {
+        "Item": "56340…",
+        "Description": _with_material(descr, spec, materiale),
+        "Identificativo": "6700-KEY",
+        "Classe ricambi": "2-3",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_BUY_1",
+        "ERP_L1": "64_HARDWARE",
+        "ERP_L2": "10_KEYS",
+        "To supplier": "",
+        "Quality": "",
+    }
+
+
+@generator("Gasket, Spiral Wound")
+def spiral_wound_gasket(part, spec, catalog):
+    winding = spec.get("winding", next(iter(spiral_winding_colors)))
+    filler = spec.get("filler", next(iter(spiral_filler_colors)))
+    color1, ral1 = spiral_winding_colors[winding]
+    color2, ral2 = spiral_filler_colors[filler]
+    pressure_label, rating_descr, stripe = spiral_ratings[
+        spec.get("rating", next(iter(spiral_ratings)))
+    ]
+
+    descr = (
+        f"*GASKET, SPIRAL WOUND - WINDING: {winding}, "
+        f"FILLER: {filler}, "
+        f"OD: {spec.get('od', '')} MM, ID: {spec.get('id', '')} MM, "
+        f"THK: {spec.get('thickness', '')} MM, "
+        f"RATING: {pressure_label} – {rating_descr}, "
+        f"COLOR CODE: {color1} {ral1} / {color2} {ral2} ({stripe})"
+    )
+    if spec.get("note"):
+        descr += f", {spec['note']}"
+
+    result = quality(part, spec, catalog)
+    descr += result.suffix
+    return {
+        "Item": "50415…",
+        "Description": descr,
+        "Identificativo": "4510-JOINT",
+        "Classe ricambi": "1-2-3",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", ""),
+        "Material": "BUY OUT NOT AVAILABLE",
+        "FPD material code": "BO-NA",
+        "Template": "FPD_BUY_1",
+        "ERP_L1": "55_GASKETS_OR_SEAL",
+        "ERP_L2": "16_SPIRAL_WOUND",
+        "To supplier": "",
+        "Quality": result.text,
+    }
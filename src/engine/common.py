@@ -0,0 +1,47 @@
+"""Helpers shared by the part generators."""
+
+from __future__ import annotations
+
+from src.utils.materials_index import material_label
+from src.utils.quality_rules import QualityResult, flag_value
+
+# Spec keys of the material chosen with the standard Type/Prefix/Name selector
+MATERIAL_KEYS = ("material_type", "material_prefix", "material_name")
+
+# Quality flags asked by the standard checkboxes
+SERVICE_FLAGS = ("hf_service", "tmt_service", "overlay", "hvof", "water", "stamicarbon")
+
+
+def flag(spec, key: str) -> bool:
+    """Boolean spec value; text such as ``"Yes"`` or ``"true"`` counts as set."""
+    return flag_value(spec.get(key, False))
+
+
+def material_keys(spec) -> tuple:
+    """``(type, prefix, name)`` of the selected material."""
+    return tuple(spec.get(key, "") for key in MATERIAL_KEYS)
+
+
+def selected_material(spec, catalog) -> tuple:
+    """Material label and FPD code, as shown by the standard selector."""
+    mtype, mprefix, mname = material_keys(spec)
+    return (
+        material_label(mtype, mprefix, mname),
+        catalog.materials.fpd_code(mtype, mprefix, mname),
+    )
+
+
+def quality(part, spec, catalog) -> QualityResult:
+    """:class:`~src.utils.quality_rules.QualityResult` of ``part`` for ``spec``.
+
+    Material rules read the classes stored on the catalog material row; the
+    materials section is only loaded for parts that have such rules.
+    """
+    rules = catalog.quality_rules.part(part)
+    flags = catalog.materials.flags(*material_keys(spec)) if rules.uses_materials else None
+    return rules.evaluate(spec, flags)
+
+
+def join_parts(head: str, values) -> str:
+    """``*HEAD - v1 - v2 ...`` skipping empty values."""
+    return "*" + " - ".join([head] + [v for v in values if v])
@@ -0,0 +1,72 @@
+"""Generators of the "Fasteners" category."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from src.engine.common import flag, join_parts, quality, selected_material
+from src.engine.registry import generator
+
+
+class Fastener(NamedTuple):
+    """Fixed fields of a catalogue fastener."""
+
+    title: str
+    item: str
+    identificativo: str
+    with_dwg: bool
+
+
+FASTENERS = {
+    "Bolt, Eye": Fastener("EYE BOLT", "55150…", "6583-EYE BOLT", True),
+    "Bolt, Hexagonal": Fastener("HEXAGONAL BOLT", "56230…", "6577-HEXAGON HEAD BOLT", False),
+    "Stud, Threaded": Fastener("THREADED STUD", "56146…", "6572-STUD", True),
+    "Nut, Hex": Fastener("HEX NUT", "56030…", "6581-HEXAGON NUT", True),
+    "Pin, Dowel": Fastener("DOWEL PIN", "56230…", "6810-DOWEL PIN", False),
+    "Screw, Cap": Fastener("CAP SCREW", "56230…", "6579-SOCKET HEAD CAP SCREW", False),
+    "Screw, Grub": Fastener("GRUB SCREW", "56310…", "6814-GRUB SCREW", False),
+}
+
+
+def _size_values(part, spec, materiale) -> list:
+    """Description values after the title, in the order the UI shows them."""
+    size, length = spec.get("size", ""), spec.get("length", "")
+    note, material_note = spec.get("note", ""), spec.get("material_note", "")
+    if part == "Nut, Hex":
+        return ["Heavy", size, note, materiale, material_note]
+    if part == "Pin, Dowel":
+        return [f"{spec.get('diameter', '')} - L={length}", note, materiale, material_note]
+    if part == "Stud, Threaded":
+        thread_type = spec.get("thread_type", "Partial")
+        return [size, length, thread_type.upper() + " THREADED" if thread_type else "",
+                note, materiale, material_note]
+    if part in ("Bolt, Hexagonal", "Screw, Cap"):
+        return [size, length, "FULL THREADED" if flag(spec, "full_thread") else "",
+                note, materiale, "ZINC PLATED" if flag(spec, "zinc_plated") else "",
+                material_note]
+    return [size, length, note, materiale, material_note]
+
+
+@generator(*FASTENERS)
+def fastener(part, spec, catalog):
+    info = FASTENERS[part]
+    materiale, codice_fpd = selected_material(spec, catalog)
+    descr = join_parts(info.title, _size_values(part, spec, materiale))
+    result = quality(part, spec, catalog)
+    descr += result.suffix
+    return {
+        "Item": info.item,
+        "Description": descr,
+        "Identificativo": info.identificativo,
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", "") if info.with_dwg else "",
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_BUY_2",
+        "ERP_L1": "60_FASTENER",
+        "ERP_L2": "74_OTHER_FAST_COMP_EYE_NUTS_LOCK_NUTS",
+        "To supplier": "",
+        "Quality": result.text,
+    }
@@ -0,0 +1,242 @@
+"""Generators of the "Machined Parts" category."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from src.engine.common import material_keys, quality, selected_material
+from src.engine.registry import generator
+from src.utils.materials_index import get_fpd_code
+
+
+class PumpPart(NamedTuple):
+    """Fixed fields of a pump part described by model, size and features."""
+
+    title: str
+    item: str
+    identificativo: str
+    classe: str
+    catalog: str
+    template: str
+    erp_l1: str
+    erp_l2: str
+    features: tuple = ("feature_1",)
+    extra: tuple = ()
+
+
+_TURNKEY = "20_TURNKEY_MACHINING"
+_FASTNER = "60_FASTNER"
+_NUTS = "74_OTHER_FAST_COMP_EYE_NUTS_LOCK_NUTS"
+
+# ``template=None``: chosen by the "Make or Buy?" spec value
+PUMP_PARTS = {
+    "Casing, Pump": PumpPart(
+        "CASING, PUMP", "40201…", "1100-CASING", "3", "CORPO", "FPD_MAKE",
+        _TURNKEY, "17_CASING", features=("feature_1", "feature_2"),
+        extra=(("[CORP-ENG-0194]", "CORP-ENG-0194 - Inspection of Flat and Raised Face Flanges G1-3"),),
+    ),
+    "Casing Cover, Pump": PumpPart(
+        "CASING COVER, PUMP", "40205…", "1221-CASING COVER", "3", "CORPO", None,
+        _TURNKEY, "17_CASING",
+    ),
+    "Diffuser, Pump": PumpPart(
+        "DIFFUSER, PUMP", "40227…", "1410-DIFFUSER", "2-3", "CORPO", None,
+        _TURNKEY, "20_IMPELLER_DIFFUSER",
+    ),
+    "Impeller, Pump": PumpPart(
+        "IMPELLER, PUMP", "40229…", "2200-IMPELLER", "2-3", "ARTVARI", "FPD_MAKE",
+        _TURNKEY, "20_IMPELLER_DIFFUSER",
+    ),
+    "Balance Bushing, Pump": PumpPart(
+        "BALANCE BUSHING, PUMP", "40226…", "6231-BALANCE DRUM BUSH", "1-2-3", "ALBERO",
+        "FPD_BUY_1", _TURNKEY, "16_BUSHING",
+    ),
+    "Balance Drum, Pump": PumpPart(
+        "BALANCE DRUM, PUMP", "40226…", "6230-BALANCE DRUM", "1-2-3", "ARTVARI",
+        "FPD_BUY_1", _TURNKEY, "16_BUSHING",
+    ),
+    "Balance Disc, Pump": PumpPart(
+        "BALANCE DISC, PUMP", "40226…", "6210-BALANCE DISC", "1-2-3", "ARTVARI",
+        "FPD_BUY_1", _TURNKEY, "30_DISK",
+    ),
+    "Neck Bush, Pump": PumpPart(
+        "NECK BUSH, PUMP", "40223…", "4132-NECK BUSH", "1-2-3", "ARTVARI",
+        "FPD_BUY_1", _TURNKEY, "16_BUSHING",
+    ),
+    "Throat Bushing, Pump": PumpPart(
+        "THROAT BUSHING, PUMP", "40223…", "1630-THROTTLING BUSH", "1-2-3", "ARTVARI",
+        "FPD_BUY_1", _TURNKEY, "16_BUSHING",
+    ),
+    "Nut, Impeller": PumpPart(
+        "NUT, IMPELLER", "40223…", "2912-IMPELLER NUT", "2-3", "ARTVARI",
+        "FPD_BUY_1", _FASTNER, _NUTS,
+    ),
+    "Nut, Shaft Sleeve": PumpPart(
+        "NUT, SHAFT SLEEVE", "40223…", "2910-SHAFT NUT", "2-3", "ARTVARI",
+        "FPD_BUY_1", _FASTNER, _NUTS,
+    ),
+    "Shaft Sleeve, Pump": PumpPart(
+        "SHAFT SLEEVE, PUMP", "40223…", "2450-SHAFT WEAR SLEEVE", "1-2-3", "ARTVARI",
+        "FPD_BUY_1", _TURNKEY, "26_SLEEVE",
+    ),
+}
+
+@generator(*PUMP_PARTS)
+def pump_part(part, spec, catalog):
+    info = PUMP_PARTS[part]
+    materiale, codice_fpd = selected_material(spec, catalog)
+    result = quality(part, spec, catalog)
+
+    values = [spec.get("model", ""), spec.get("size", "")]
+    values += [spec.get(f, "") for f in info.features]
+    values += [spec.get("note", ""), materiale, spec.get("material_note", "")]
+    descr = "*" + " - ".join([info.title] + [v for v in values if v]) + " " + result.tag_text
+
+    template = info.template
+    if template is None:
+        template = "FPD_MAKE" if spec.get("make_or_buy", "Buy") == "Make" else "FPD_BUY_1"
+    return {
+        "Item": info.item,
+        "Description": descr,
+        "Identificativo": info.identificativo,
+        "Classe ricambi": info.classe,
+        "Categories": "FASCIA ITE 4",
+        "Catalog": info.catalog,
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": template,
+        "ERP_L1": info.erp_l1,
+        "ERP_L2": info.erp_l2,
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Ring, Wear")
+def wear_ring(part, spec, catalog):
+    materiale, codice_fpd = selected_material(spec, catalog)
+    ring_type = spec.get("ring_type", "Stationary")
+    result = quality(part, spec, catalog)
+
+    descr_parts = [f"{ring_type.upper()} WEAR RING"]
+    for val in [spec.get("model", ""), spec.get("internal_diameter", ""),
+                spec.get("outer_diameter", ""), spec.get("note", ""),
+                materiale, spec.get("material_note", "")]:
+        if val:
+            descr_parts.append(val)
+    descr = "*" + " - ".join(descr_parts) + result.suffix
+
+    rotary = ring_type == "Rotary"
+    return {
+        "Item": "40224…" if rotary else "40223…",
+        "Description": descr,
+        "Identificativo": "2300-IMPELLER WEAR RING" if rotary else "1500-CASING WEAR RING",
+        "Classe ricambi": "1-2-3",
+        "Categories": "FASCIA ITE 4",
+        "Catalog": "ALBERO",
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_BUY_1",
+        "ERP_L1": "20_TURNKEY_MACHINING",
+        "ERP_L2": "24_RINGS",
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Shaft, Pump")
+def shaft(part, spec, catalog):
+    mtype, mprefix, mname = material_keys(spec)
+    model = spec.get("model", "")
+    materiale = f"{mtype} {mprefix} {mname}".strip()
+    codice_fpd = catalog.materials.fpd_code(mtype, mprefix, mname)
+
+    result = quality(part, spec, catalog)
+
+    values = [model, spec.get("size", ""), spec.get("bearing_type", ""),
+              spec.get("bearing_size", ""), spec.get("max_diameter", ""),
+              spec.get("max_length", ""), spec.get("note", ""), materiale,
+              spec.get("material_note", "")]
+    descr = "*" + " - ".join(["SHAFT, PUMP"] + [v for v in values if v]) + " " + result.tag_text
+    return {
+        "Item": "40231…",
+        "Description": descr,
+        "Identificativo": "2100-SHAFT",
+        "Classe ricambi": "2-3",
+        "Categories": "FASCIA ITE 4",
+        "Catalog": "ALBERO",
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_MAKE",
+        "ERP_L1": "20_TURNKEY_MACHINING",
+        "ERP_L2": "25_SHAFTS",
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Housing, Bearing")
+def bearing_housing(part, spec, catalog):
+    mtype, mprefix, mname = material_keys(spec)
+    brg_type = spec.get("bearing_type", "")
+    materiale = f"{mtype} {mprefix} {mname}".strip()
+    codice_fpd = catalog.materials.fpd_code(mtype, mprefix, mname)
+
+    values = [brg_type, spec.get("bearing_size", ""), spec.get("note", ""),
+              materiale, spec.get("material_note", "")]
+    result = quality(part, spec, catalog)
+    descr_parts = ["BEARING HOUSING"] + [v for v in values if v] + list(result.tags)
+    return {
+        "Item": "40217…",
+        "Description": "*" + " - ".join(descr_parts),
+        "Identificativo": "3200-BEARING HOUSING",
+        "Classe ricambi": "3",
+        "Categories": "FASCIA ITE 4",
+        "Catalog": "SUPPORTO",
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_MAKE",
+        "ERP_L1": "20_TURNKEY_MACHINING",
+        "ERP_L2": "12_BEARING_HOUSING",
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Baseplate, Pump")
+def baseplate(part, spec, catalog):
+    mtype, mprefix, mname = material_keys(spec)
+    ident = "6110-BASE PLATE"
+    material = f"{mtype} {mprefix} {mname}".strip()
+    result = quality(part, spec, catalog)
+
+    descr_parts = [
+        f"*{ident}",
+        f"{spec.get('model', '')}-{spec.get('size', '')}",
+        f"{spec.get('length', 0)}x{spec.get('width', 0)} mm",
+        f"{spec.get('weight', 0)} kg",
+        spec.get("note", ""),
+        material,
+        spec.get("material_note", ""),
+        *result.tags,
+    ]
+    return {
+        "Item": "477...",
+        "Description": " ".join([d for d in descr_parts if d]),
+        "Identificativo": ident,
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", ""),
+        "Material": material,
+        "FPD material code": get_fpd_code(catalog.materials, mtype, mprefix, mname),
+        "Template": "FPD_BUY_4",
+        "ERP L1": "21_FABRICATION_OR_BASEPLATES",
+        "ERP L2": "18_FOUNDATION_PLATE",
+        "To Supplier": spec.get("sourcing", "EUROPEAN"),
+        "Quality": list(result.lines),
+    }
@@ -0,0 +1,117 @@
+"""Generators of the "Piping" category."""
+
+from __future__ import annotations
+
+from src.engine.common import quality, selected_material
+from src.engine.registry import generator
+
+
+@generator("Flange, Pipe")
+def pipe_flange(part, spec, catalog):
+    descr = (
+        f"FLANGE, PIPE - TYPE: {spec.get('pipe_type', '')}, SIZE: {spec.get('size', '')}, "
+        f"FACE: {spec.get('face_type', '')}, CLASS: {spec.get('pressure_class', '')}, "
+        f"MATERIAL: {spec.get('material', '')}"
+    )
+    if spec.get("note"):
+        descr += f", NOTE: {spec['note']}"
+    result = quality(part, spec, catalog)
+    return {
+        "Item": "50155…",
+        "Description": "*" + descr + result.suffix,
+        "Identificativo": "1245-FLANGE",
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "",
+        "Disegno": "",
+        "Material": "NOT AVAILABLE",
+        "FPD material code": "NA",
+        "Template": "FPD_BUY_2",
+        "ERP_L1": "23_FLANGE",
+        "ERP_L2": "13_OTHER",
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Gate, Valve")
+def gate_valve(part, spec, catalog):
+    materiale, codice_fpd = selected_material(spec, catalog)
+    result = quality(part, spec, catalog)
+    descr = (
+        f"GATE VALVE - MODEL: {spec.get('model', '')}, SIZE: {spec.get('size', '')}, "
+        f"RATING: {spec.get('rating', '')}"
+    )
+    if spec.get("note"):
+        descr += f", NOTE: {spec['note']}"
+    return {
+        "Item": "50186…",
+        "Description": "*" + descr + result.suffix,
+        "Identificativo": "VALVOLA (GLOBO,SARAC,SFERA,NEEDLE,MANIF,CONTR)",
+        "Classe ricambi": "",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", ""),
+        "Material": materiale,
+        "FPD material code": codice_fpd,
+        "Template": "FPD_BUY_2",
+        "ERP_L1": "72_VALVE",
+        "ERP_L2": "18_GATE_VALVE",
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Gasket, Flat")
+def flat_gasket(part, spec, catalog):
+    unit = spec.get("unit", "mm")
+    descr = (
+        f"GASKET, FLAT - THICKNESS: {spec.get('thickness', '')}{unit.upper()}, "
+        f"MATERIAL: {spec.get('material', '')}"
+    )
+    if spec.get("note"):
+        descr += f", NOTE: {spec['note']}"
+    result = quality(part, spec, catalog)
+    return {
+        "Item": "50158…",
+        "Description": "*" + descr + result.suffix,
+        "Identificativo": "4590-GASKET",
+        "Classe ricambi": "1-2-3",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", ""),
+        "Material": spec.get("material", ""),
+        "FPD material code": "NOT AVAILABLE",
+        "Template": "FPD_BUY_2",
+        "ERP_L1": "55_GASKETS_OR_SEAL",
+        "ERP_L2": "20_OTHER",
+        "To supplier": "",
+        "Quality": result.text,
+    }
+
+
+@generator("Gasket, Ring Type Joint")
+def rtj_gasket(part, spec, catalog):
+    descr = (
+        f"GASKET, RTJ - STYLE: {spec.get('style', '')}, SIZE: {spec.get('size', '')}, "
+        f"MATERIAL: {spec.get('material', '')}"
+    )
+    if spec.get("note"):
+        descr += f", NOTE: {spec['note']}"
+    result = quality(part, spec, catalog)
+    return {
+        "Item": "50158…",
+        "Description": "*" + descr + result.suffix,
+        "Identificativo": "4595-JOINT RING",
+        "Classe ricambi": "1-2-3",
+        "Categories": "FASCIA ITE 5",
+        "Catalog": "ARTVARI",
+        "Disegno": spec.get("dwg", ""),
+        "Material": spec.get("material", ""),
+        "FPD material code": "NOT AVAILABLE",
+        "Template": "FPD_BUY_1",
+        "ERP_L1": "55_GASKETS_OR_SEAL",
+        "ERP_L2": "20_OTHER",
+        "To supplier": "",
+        "Quality": result.text,
+    }
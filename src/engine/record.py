@@ -0,0 +1,95 @@
+"""Result type of the item-generation engine."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+
+from src.utils.frozen import Frozen, deep_freeze
+
+# Separators of the entries of a free-text note ("A, B; C")
+_NOTE_SEPARATORS = re.compile(r"\s*[,;\n]\s*")
+
+
+def _canonical(key: str, value):
+    if isinstance(value, str):
+        text = " ".join(value.casefold().split())
+        if "note" in key:
+            return sorted(entry for entry in _NOTE_SEPARATORS.split(text) if entry)
+        return text
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(key, v) for v in value]
+    return value
+
+
+def canonical_spec(spec) -> dict:
+    """``spec`` with the differences that do not change the item removed.
+
+    Keys are sorted, text is case-folded with its spacing collapsed, note
+    entries are sorted and empty values (blank text, unchecked flags) are
+    dropped like missing keys.
+    """
+    canonical = {}
+    for key, value in sorted(spec.items()):
+        value = _canonical(key, value)
+        if value is None or value is False or value == "" or value == []:
+            continue
+        canonical[key] = value
+    return canonical
+
+
+def spec_hash(part: str, spec) -> int:
+    """Signed 64-bit hash of the part and its :func:`canonical_spec`.
+
+    Two specs with the same hash describe the same item.
+    """
+    payload = json.dumps([part, canonical_spec(spec)], separators=(",", ":"),
+                         ensure_ascii=False, default=str)
+    digest = hashlib.blake2b(payload.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _thaw(value):
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+class OutputRecord(Frozen):
+    """Immutable Oracle item generated for one part.
+
+    ``fields`` holds the same fields, in the same order, that the UI shows in
+    its output column and stores in ``st.session_state["output_data"]``;
+    ``spec_hash`` is the :func:`spec_hash` of the spec it was generated from.
+    """
+
+    def __init__(self, part: str, fields, spec_hash: int | None = None):
+        self._init_attrs(part=part, fields=deep_freeze(dict(fields)), spec_hash=spec_hash)
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __eq__(self, other):
+        if not isinstance(other, OutputRecord):
+            return NotImplemented
+        return self.part == other.part and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"OutputRecord({self.part!r}, {self.fields.get('Description', '')!r})"
+
+    @property
+    def description(self) -> str:
+        return self.fields.get("Description", "")
+
+    def to_dict(self) -> dict:
+        """Plain, mutable copy of the fields (e.g. for ``st.session_state``)."""
+        return {key: _thaw(value) for key, value in self.fields.items()}
@@ -0,0 +1,21 @@
+"""Part name -> generator function."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+# Part name -> ``fn(part, spec, catalog) -> dict`` of output fields
+GENERATORS: dict[str, Callable] = {}
+
+
+def generator(*parts: str):
+    """Register the decorated function as the generator of ``parts``."""
+
+    def register(fn):
+        for part in parts:
+            if part in GENERATORS:
+                raise ValueError(f"Duplicate generator for part {part!r}")
+            GENERATORS[part] = fn
+        return fn
+
+    return register
@@ -0,0 +1,114 @@
+"""Part renderers and the catalog sections each part needs.
+
+``PART_MODULES`` maps every part to the module of this package that renders
+it.  A module is imported the first time its part is selected and exposes
+``render(catalog)``; a rerun only runs the code of the selected part.
+
+``PART_SECTIONS`` maps every part to the :class:`~src.utils.catalog.Catalog`
+sections it reads; only those are loaded when the part is selected.  Parts
+missing from the table (e.g. "Gasket, Flat") need no catalog data at all.
+"""
+
+import importlib
+
+CASTINGS = (
+    "Casing cover casting",
+    "Casing casting",
+    "Bearing housing casting",
+    "Impeller casting",
+    "Impeller nut casting",
+    "Shaft casting",
+    "Throttling bush casting",
+    "Pump bowl casting",
+    "Bearing bracket casting",
+    "Discharge elbow casting",
+    "Bearing cover casting",
+    "Diffuser casting",
+    "Inducer casting",
+    "Wear plate casting",
+    "Shaft wear sleeve casting",
+)
+
+PART_MODULES = {
+    "Baseplate, Pump": "baseplate",
+    "Casing, Pump": "casing",
+    "Casing Cover, Pump": "casing_cover",
+    "Diffuser, Pump": "diffuser",
+    "Impeller, Pump": "impeller",
+    "Balance Bushing, Pump": "balance_bushing",
+    "Neck Bush, Pump": "neck_bush",
+    "Throat Bushing, Pump": "throat_bushing",
+    "Balance Drum, Pump": "balance_drum",
+    "Balance Disc, Pump": "balance_disc",
+    "Shaft, Pump": "shaft",
+    "Shaft Sleeve, Pump": "shaft_sleeve",
+    "Housing, Bearing": "bearing_housing",
+    "Ring, Wear": "wear_ring",
+    "Nut, Impeller": "impeller_nut",
+    "Nut, Shaft Sleeve": "shaft_sleeve_nut",
+    "Flange, Pipe": "pipe_flange",
+    "Gate, Valve": "gate_valve",
+    "Gasket, Flat": "flat_gasket",
+    "Gasket, Ring Type Joint": "rtj_gasket",
+    "Bolt, Eye": "eye_bolt",
+    "Bolt, Hexagonal": "hex_bolt",
+    "Nut, Hex": "hex_nut",
+    "Stud, Threaded": "threaded_stud",
+    "Screw, Cap": "cap_screw",
+    "Screw, Grub": "grub_screw",
+    "Pin, Dowel": "dowel_pin",
+    "Bearing, Hydrostatic/Hydrodynamic": "hydro_bearing",
+    "Bearing, Rolling": "rolling_bearing",
+    "Gusset, Other": "gusset",
+    "Key, Parallel": "parallel_key",
+    "Gasket, Spiral Wound": "spiral_wound_gasket",
+    # One module renders every casting
+    **dict.fromkeys(CASTINGS, "castings"),
+}
+
+
+def renderer(part):
+    """``render`` function of ``part``, importing its module on first use.
+
+    Returns ``None`` for parts without a renderer (e.g. no part selected).
+    """
+    name = PART_MODULES.get(part)
+    if name is None:
+        return None
+    return importlib.import_module(f"{__name__}.{name}").render
+
+
+_PUMP_PART = ("pumps", "materials")
+_FASTENER = ("materials", "bolts")
+
+PART_SECTIONS = {
+    "Casing, Pump": _PUMP_PART,
+    "Casing Cover, Pump": _PUMP_PART,
+    "Diffuser, Pump": _PUMP_PART,
+    "Impeller, Pump": _PUMP_PART,
+    "Balance Bushing, Pump": _PUMP_PART,
+    "Balance Drum, Pump": _PUMP_PART,
+    "Balance Disc, Pump": _PUMP_PART,
+    "Neck Bush, Pump": _PUMP_PART,
+    "Throat Bushing, Pump": _PUMP_PART,
+    "Nut, Impeller": _PUMP_PART,
+    "Nut, Shaft Sleeve": _PUMP_PART,
+    "Ring, Wear": _PUMP_PART,
+    "Shaft, Pump": _PUMP_PART,
+    "Shaft Sleeve, Pump": _PUMP_PART,
+    "Baseplate, Pump": _PUMP_PART,
+    "Housing, Bearing": ("materials",),
+    "Gate, Valve": ("materials",),
+    "Bearing, Hydrostatic/Hydrodynamic": ("materials",),
+    "Gusset, Other": ("materials",),
+    "Key, Parallel": ("materials",),
+    "Pin, Dowel": ("materials",),
+    "Bearing, Rolling": ("skf_options", "skf_decoder"),
+    "Bolt, Eye": _FASTENER,
+    "Bolt, Hexagonal": _FASTENER,
+    "Stud, Threaded": _FASTENER,
+    "Nut, Hex": _FASTENER,
+    "Screw, Cap": _FASTENER,
+    "Screw, Grub": _FASTENER,
+    **dict.fromkeys(CASTINGS, ("materials",)),
+}
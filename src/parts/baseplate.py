@@ -0,0 +1,85 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
+
+
+def render(catalog):
+    pump_catalog = catalog.pumps
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("baseplate"):
+
+        with option_inputs():
+            model = st.selectbox("Pump Type", pump_catalog.models)
+            size = st.selectbox("Pump Size", pump_catalog.sizes(model))
+
+        length = st.number_input("Length (mm)", min_value=0)
+        width = st.number_input("Width (mm)", min_value=0)
+        weight = st.number_input("Weight (kg)", min_value=0)
+
+        sourcing = st.selectbox("Sourcing", ["EUROPEAN", "INDIAN", "CHINESE"])
+
+        drawing = st.text_input("DWG/Doc")
+        note = st.text_area("Note")
+        with option_inputs():
+            mat_type = st.selectbox("Material Type", materials_index.types, key="base_mat_type")
+
+            filtered_prefix = materials_index.prefixes(mat_type)
+            mat_prefix = st.selectbox("Material Prefix", filtered_prefix, key="base_mat_prefix")
+            filtered_names = materials_index.names(mat_type, mat_prefix)
+            mat_name = st.selectbox("Material Name", filtered_names, key="base_mat_name")
+        mat_note = st.text_input("Material Note")
+
+
+        if generate_button():
+            generate_output("Baseplate, Pump", {
+                "model": model,
+                "size": size,
+                "length": length,
+                "width": width,
+                "weight": weight,
+                "sourcing": sourcing,
+                "dwg": drawing,
+                "note": note,
+                "material_type": mat_type,
+                "material_prefix": mat_prefix,
+                "material_name": mat_name,
+                "material_note": mat_note,
+            }, catalog)
+
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+
+        if "output_data" in st.session_state:
+            data = st.session_state["output_data"]
+            st.text_input("Item", value=data["Item"], key="base_out1")
+            st.text_area("Description", value=data["Description"], height=120, key="base_out2")
+            st.text_input("Identificativo", value=data["Identificativo"], key="base_out3")
+            st.text_input("Classe ricambi", value=data["Classe ricambi"], key="base_out4")
+            st.text_input("Categories", value=data["Categories"], key="base_out5")
+            st.text_input("Catalog", value=data["Catalog"], key="base_out6")
+            st.text_input("Disegno", value=data["Disegno"], key="base_out7")
+            st.text_input("Material", value=data["Material"], key="base_out8")
+            st.text_input("FPD material code", value=data["FPD material code"], key="base_out9")
+            st.text_input("Template", value=data["Template"], key="base_out10")
+            st.text_input("ERP L1", value=data["ERP L1"], key="base_out11")
+            st.text_input("ERP L2", value=data["ERP L2"], key="base_out12")
+            st.text_input("To Supplier", value=data["To Supplier"], key="base_out13")
+            st.text_area("Quality", value="\n".join(data["Quality"]), height=200, key="base_out14")
+            st.text_input("Catalog version", value=data.get("Catalog version", ""), key="base_out15")
+
+    with col2:
+        output()
+
+    with col3:
+        render_dataload_panel(
+            item_code_key="base_item_code",
+            create_btn_key="gen_dl_base",
+            update_btn_key="gen_upd_base"
+        )
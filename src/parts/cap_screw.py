@@ -0,0 +1,81 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
+from src.utils.search import select_option
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    material_types = list(materials_index.types)
+    bolt_sizes = list(catalog.bolts["sizes"])
+    bolt_lengths = list(catalog.bolts["lengths"])
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("cap_gen"):
+
+        size_cap   = select_option("Size",   bolt_sizes, catalog.search.bolt_sizes,   key="cap_size")
+        length_cap = select_option("Length", bolt_lengths, catalog.search.bolt_lengths, key="cap_length")
+
+        full_thread_cap = st.radio("Full threaded?", ["No", "Yes"], index=0, key="cap_full_thread")
+
+        note_cap = st.text_area("Note", height=80, key="cap_note")
+
+        # Materiale
+        with option_inputs():
+            mtype_cap = st.selectbox("Material Type", [""] + material_types, key="cap_mtype")
+            prefixes_cap = list(materials_index.prefixes(mtype_cap)) if mtype_cap != "MISCELLANEOUS" else []
+            mprefix_cap = st.selectbox("Material Prefix", [""] + prefixes_cap, key="cap_mprefix")
+
+            if mtype_cap == "MISCELLANEOUS":
+                names_cap = list(materials_index.names_for_type(mtype_cap))
+            else:
+                names_cap = list(materials_index.names(mtype_cap, mprefix_cap))
+            mname_cap = st.selectbox("Material Name", [""] + names_cap, key="cap_mname")
+
+        # 👉 Zinc dopo il materiale
+        zinc_plated_cap = st.radio("Zinc plated?", ["No", "Yes"], index=0, key="cap_zinc")
+        stamicarbon_cap = st.checkbox("Stamicarbon?", key="cap_stamicarbon")
+
+        material_note_cap = st.text_area("Material note", height=60, key="cap_matnote")
+
+        if generate_button("cap_gen"):
+            generate_output("Screw, Cap", {
+                "size": size_cap,
+                "length": length_cap,
+                "full_thread": full_thread_cap,
+                "note": note_cap,
+                "material_type": mtype_cap,
+                "material_prefix": mprefix_cap,
+                "material_name": mname_cap,
+                "material_note": material_note_cap,
+                "zinc_plated": zinc_plated_cap,
+                "stamicarbon": stamicarbon_cap,
+            }, catalog)
+
+
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="cap_item_code",
+            create_btn_key="gen_dl_cap",
+            update_btn_key="gen_upd_cap"
+        )
@@ -0,0 +1,83 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form, option_inputs
+
+
+def render(catalog):
+    pump_catalog = catalog.pumps
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("ccov_gen"):
+        with option_inputs():
+            model = st.selectbox("Product Type", [""] + list(pump_catalog.models), key="ccov_model")
+            size_list = list(pump_catalog.sizes(model))
+            size = st.selectbox("Pump Size", [""] + size_list, key="ccov_size")
+
+            f1_list = list(pump_catalog.features(model, "features1"))
+            feature_1 = st.selectbox("Additional Feature 1", [""] + f1_list, key="ccov_feat1") if f1_list else ""
+
+        feature_2 = ""
+
+
+        note = st.text_area("Note", height=80, key="ccov_note")
+        dwg = st.text_input("Dwg/doc number", key="ccov_dwg")
+
+        materiale, codice_fpd, material_note, mtype, mprefix, mname = select_material(
+            materials_index, "ccov"
+        )
+
+        make_or_buy = st.radio("Make or Buy?", ["Buy", "Make"], key="ccov_makebuy")
+
+        # Checkbox qualità
+        hf_service = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="ccov_hf")
+        tmt_service = st.checkbox("TMT/HVOF protection requirements?", key="ccov_tmt")
+        overlay = st.checkbox("DLD, PTAW, Laser Hardening, METCO, Ceramic Chrome?", key="ccov_overlay")
+        hvof = st.checkbox("HVOF coating?", key="ccov_hvof")
+        water = st.checkbox("Water service?", key="ccov_water")
+        stamicarbon = st.checkbox("Stamicarbon?", key="ccov_stamicarbon")
+
+        if generate_button("ccov_gen"):
+            generate_output("Casing Cover, Pump", {
+                "model": model,
+                "size": size,
+                "feature_1": feature_1,
+                "note": note,
+                "dwg": dwg,
+                "material_type": mtype,
+                "material_prefix": mprefix,
+                "material_name": mname,
+                "material_note": material_note,
+                "make_or_buy": make_or_buy,
+                "hf_service": hf_service,
+                "tmt_service": tmt_service,
+                "overlay": overlay,
+                "hvof": hvof,
+                "water": water,
+                "stamicarbon": stamicarbon,
+            }, catalog)
+
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    with col3:
+        render_dataload_panel(
+            item_code_key="ccov_item_code",
+            create_btn_key="gen_dl_ccov",
+            update_btn_key="gen_upd_ccov"
+        )
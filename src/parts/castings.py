@@ -0,0 +1,115 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    material_types = list(materials_index.types)
+    selected_part = st.session_state["selected_part"]
+    col_input, col_output, col_dataload = st.columns(3, gap="small")
+
+    # ─── COLONNA 1: INPUT ───
+    with col_input:
+        st.markdown("### 📥 Input")
+    with col_input, input_form("cast_gen"):
+        # Pump type for DMX/HPX logic
+        if selected_part == "Impeller casting":
+            imp_pump_type = st.selectbox(
+                "Impeller Pump Type", ["Other", "DMX"], key="cast_imp_pump_type"
+            )
+        if selected_part == "Bearing housing casting":
+            pump_type = st.selectbox(
+                "Pump Type", ["Other", "HPX"], key="cast_pump_type"
+            )
+        base_pattern    = st.text_input("Base pattern", key="cast_base_pattern")
+        mod1            = st.text_input("Pattern modification 1", key="cast_mod1")
+        mod2            = st.text_input("Pattern modification 2", key="cast_mod2")
+        mod3            = st.text_input("Pattern modification 3", key="cast_mod3")
+        mod4            = st.text_input("Pattern modification 4", key="cast_mod4")
+        mod5            = st.text_input("Pattern modification 5", key="cast_mod5")
+        note            = st.text_input("Note", key="cast_note")
+        casting_drawing = st.text_input("Casting drawing", key="cast_input_drawing")
+        pattern_item    = st.text_input("Pattern item", key="cast_input_pattern")
+
+        st.markdown("**Material selection**")
+        with option_inputs():
+            material_type = st.selectbox("Material Type", [""] + material_types, key="cast_mat_type")
+            prefixes      = list(materials_index.prefixes(material_type))
+            prefix        = st.selectbox("Prefix", [""] + prefixes, key="cast_prefix")
+            names         = sorted(materials_index.names(material_type, prefix))
+            name          = st.selectbox("Name", [""] + names, key="cast_name")
+        material_note = st.text_input("Material Note", key="cast_mat_note")
+
+        water_casting = False
+        hf_service_casting = False
+        stamicarbon_casting = False
+        if selected_part not in [
+            "Bearing housing casting",
+            "Bearing bracket casting",
+            "Bearing cover casting",
+        ]:
+            water_casting = st.checkbox("Water service?", key="cast_water")
+            hf_service_casting = st.checkbox(
+                "Is it an hydrofluoric acid alkylation service (lethal)?",
+                key="cast_hf"
+            )
+            stamicarbon_casting = st.checkbox("Stamicarbon?", key="cast_stamicarbon")
+
+        if generate_button("cast_gen"):
+            generate_output(selected_part, {
+                "base_pattern": base_pattern,
+                "pattern_mod_1": mod1,
+                "pattern_mod_2": mod2,
+                "pattern_mod_3": mod3,
+                "pattern_mod_4": mod4,
+                "pattern_mod_5": mod5,
+                "note": note,
+                "casting_drawing": casting_drawing,
+                "material_type": material_type,
+                "material_prefix": prefix,
+                "material_name": name,
+                "material_note": material_note,
+                "water": water_casting,
+                "hf_service": hf_service_casting,
+                "stamicarbon": stamicarbon_casting,
+                "impeller_pump_type": st.session_state.get("cast_imp_pump_type"),
+                "pump_type": st.session_state.get("cast_pump_type"),
+            }, catalog)
+
+    # ─── COLONNA 2: OUTPUT ───
+    @st.fragment
+    def output():
+        st.markdown("### 📤 Output")
+        if "output_data" in st.session_state:
+            out = st.session_state["output_data"]
+            st.text_input("Item", value=out["Item"], key="cast_out_item")
+            st.text_area("Description", value=out["Description"], height=120, key="cast_out_desc")
+            st.text_input("Identificativo", value=out["Identificativo"], key="cast_out_id")
+            st.text_input("Classe ricambi", value=out["Classe ricambi"], key="cast_out_class")
+            st.text_input("Categories", value=out["Categories"], key="cast_out_cat")
+            st.text_input("Catalog", value=out["Catalog"], key="cast_out_catalog")
+            st.text_input("Casting drawing", value=out["Casting drawing"], key="cast_out_drawing")
+            st.text_input("Pattern item", value=out["Pattern item"], key="cast_out_pattern")
+            st.text_input("Material", value=out["Material"], key="cast_out_material")
+            st.text_input("FPD Material Code", value=out["FPD Material Code"], key="cast_out_fpd")
+            st.text_input("Template", value=out["Template"], key="cast_out_template")
+            st.text_input("ERP L1", value=out["ERP L1"], key="cast_out_erp1")
+            st.text_input("ERP L2", value=out["ERP L2"], key="cast_out_erp2")
+            st.text_input("To Supplier", value=out["To Supplier"], key="cast_out_supplier")
+            st.text_area("Quality", value=out["Quality"], height=300, key="cast_out_quality")
+            st.text_input("Catalog version", value=out.get("Catalog version", ""), key="cast_out_catalog_version")
+
+    with col_output:
+        output()
+
+    # --- COLONNA 3: DATALOAD ---
+    # Stesso pannello DataLoad delle altre parti (campi casting via alias)
+    with col_dataload:
+        render_dataload_panel(
+            item_code_key="cast_dl_code",
+            create_btn_key="cast_dl_create",
+            update_btn_key="cast_dl_update"
+        )
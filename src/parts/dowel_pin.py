@@ -0,0 +1,71 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+from src.utils.constants import (
+    dowel_diameters_in,
+    dowel_diameters_mm,
+    dowel_lengths_in,
+    dowel_lengths_mm,
+)
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("pin_gen"):
+
+        # Unisco mm + inch nelle tendine
+        diam_list = [""] + dowel_diameters_mm + dowel_diameters_in
+        len_list  = [""] + dowel_lengths_mm + dowel_lengths_in
+
+        diameter_pin = st.selectbox("Diameter", diam_list, key="pin_diam")
+        length_pin   = st.selectbox("Length",   len_list,  key="pin_len")
+
+        note_pin = st.text_area("Note", height=80, key="pin_note")
+
+        materiale_pin, codice_fpd_pin, material_note_pin, mtype_pin, mprefix_pin, mname_pin = select_material(
+            materials_index, "pin"
+        )
+
+        stamicarbon_pin = st.checkbox("Stamicarbon?", key="pin_stamicarbon")
+
+        if generate_button("pin_gen"):
+            generate_output("Pin, Dowel", {
+                "diameter": diameter_pin,
+                "length": length_pin,
+                "note": note_pin,
+                "material_type": mtype_pin,
+                "material_prefix": mprefix_pin,
+                "material_name": mname_pin,
+                "material_note": material_note_pin,
+                "stamicarbon": stamicarbon_pin,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="pin_item_code",
+            create_btn_key="gen_dl_pin",
+            update_btn_key="gen_upd_pin"
+        )
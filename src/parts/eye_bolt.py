@@ -0,0 +1,61 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+from src.utils.search import select_option
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    bolt_sizes = list(catalog.bolts["sizes"])
+    bolt_lengths = list(catalog.bolts["lengths"])
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("beye_gen"):
+        size   = select_option("Size",   bolt_sizes, catalog.search.bolt_sizes,   key="beye_size")
+        length = select_option("Length", bolt_lengths, catalog.search.bolt_lengths, key="beye_length")
+
+        note = st.text_area("Note", height=80, key="beye_note")
+        materiale, codice_fpd, material_note_beye, mtype_beye, mprefix_beye, mname_beye = select_material(
+            materials_index, "beye"
+        )
+        dwg = st.text_input("Dwg/doc number", key="beye_dwg")
+
+        if generate_button("beye_gen"):
+            generate_output("Bolt, Eye", {
+                "size": size,
+                "length": length,
+                "note": note,
+                "dwg": dwg,
+                "material_type": mtype_beye,
+                "material_prefix": mprefix_beye,
+                "material_name": mname_beye,
+                "material_note": material_note_beye,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="beye_item_code",
+            create_btn_key="gen_dl_beye",
+            update_btn_key="gen_upd_beye"
+        )
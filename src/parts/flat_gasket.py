@@ -0,0 +1,54 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    col1, col2, col3 = st.columns(3)
+
+    # COLONNA 1 – INPUT
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("gf_gen"):
+        thickness_gf = st.text_input("Thickness", key="gf_thickness")
+        unit_gf = st.selectbox("Unit of Measure", ["mm", "inch"], key="gf_unit")
+        dwg_gf = st.text_input("Dwg/doc number", key="gf_dwg")
+        material_gf = st.text_input("Material", key="gf_material")
+        note_gf = st.text_area("Note (opzionale)", height=80, key="gf_note")
+        hf_service_gf = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="gf_hf")
+        stamicarbon_gf = st.checkbox("Stamicarbon?", key="gf_stamicarbon")
+
+        if generate_button("gf_gen"):
+            generate_output("Gasket, Flat", {
+                "thickness": thickness_gf,
+                "unit": unit_gf,
+                "dwg": dwg_gf,
+                "material": material_gf,
+                "note": note_gf,
+                "hf_service": hf_service_gf,
+                "stamicarbon": stamicarbon_gf,
+            }, catalog)
+
+    # COLONNA 2 – OUTPUT
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for campo, valore in st.session_state["output_data"].items():
+                if campo in ["Description", "Quality"]:
+                    st.text_area(campo, value=valore, height=200, key=f"gf_{campo}")
+                else:
+                    st.text_input(campo, value=valore, key=f"gf_{campo}")
+
+    with col2:
+        output()
+
+    # COLONNA 3 – DATALOAD
+    with col3:
+        render_dataload_panel(
+            item_code_key="gf_item_code",
+            create_btn_key="gen_dl_gf",
+            update_btn_key="gen_upd_gf"
+        )
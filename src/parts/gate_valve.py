@@ -0,0 +1,63 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("gate_gen"):
+        model = st.text_input("Valve Model", key="gate_model")
+        size = st.text_input("Valve Size", key="gate_size")
+        rating = st.text_input("Rating/Class", key="gate_rating")
+        note = st.text_area("Note", height=80, key="gate_note")
+        dwg = st.text_input("Dwg/doc number", key="gate_dwg")
+
+        materiale, codice_fpd, _, mtype, mprefix, mname = select_material(
+            materials_index, "gate"
+        )
+
+        # Checkbox solo per HF e Stamicarbon
+        hf_service = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="gate_hf")
+        stamicarbon = st.checkbox("Stamicarbon?", key="gate_stamicarbon")
+
+        if generate_button("gate_gen"):
+            generate_output("Gate, Valve", {
+                "model": model,
+                "size": size,
+                "rating": rating,
+                "note": note,
+                "dwg": dwg,
+                "material_type": mtype,
+                "material_prefix": mprefix,
+                "material_name": mname,
+                "hf_service": hf_service,
+                "stamicarbon": stamicarbon,
+            }, catalog)
+
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # COLONNA 3: DataLoad
+    with col3:
+        render_dataload_panel(
+            item_code_key="gate_item_code",
+            create_btn_key="gen_dl_gate",
+            update_btn_key="gen_upd_gate"
+        )
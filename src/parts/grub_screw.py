@@ -0,0 +1,73 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
+from src.utils.search import select_option
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    material_types = list(materials_index.types)
+    bolt_sizes = list(catalog.bolts["sizes"])
+    bolt_lengths = list(catalog.bolts["lengths"])
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("grub_gen"):
+
+        size_grub   = select_option("Size",   bolt_sizes, catalog.search.bolt_sizes,   key="grub_size")
+        length_grub = select_option("Length", bolt_lengths, catalog.search.bolt_lengths, key="grub_length")
+
+        note_grub = st.text_area("Note", height=80, key="grub_note")
+
+        # Materiale (Type -> Prefix -> Name)
+        with option_inputs():
+            mtype_grub = st.selectbox("Material Type", [""] + material_types, key="grub_mtype")
+            prefixes_grub = list(materials_index.prefixes(mtype_grub)) if mtype_grub != "MISCELLANEOUS" else []
+            mprefix_grub = st.selectbox("Material Prefix", [""] + prefixes_grub, key="grub_mprefix")
+
+            if mtype_grub == "MISCELLANEOUS":
+                names_grub = list(materials_index.names_for_type(mtype_grub))
+            else:
+                names_grub = list(materials_index.names(mtype_grub, mprefix_grub))
+            mname_grub = st.selectbox("Material Name", [""] + names_grub, key="grub_mname")
+
+        material_note_grub = st.text_area("Material note", height=60, key="grub_matnote")
+        stamicarbon_grub = st.checkbox("Stamicarbon?", key="grub_stamicarbon")
+
+        if generate_button("grub_gen"):
+            generate_output("Screw, Grub", {
+                "size": size_grub,
+                "length": length_grub,
+                "note": note_grub,
+                "material_type": mtype_grub,
+                "material_prefix": mprefix_grub,
+                "material_name": mname_grub,
+                "material_note": material_note_grub,
+                "stamicarbon": stamicarbon_grub,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="grub_item_code",
+            create_btn_key="gen_dl_grub",
+            update_btn_key="gen_upd_grub"
+        )
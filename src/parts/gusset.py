@@ -0,0 +1,58 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    # COLONNA 1: INPUT
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("gen_gusset"):
+        width_gusset     = st.number_input("Width", min_value=0, step=1, format="%d", key="gusset_width")
+        thickness_gusset = st.number_input("Thickness", min_value=0, step=1, format="%d", key="gusset_thickness")
+        uom_gusset       = st.selectbox("Unità di misura", ["mm", "inches"], key="gusset_uom")
+        note1_gusset     = st.text_area("Note", height=80, key="gusset_note1")
+
+        materiale_gusset, codice_fpd_gusset, note2_gusset, mtype_gusset, mprefix_gusset, mname_gusset = select_material(
+            materials_index, "gusset"
+        )
+
+        if generate_button("gen_gusset"):
+            generate_output("Gusset, Other", {
+                "width": width_gusset,
+                "thickness": thickness_gusset,
+                "uom": uom_gusset,
+                "note": note1_gusset,
+                "material_type": mtype_gusset,
+                "material_prefix": mprefix_gusset,
+                "material_name": mname_gusset,
+                "material_note": note2_gusset,
+            }, catalog)
+
+    # COLONNA 2: OUTPUT
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for campo, valore in st.session_state["output_data"].items():
+                if campo == "Description":
+                    st.text_area(campo, value=valore, height=200, key=f"gusset_{campo}")
+                else:
+                    st.text_input(campo, value=valore, key=f"gusset_{campo}")
+
+    with col2:
+        output()
+
+    # COLONNA 3: DataLoad
+    with col3:
+        render_dataload_panel(
+            item_code_key="gusset_item_code",
+            create_btn_key="gen_dl_gusset",
+            update_btn_key="gen_upd_gusset"
+        )
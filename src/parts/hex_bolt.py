@@ -0,0 +1,70 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+from src.utils.search import select_option
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    bolt_sizes = list(catalog.bolts["sizes"])
+    bolt_lengths = list(catalog.bolts["lengths"])
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("bh_gen"):
+
+        size_bh   = select_option("Size",   bolt_sizes, catalog.search.bolt_sizes,   key="bh_size")
+        length_bh = select_option("Length", bolt_lengths, catalog.search.bolt_lengths, key="bh_length")
+
+        full_thread_bh = st.radio("Full threaded?", ["No", "Yes"], index=0, key="bh_full_thread")
+
+        note_bh = st.text_area("Note", height=80, key="bh_note")
+
+        materiale_bh, codice_fpd_bh, material_note_bh, mtype_bh, mprefix_bh, mname_bh = select_material(
+            materials_index, "bh"
+        )
+
+        zinc_plated_bh = st.radio("Zinc plated?", ["No", "Yes"], index=0, key="bh_zinc")
+        stamicarbon_bh = st.checkbox("Stamicarbon?", key="bh_stamicarbon")
+
+        if generate_button("bh_gen"):
+            generate_output("Bolt, Hexagonal", {
+                "size": size_bh,
+                "length": length_bh,
+                "full_thread": full_thread_bh,
+                "note": note_bh,
+                "material_type": mtype_bh,
+                "material_prefix": mprefix_bh,
+                "material_name": mname_bh,
+                "material_note": material_note_bh,
+                "zinc_plated": zinc_plated_bh,
+                "stamicarbon": stamicarbon_bh,
+            }, catalog)
+
+   
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="bh_item_code",
+            create_btn_key="gen_dl_bh",
+            update_btn_key="gen_upd_bh"
+        )
@@ -0,0 +1,70 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+from src.utils.search import select_option
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    bolt_sizes = list(catalog.bolts["sizes"])
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("nut_gen"):
+
+        size_nut = select_option("Size", bolt_sizes, catalog.search.bolt_sizes, key="nut_size")
+
+        note_nut = st.text_area("Note", height=80, key="nut_note")
+
+        materiale_nut, codice_fpd_nut, material_note_nut, mtype_nut, mprefix_nut, mname_nut = select_material(
+            materials_index, "nut"
+        )
+
+        # Disegno
+        dwg_nut = st.text_input("Dwg/doc number", key="nut_dwg")
+
+        hf_service_nut = st.checkbox(
+            "Is it an hydrofluoric acid alkylation service (lethal)?",
+            key="nut_hf",
+        )
+        stamicarbon_nut = st.checkbox("Stamicarbon?", key="nut_stamicarbon")
+
+        if generate_button("nut_gen"):
+            generate_output("Nut, Hex", {
+                "size": size_nut,
+                "note": note_nut,
+                "dwg": dwg_nut,
+                "material_type": mtype_nut,
+                "material_prefix": mprefix_nut,
+                "material_name": mname_nut,
+                "material_note": material_note_nut,
+                "hf_service": hf_service_nut,
+                "stamicarbon": stamicarbon_nut,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="nut_item_code",
+            create_btn_key="gen_dl_nut",
+            update_btn_key="gen_upd_nut"
+        )
@@ -0,0 +1,65 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("bear_gen"):
+
+        # Dimensioni
+        od_bear    = st.text_input("Outside diameter (OD)", key="bear_od")
+        id_bear    = st.text_input("Inside diameter (ID)",  key="bear_id")
+        width_bear = st.text_input("Width",                 key="bear_width")
+
+        # ex Additional Features -> Note
+        note_bear = st.text_area("Note", height=80, key="bear_note")
+
+        materiale_bear, codice_fpd_bear, material_note_bear, mtype_bear, mprefix_bear, mname_bear = select_material(
+            materials_index, "bear"
+        )
+
+        dwg_bear = st.text_input("Dwg/doc number", key="bear_dwg")
+
+        if generate_button("bear_gen"):
+            generate_output("Bearing, Hydrostatic/Hydrodynamic", {
+                "od": od_bear,
+                "id": id_bear,
+                "width": width_bear,
+                "note": note_bear,
+                "dwg": dwg_bear,
+                "material_type": mtype_bear,
+                "material_prefix": mprefix_bear,
+                "material_name": mname_bear,
+                "material_note": material_note_bear,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="bear_item_code",
+            create_btn_key="gen_dl_bear",
+            update_btn_key="gen_upd_bear"
+        )
@@ -1,29 +1,31 @@
 import streamlit as st
+from src.utils.history import generate_output
 from src.utils.materials import render_material_selector
-from src.utils.quality import assemble_quality_tags
 from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
 
 
-def render(size_df, features_df, materials_df, material_types):
+def render(catalog):
+    pump_catalog = catalog.pumps
+    materials_index = catalog.materials
     col1, col2, col3 = st.columns(3)
 
     with col1:
         st.subheader("✏️ Input")
-        model = st.selectbox("Product Type", [""] + sorted(size_df["Pump Model"].dropna().unique()), key="imp_model")
-        size_list = size_df[size_df["Pump Model"] == model]["Size"].dropna().tolist()
-        size = st.selectbox("Pump Size", [""] + size_list, key="imp_size")
+    with col1, input_form("imp_gen"):
+        with option_inputs():
+            model = st.selectbox("Product Type", [""] + list(pump_catalog.models), key="imp_model")
+            size_list = list(pump_catalog.sizes(model))
+            size = st.selectbox("Pump Size", [""] + size_list, key="imp_size")
 
-        f1_list = features_df[
-            (features_df["Pump Model"] == model) &
-            (features_df["Feature Type"] == "features1")
-        ]["Feature"].dropna().tolist()
-        feature_1 = st.selectbox("Additional Feature 1", [""] + f1_list, key="imp_feat1") if f1_list else ""
+            f1_list = list(pump_catalog.features(model, "features1"))
+            feature_1 = st.selectbox("Additional Feature 1", [""] + f1_list, key="imp_feat1") if f1_list else ""
 
         note = st.text_area("Note", height=80, key="imp_note")
         dwg = st.text_input("Dwg/doc number", key="imp_dwg")
 
         materiale, codice_fpd, material_note, mtype, mprefix, mname = render_material_selector(
-            "imp", material_types, materials_df
+            "imp", materials_index
         )
 
         hf_service = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="imp_hf")
@@ -33,45 +35,27 @@ def render(size_df, features_df, materials_df, material_types):
         water = st.checkbox("Water service?", key="imp_water")
         stamicarbon = st.checkbox("Stamicarbon?", key="imp_stamicarbon")
 
-        if st.button("Generate Output", key="imp_gen"):
-            extra = []
-            # ✔️ Qualità DE2980.001 per Impeller in 17-4 PH
-            if mprefix == "A747_" and mname == "Tp. CB7Cu-1 (H1150 DBL)":
-                extra.append(("[DE2980.001]", "DE2980.001 - Progettazione e Produzione giranti in 17-4 PH"))
-            tag_string, quality = assemble_quality_tags(
-                hf_service,
-                tmt_service,
-                overlay,
-                hvof,
-                water,
-                stamicarbon,
-                extra=extra,
-                mat_prefix=mprefix,
-                mat_name=mname,
-            )
-            descr_parts = ["IMPELLER, PUMP"]
-            for val in [model, size, feature_1, note, materiale, material_note]:
-                if val:
-                    descr_parts.append(val)
-            descr = "*" + " - ".join(descr_parts) + " " + tag_string
-            st.session_state["output_data"] = {
-                "Item": "40229…",
-                "Description": descr,
-                "Identificativo": "2200-IMPELLER",
-                "Classe ricambi": "2-3",
-                "Categories": "FASCIA ITE 4",
-                "Catalog": "ARTVARI",
-                "Disegno": dwg,
-                "Material": materiale,
-                "FPD material code": codice_fpd,
-                "Template": "FPD_MAKE",
-                "ERP_L1": "20_TURNKEY_MACHINING",
-                "ERP_L2": "20_IMPELLER_DIFFUSER",
-                "To supplier": "",
-                "Quality": quality,
-            }
+        if generate_button("imp_gen"):
+            generate_output("Impeller, Pump", {
+                "model": model,
+                "size": size,
+                "feature_1": feature_1,
+                "note": note,
+                "dwg": dwg,
+                "material_type": mtype,
+                "material_prefix": mprefix,
+                "material_name": mname,
+                "material_note": material_note,
+                "hf_service": hf_service,
+                "tmt_service": tmt_service,
+                "overlay": overlay,
+                "hvof": hvof,
+                "water": water,
+                "stamicarbon": stamicarbon,
+            }, catalog)
 
-    with col2:
+    @st.fragment
+    def output():
         st.subheader("📤 Output")
         if "output_data" in st.session_state:
             for k, v in st.session_state["output_data"].items():
@@ -80,6 +64,9 @@ def render(size_df, features_df, materials_df, material_types):
                 else:
                     st.text_input(k, value=v)
 
+    with col2:
+        output()
+
     with col3:
         render_dataload_panel(
             item_code_key="imp_item_code",
@@ -0,0 +1,62 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    # COLONNA 1: INPUT
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("gen_key"):
+        width_key   = st.number_input("Width",  min_value=0, step=1, format="%d", key="key_width")
+        height_key  = st.number_input("Height", min_value=0, step=1, format="%d", key="key_height")
+        length_key  = st.number_input("Length", min_value=0, step=1, format="%d", key="key_length")
+        uom_key     = st.selectbox("Unità di misura", ["mm", "inches"], key="key_uom")
+        note1_key   = st.text_area("Note", height=80, key="key_note1")
+        dwg_key     = st.text_input("Dwg/doc number", key="key_dwg")
+
+        materiale_key, codice_fpd_key, note2_key, mtype_key, mprefix_key, mname_key = select_material(
+            materials_index, "key"
+        )
+
+        if generate_button("gen_key"):
+            generate_output("Key, Parallel", {
+                "width": width_key,
+                "height": height_key,
+                "length": length_key,
+                "uom": uom_key,
+                "note": note1_key,
+                "dwg": dwg_key,
+                "material_type": mtype_key,
+                "material_prefix": mprefix_key,
+                "material_name": mname_key,
+                "material_note": note2_key,
+            }, catalog)
+
+    # COLONNA 2: OUTPUT
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for campo, valore in st.session_state["output_data"].items():
+                if campo == "Description":
+                    st.text_area(campo, value=valore, height=200, key=f"key_{campo}")
+                else:
+                    st.text_input(campo, value=valore, key=f"key_{campo}")
+
+    with col2:
+        output()
+
+    # COLONNA 3: DataLoad
+    with col3:
+        render_dataload_panel(
+            item_code_key="key_item_code",
+            create_btn_key="gen_dl_key",
+            update_btn_key="gen_upd_key"
+        )
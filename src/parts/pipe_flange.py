@@ -0,0 +1,57 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.constants import flange_sizes
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    col1, col2, col3 = st.columns(3)
+
+    # COLONNA 1 – INPUT
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("flange_gen"):
+        pipe_type = st.selectbox("Pipe Type", ["SW", "WN"], key="flange_type")
+        pipe_size = st.selectbox("Size", flange_sizes, key="flange_size")
+        face_type = st.selectbox("Face Type", ["RF", "FF", "RJ"], key="flange_face")
+        pressure_class = st.text_input("Class (e.g. 150 Sch)", key="flange_class")
+        material_flange = st.text_input("Material", key="flange_material")
+        note_flange = st.text_input("Additional Features (optional)", key="flange_note")
+        hf_service_flange = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="flange_hf")
+        stamicarbon_flange = st.checkbox("Stamicarbon?", key="flange_stamicarbon")
+
+        if generate_button("flange_gen"):
+            generate_output("Flange, Pipe", {
+                "pipe_type": pipe_type,
+                "size": pipe_size,
+                "face_type": face_type,
+                "pressure_class": pressure_class,
+                "material": material_flange,
+                "note": note_flange,
+                "hf_service": hf_service_flange,
+                "stamicarbon": stamicarbon_flange,
+            }, catalog)
+
+    # COLONNA 2 – OUTPUT
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for campo, valore in st.session_state["output_data"].items():
+                if campo in ["Description", "Quality"]:
+                    st.text_area(campo, value=valore, height=200, key=f"fl_{campo}")
+                else:
+                    st.text_input(campo, value=valore, key=f"fl_{campo}")
+
+    with col2:
+        output()
+
+    # COLONNA 3 – DATALOAD
+    with col3:
+        render_dataload_panel(
+            item_code_key="flange_item_code",
+            create_btn_key="gen_dl_flange",
+            update_btn_key="gen_upd_flange"
+        )
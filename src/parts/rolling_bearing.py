@@ -0,0 +1,95 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
+from src.utils.search import select_option
+
+
+def render(catalog):
+    skf_data = catalog.skf_options
+    skf_models = list(skf_data["models"])
+    skf_seals = skf_data["seals"]
+    skf_design = skf_data["design"]
+    skf_pairing = skf_data["pairing"]
+    skf_cages = skf_data["cages"]
+    skf_clearances = skf_data["clearances"]
+    skf_tolerances = skf_data["tolerances"]
+    skf_heat = skf_data["heat"]
+    skf_greases = skf_data["greases"]
+    skf_vibration = skf_data["vibration"]
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("br_gen"):
+
+        # Modello SKF base
+        with option_inputs():
+            skf_choice = select_option("SKF Model", skf_models, catalog.search.skf_models,
+                                       key="br_model", extra=("Altro...",))
+        custom_model = ""
+        if skf_choice == "Altro...":
+            custom_model = st.text_input("Inserisci modello SKF", key="br_model_custom")
+
+        # Design / pairing / sigilli ecc.
+        design_opt     = st.selectbox("Design / Contact angle", skf_design, key="br_design")
+        pairing_opt    = st.selectbox("Pairing / Preload",      skf_pairing, key="br_pairing")
+        seal_opt       = st.selectbox("Seals/Shields",          skf_seals, key="br_seal")
+        cage_opt       = st.selectbox("Cage type",              skf_cages, key="br_cage")
+        clearance_opt  = st.selectbox("Clearance",              skf_clearances, key="br_clear")
+        tolerance_opt  = st.selectbox("Tolerance class",        skf_tolerances, key="br_tol")
+        heat_opt       = st.selectbox("Heat treatment",         skf_heat, key="br_heat")
+        grease_opt     = st.selectbox("Grease / Lubricant",     skf_greases, key="br_grease")
+        vibration_opt  = st.selectbox("Vibration spec",         skf_vibration, key="br_vibration")
+
+        extra_suffix = st.text_input("Extra suffix (optional)", key="br_extra")
+
+        # Dimensioni (opzionali)
+        od_roll    = st.text_input("Outside diameter (OD)", key="br_od")
+        id_roll    = st.text_input("Inside diameter (ID)",  key="br_id")
+        width_roll = st.text_input("Width",                 key="br_width")
+
+        note_roll = st.text_area("Note", height=80, key="br_note")
+
+        if generate_button("br_gen"):
+            generate_output("Bearing, Rolling", {
+                "model": custom_model if skf_choice == "Altro..." else skf_choice,
+                "design": design_opt,
+                "pairing": pairing_opt,
+                "seal": seal_opt,
+                "cage": cage_opt,
+                "clearance": clearance_opt,
+                "tolerance": tolerance_opt,
+                "heat": heat_opt,
+                "grease": grease_opt,
+                "vibration": vibration_opt,
+                "extra_suffix": extra_suffix,
+                "od": od_roll,
+                "id": id_roll,
+                "width": width_roll,
+                "note": note_roll,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="broll_item_code",
+            create_btn_key="gen_dl_broll",
+            update_btn_key="gen_upd_broll"
+        )
@@ -0,0 +1,54 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    col1, col2, col3 = st.columns(3)
+
+    # COLONNA 1 – INPUT
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("rtj_gen"):
+        style_rtj = st.text_input("Style (e.g. R, RX, BX)", key="rtj_style")
+        size_rtj = st.text_input("Size (e.g. 2”, 3-1/16”)", key="rtj_size")
+        material_rtj = st.text_input("Material", key="rtj_material")
+        note_rtj = st.text_area("Note (opzionale)", height=80, key="rtj_note")
+        dwg_rtj = st.text_input("Dwg/doc number", key="rtj_dwg")
+        hf_service_rtj = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="rtj_hf")
+        stamicarbon_rtj = st.checkbox("Stamicarbon?", key="rtj_stamicarbon")
+
+        if generate_button("rtj_gen"):
+            generate_output("Gasket, Ring Type Joint", {
+                "style": style_rtj,
+                "size": size_rtj,
+                "material": material_rtj,
+                "note": note_rtj,
+                "dwg": dwg_rtj,
+                "hf_service": hf_service_rtj,
+                "stamicarbon": stamicarbon_rtj,
+            }, catalog)
+
+    # COLONNA 2 – OUTPUT
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for campo, valore in st.session_state["output_data"].items():
+                if campo in ["Description", "Quality"]:
+                    st.text_area(campo, value=valore, height=200, key=f"rtj_{campo}")
+                else:
+                    st.text_input(campo, value=valore, key=f"rtj_{campo}")
+
+    with col2:
+        output()
+
+    # COLONNA 3 – DATALOAD
+    with col3:
+        render_dataload_panel(
+            item_code_key="rtj_item_code",
+            create_btn_key="gen_dl_rtj",
+            update_btn_key="gen_upd_rtj"
+        )
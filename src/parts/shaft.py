@@ -0,0 +1,109 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form, option_inputs
+
+
+def render(catalog):
+    pump_catalog = catalog.pumps
+    materials_index = catalog.materials
+    material_types = list(materials_index.types)
+    col1, col2, col3 = st.columns(3)
+
+    # Mappa Brg. Sizes per type
+    brg_types = ["W", "W-TK", "EC", "ECR", "ESBR", "EKBR", "ECH", "ESH", "EKH"]
+    brg_size_options = {
+        "W": ["W040", "W050", "W070", "W090", "W091", "W091-N", "W092", "W092-N", "W105", "W105-N"],
+        "W-TK": ["W040-TK", "W050-TK", "W070-TK", "W090-TK", "W091-TK", "W091-N-TK", "W092-TK", "W092-N-TK", "W105-TK", "W105-N-TK"],
+        "EC": ["EC0", "EC1", "EC2", "EC34", "EC5", "EC6", "EC7", "EC8", "EC85", "EC9"],
+        "ECR": ["ECR0", "ECR1", "ECR2", "ECR34", "ECR5", "ECR6", "ECR7", "ECR8", "ECR85", "ECR9"],
+        "ESBR": ["ESBR0", "ESBR1", "ESBR2", "ESBR34", "ESBR5", "ESBR6", "ESBR7", "ESBR8", "ESBR85", "ESBR9"],
+        "EKBR": ["EKBR0", "EKBR1", "EKBR2", "EKBR34", "EKBR5", "EKBR6", "EKBR7", "EKBR8", "EKBR85", "EKBR9"],
+        "ECH": ["EC0-H", "EC2-H", "EC5-H", "EC6-H", "EC7-H", "EC8-H", "EC85-H", "EC9-H", "EC10-H", "EC11-H", "EC12-H", "EC15-H"],
+        "ESH": ["ES0-H", "ES2-H", "ES5-H", "ES6-H", "ES7-H", "ES8-H", "ES85-H", "ES9-H", "ES10-H", "ES11-H", "ES12-H"],
+        "EKH": ["EK0-H", "EK2-H", "EK5-H", "EK6-H", "EK7-H", "EK8-H", "EK85-H", "EK9-H", "EK10-H", "EK11-H", "EK12-H"]
+    }
+
+    # ─── COLONNA 1: INPUT ───
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("shaft_gen"):
+        with option_inputs():
+            model = st.selectbox(
+                "Product Type",
+                ["", "QL", "QLQ"] + [m for m in pump_catalog.models if m not in ["QL","QLQ"]],
+                key="shaft_model"
+            )
+            size_list = list(pump_catalog.sizes(model))
+            size = st.selectbox("Pump Size", [""] + size_list, key="shaft_size")
+
+            brg_type = st.selectbox("Bearing Type", [""] + brg_types, key="shaft_brg_type")
+            brg_size = st.selectbox("Bearing Size", [""] + brg_size_options.get(brg_type, []), key="shaft_brg_size")
+
+        max_diam = st.text_input("Max diameter (mm)", key="shaft_diam")
+        max_len  = st.text_input("Max length (mm)", key="shaft_len")
+        dwg      = st.text_input("Drawing number", key="shaft_dwg")
+        note     = st.text_area("Note", height=80, key="shaft_note")
+
+        with option_inputs():
+            mtype       = st.selectbox("Material Type", ["", "ASTM"] + [t for t in material_types if t != "ASTM"], key="shaft_mtype")
+            prefixes    = list(materials_index.prefixes(mtype))
+            mprefix     = st.selectbox(
+                "Material Prefix",
+                ["", "A322_", "A276_", "A473_"] + [p for p in prefixes if p not in ["A322_","A276_","A473_"]],
+                key="shaft_mprefix"
+            )
+            names       = list(materials_index.names(mtype, mprefix))
+            mname       = st.selectbox("Material Name", [""] + names, key="shaft_mname")
+        material_note = st.text_area("Material Note", height=60, key="shaft_matnote")
+
+        # Checkboxes qualità aggiuntive
+        overlay     = st.checkbox("DLD, PTAW, Laser Hardening, METCO, Ceramic Chrome?", key="shaft_overlay")
+        hvof        = st.checkbox("HVOF coating?", key="shaft_hvof")
+        water       = st.checkbox("Water service?", key="shaft_water")
+        stamicarbon = st.checkbox("Stamicarbon?", key="shaft_stamicarbon")
+        hf_service  = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="shaft_hf")
+
+        if generate_button("shaft_gen"):
+            generate_output("Shaft, Pump", {
+                "model": model,
+                "size": size,
+                "bearing_type": brg_type,
+                "bearing_size": brg_size,
+                "max_diameter": max_diam,
+                "max_length": max_len,
+                "dwg": dwg,
+                "note": note,
+                "material_type": mtype,
+                "material_prefix": mprefix,
+                "material_name": mname,
+                "material_note": material_note,
+                "overlay": overlay,
+                "hvof": hvof,
+                "water": water,
+                "stamicarbon": stamicarbon,
+                "hf_service": hf_service,
+            }, catalog)
+
+    # ─── COLONNA 2: OUTPUT ───
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Description", "Quality", "To supplier"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # ─── COLONNA 3: DATALOAD ───
+    with col3:
+        render_dataload_panel(
+            item_code_key="shaft_item_code",
+            create_btn_key="gen_dl_shaft",
+            update_btn_key="gen_upd_shaft"
+        )
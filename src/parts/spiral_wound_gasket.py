@@ -0,0 +1,71 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.layout import generate_button, input_form
+from src.utils.constants import (
+    spiral_filler_colors,
+    spiral_ratings,
+    spiral_winding_colors,
+)
+
+
+def render(catalog):
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("gsw_gen"):
+        winding_gsw    = st.selectbox("Winding Material", list(spiral_winding_colors), key="gsw_winding")
+        filler_gsw     = st.selectbox("Filler",            list(spiral_filler_colors),  key="gsw_filler")
+        out_dia_gsw    = st.text_input("Outer Diameter (MM)", key="gsw_out_dia")
+        in_dia_gsw     = st.text_input("Inner Diameter (MM)", key="gsw_in_dia")
+        thickness_gsw  = st.text_input("Thickness (MM)",      key="gsw_thick")
+        rating_gsw     = st.selectbox("Rating", list(spiral_ratings), key="gsw_rating")
+        dwg_gsw        = st.text_input("Dwg/doc number",       key="gsw_dwg")
+        note_gsw       = st.text_area("Note", height=80,       key="gsw_note")
+        hf_service_gsw = st.checkbox(
+            "Is it a hydrofluoric acid (HF) alkylation service?",
+            key="gsw_hf"
+        )
+        water_gsw = st.checkbox("Water service?", key="gsw_water")
+        stamicarbon_gsw = st.checkbox("Stamicarbon?", key="gsw_stamicarbon")
+
+        if generate_button("gsw_gen"):
+            generate_output("Gasket, Spiral Wound", {
+                "winding": winding_gsw,
+                "filler": filler_gsw,
+                "od": out_dia_gsw,
+                "id": in_dia_gsw,
+                "thickness": thickness_gsw,
+                "rating": rating_gsw,
+                "dwg": dwg_gsw,
+                "note": note_gsw,
+                "hf_service": hf_service_gsw,
+                "water": water_gsw,
+                "stamicarbon": stamicarbon_gsw,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            out = st.session_state["output_data"]
+            for campo, valore in out.items():
+                if campo in ["Description", "Quality"]:
+                    st.text_area(campo, value=valore, height=200, key=f"sw_{campo}")
+                else:
+                    st.text_input(campo, value=valore, key=f"sw_{campo}")
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="gsw_item_code",
+            create_btn_key="gen_dl_gsw",
+            update_btn_key="gen_upd_gsw"
+        )
@@ -0,0 +1,77 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+from src.utils.search import select_option
+
+
+def render(catalog):
+    materials_index = catalog.materials
+    bolt_sizes = list(catalog.bolts["sizes"])
+    bolt_lengths = list(catalog.bolts["lengths"])
+    col1, col2, col3 = st.columns(3)
+
+    # --------------------- COLONNA 1: INPUT ---------------------
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("stud_gen"):
+
+        size_stud   = select_option("Size",   bolt_sizes, catalog.search.bolt_sizes,   key="stud_size")
+        length_stud = select_option("Length", bolt_lengths, catalog.search.bolt_lengths, key="stud_length")
+
+        # Partial / Full threaded
+        thread_type = st.radio("Thread type", ["Partial", "Full"], index=0, key="stud_thread_type")
+
+        note_stud = st.text_area("Note", height=80, key="stud_note")
+
+        materiale_stud, codice_fpd_stud, material_note_stud, mtype_stud, mprefix_stud, mname_stud = select_material(
+            materials_index, "stud"
+        )
+
+        # Disegno
+        dwg_stud = st.text_input("Dwg/doc number", key="stud_dwg")
+
+        hf_service_stud = st.checkbox(
+            "Is it an hydrofluoric acid alkylation service (lethal)?",
+            key="stud_hf",
+        )
+        stamicarbon_stud = st.checkbox("Stamicarbon?", key="stud_stamicarbon")
+
+        if generate_button("stud_gen"):
+            generate_output("Stud, Threaded", {
+                "size": size_stud,
+                "length": length_stud,
+                "thread_type": thread_type,
+                "note": note_stud,
+                "dwg": dwg_stud,
+                "material_type": mtype_stud,
+                "material_prefix": mprefix_stud,
+                "material_name": mname_stud,
+                "material_note": material_note_stud,
+                "hf_service": hf_service_stud,
+                "stamicarbon": stamicarbon_stud,
+            }, catalog)
+
+    # --------------------- COLONNA 2: OUTPUT ---------------------
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # --------------------- COLONNA 3: DATALOAD ---------------------
+    with col3:
+        render_dataload_panel(
+            item_code_key="stud_item_code",
+            create_btn_key="gen_dl_stud",
+            update_btn_key="gen_upd_stud"
+        )
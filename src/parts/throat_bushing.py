@@ -0,0 +1,76 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form, option_inputs
+
+
+def render(catalog):
+    pump_catalog = catalog.pumps
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("thbush_gen"):
+        with option_inputs():
+            model = st.selectbox("Product Type", [""] + list(pump_catalog.models), key="thbush_model")
+            size_list = list(pump_catalog.sizes(model))
+            size = st.selectbox("Pump Size", [""] + size_list, key="thbush_size")
+
+            f1_list = list(pump_catalog.features(model, "features1"))
+            feature_1 = st.selectbox("Additional Feature 1", [""] + f1_list, key="thbush_feat1") if f1_list else ""
+
+        note = st.text_area("Note", height=80, key="thbush_note")
+        dwg = st.text_input("Dwg/doc number", key="thbush_dwg")
+
+        materiale, codice_fpd, material_note, mtype, mprefix, mname = select_material(
+            materials_index, "thbush"
+        )
+
+        hf_service = st.checkbox("Is it an hydrofluoric acid alkylation service (lethal)?", key="thbush_hf")
+        tmt_service = st.checkbox("TMT/HVOF protection requirements?", key="thbush_tmt")
+        overlay = st.checkbox("DLD, PTAW, Laser Hardening, METCO, Ceramic Chrome?", key="thbush_overlay")
+        hvof = st.checkbox("HVOF coating?", key="thbush_hvof")
+        water = st.checkbox("Water service?", key="thbush_water")
+        stamicarbon = st.checkbox("Stamicarbon?", key="thbush_stamicarbon")
+
+        if generate_button("thbush_gen"):
+            generate_output("Throat Bushing, Pump", {
+                "model": model,
+                "size": size,
+                "feature_1": feature_1,
+                "note": note,
+                "dwg": dwg,
+                "material_type": mtype,
+                "material_prefix": mprefix,
+                "material_name": mname,
+                "material_note": material_note,
+                "hf_service": hf_service,
+                "tmt_service": tmt_service,
+                "overlay": overlay,
+                "hvof": hvof,
+                "water": water,
+                "stamicarbon": stamicarbon,
+            }, catalog)
+
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    with col3:
+        render_dataload_panel(
+            item_code_key="thbush_item_code",
+            create_btn_key="gen_dl_thbush",
+            update_btn_key="gen_upd_thbush"
+        )
@@ -0,0 +1,82 @@
+import streamlit as st
+
+from src.utils.history import generate_output
+from src.utils.dataload import render_dataload_panel
+from src.utils.materials import select_material
+from src.utils.layout import generate_button, input_form
+
+
+def render(catalog):
+    pump_catalog = catalog.pumps
+    materials_index = catalog.materials
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.subheader("✏️ Input")
+    with col1, input_form("ring_gen"):
+
+        ring_type = st.selectbox("Type", ["Stationary", "Rotary"], key="ring_type")
+        model = st.selectbox("Pump Type", [""] + list(pump_catalog.models), key="ring_model")
+        int_diam = st.text_input("Internal diameter (mm)", key="ring_id")
+        out_diam = st.text_input("Outer diameter (mm)", key="ring_od")
+        note = st.text_area("Note", height=80, key="ring_note")
+        clearance = st.radio("Increased clearance?", ["No", "Yes"], horizontal=True, key="ring_clr")
+        dwg = st.text_input("Dwg/doc number", key="ring_dwg")
+
+        materiale, codice_fpd, material_note, mtype, mprefix, mname = select_material(
+            materials_index, "ring"
+        )
+
+        hf_service = st.checkbox(
+            "Is it an hydrofluoric acid alkylation service (lethal)?", key="ring_hf"
+        )
+        tmt_service = st.checkbox(
+            "TMT/HVOF protection requirements?", key="ring_tmt"
+        )
+        overlay = st.checkbox(
+            "DLD, PTAW, Laser Hardening, METCO, Ceramic Chrome?", key="ring_overlay"
+        )
+        hvof = st.checkbox("HVOF coating?", key="ring_hvof")
+        stamicarbon = st.checkbox("Stamicarbon?", key="ring_stamicarbon")
+
+        if generate_button("ring_gen"):
+            generate_output("Ring, Wear", {
+                "ring_type": ring_type,
+                "model": model,
+                "internal_diameter": int_diam,
+                "outer_diameter": out_diam,
+                "note": note,
+                "increased_clearance": clearance,
+                "dwg": dwg,
+                "material_type": mtype,
+                "material_prefix": mprefix,
+                "material_name": mname,
+                "material_note": material_note,
+                "hf_service": hf_service,
+                "tmt_service": tmt_service,
+                "overlay": overlay,
+                "hvof": hvof,
+                "stamicarbon": stamicarbon,
+            }, catalog)
+
+    # COLONNA 2: Output
+    @st.fragment
+    def output():
+        st.subheader("📤 Output")
+        if "output_data" in st.session_state:
+            for k, v in st.session_state["output_data"].items():
+                if k in ["Quality", "To supplier", "Description"]:
+                    st.text_area(k, value=v, height=200)
+                else:
+                    st.text_input(k, value=v)
+
+    with col2:
+        output()
+
+    # COLONNA 3: DataLoad
+    with col3:
+        render_dataload_panel(
+            item_code_key="ring_item_code",
+            create_btn_key="gen_dl_ring",
+            update_btn_key="gen_upd_ring"
+        )
@@ -0,0 +1,428 @@
+"""Loading of the configurator catalog workbook (``dati_config4.xlsx``).
+
+Parsing the workbook through openpyxl is by far the slowest part of a cold
+start, so the parsed sheets are also kept as a compiled Parquet snapshot (see
+:mod:`src.utils.snapshot`).  :func:`load_catalog_frames` reads the snapshot
+when it matches the workbook content and rebuilds it otherwise.
+
+:class:`Catalog` reads nothing up front: each table and each derived section
+(pump and material indexes, asset files) is loaded the first time a part
+uses it.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.data import ASSETS_DIR
+from src.utils.frozen import Frozen, deep_freeze
+
+# Catalog tables are handed out as shallow copies, which isolate the shared
+# data from callers under copy-on-write (always on from pandas 3); older
+# pandas gets real copies instead of a process-wide option.
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+WORKBOOK_PATH = Path(__file__).resolve().parents[2] / "dati_config4.xlsx"
+
+# Logical catalog table -> worksheet name in the workbook
+SHEETS = {
+    "size": "Pump Size",
+    "features": "Features",
+    "materials": "Materials",
+}
+
+# Declared column schema of every catalog table.  The streaming reader locates
+# these headers in the first row of the sheet and ignores any other column.
+COLUMNS = {
+    "size": ("Pump Model", "Size"),
+    "features": ("Pump Model", "Feature Type", "Feature"),
+    "materials": ("Material Type", "Prefix", "Name", "FPD Code", "Casting code"),
+}
+
+# Cell text treated as a missing value, matching the pd.read_excel defaults
+# the catalog was originally loaded with
+NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+
+# JSON files of the assets directory bundled into the catalog as sections
+ASSET_NAMES = ("bolts", "skf_options")
+
+# Every asset a catalog version reads: read when the version is built, so
+# all its sections come from the same files
+CATALOG_ASSETS = ASSET_NAMES + ("quality_rules",)
+
+# Columns holding a mix of text and numbers (e.g. material name ``6351`` or
+# casting code ``7003``); they are stored as text so every row has one type.
+TEXT_COLUMNS = {
+    "materials": ["Name", "FPD Code", "Casting code"],
+}
+
+# Columns identifying a row; later rows repeating a key are dropped
+UNIQUE_KEYS = {
+    "materials": ("Material Type", "Prefix", "Name"),
+}
+
+# Low-cardinality key columns stored as categoricals: each distinct string is
+# kept once and rows hold small integer codes, so equality filters compare
+# integers (see :func:`category_mask`).
+CATEGORICAL_COLUMNS = {
+    "materials": ["Material Type", "Prefix", "Name"],
+}
+
+
+def file_hash(path: Path = WORKBOOK_PATH) -> str:
+    """Return the SHA-256 hex digest of the file content."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def catalog_sources(path: Path = WORKBOOK_PATH) -> list[Path]:
+    """Files a catalog is built from: the workbook and ``assets/*.json``."""
+    return [Path(path), *sorted(ASSETS_DIR.glob("*.json"))]
+
+
+class StaleCatalogError(RuntimeError):
+    """The workbook of a catalog version has been replaced and its snapshot is gone."""
+
+
+def read_sources(path: Path = WORKBOOK_PATH) -> tuple:
+    """``(workbook hash, sources hash, assets)`` of the catalog sources.
+
+    The assets of :data:`CATALOG_ASSETS` are parsed and frozen from the same
+    bytes that are hashed, so the hash always describes the assets read.
+
+    Raises
+    ------
+    FileNotFoundError
+        If one of :data:`CATALOG_ASSETS` is missing.
+    """
+    workbook_hash = file_hash(path)
+    digest = hashlib.sha256()
+    digest.update(Path(path).name.encode())
+    digest.update(bytes.fromhex(workbook_hash))
+    assets = {}
+    for asset in sorted(ASSETS_DIR.glob("*.json")):
+        content = asset.read_bytes()
+        digest.update(asset.name.encode())
+        digest.update(hashlib.sha256(content).digest())
+        if asset.stem in CATALOG_ASSETS:
+            assets[asset.stem] = deep_freeze(json.loads(content))
+    missing = [name for name in CATALOG_ASSETS if name not in assets]
+    if missing:
+        raise FileNotFoundError(f"Missing catalog asset(s): {', '.join(missing)}")
+    return workbook_hash, digest.hexdigest(), assets
+
+
+def _to_text(value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def normalize_table(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the catalog clean-up rules to the raw sheet ``name``."""
+    for column in TEXT_COLUMNS.get(name, []):
+        if column in df.columns:
+            df[column] = df[column].map(_to_text, na_action="ignore").astype(object)
+    if name in UNIQUE_KEYS:
+        df = df.drop_duplicates(subset=list(UNIQUE_KEYS[name])).reset_index(drop=True)
+    for column in CATEGORICAL_COLUMNS.get(name, []):
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def category_mask(series: pd.Series, value) -> np.ndarray:
+    """Boolean mask of ``series == value`` for a categorical ``series``.
+
+    ``value`` is looked up once in the category table and the rows are
+    matched on their integer codes; a value that is not a category matches
+    nothing.
+    """
+    try:
+        code = series.cat.categories.get_loc(value)
+    except KeyError:
+        return np.zeros(len(series), dtype=bool)
+    return series.cat.codes.to_numpy() == code
+
+
+def read_sheet(name: str, rows) -> pd.DataFrame:
+    """Build the catalog table ``name`` from an iterator of sheet rows.
+
+    The first row is the header; only the columns declared in
+    :data:`COLUMNS` are kept, :data:`NA_VALUES` become missing and fully empty
+    rows are skipped.  Rows are consumed one at a time and duplicates of
+    :data:`UNIQUE_KEYS` are dropped as they are read, so memory is bounded by
+    the resulting table rather than by the sheet.
+    """
+    columns = COLUMNS[name]
+    header = [str(v).strip() if v is not None else "" for v in next(rows, ())]
+    missing = [c for c in columns if c not in header]
+    if missing:
+        raise ValueError(
+            f"Sheet {SHEETS[name]!r} is missing column(s): {', '.join(missing)}"
+        )
+    positions = [header.index(c) for c in columns]
+    text = [c in TEXT_COLUMNS.get(name, ()) for c in columns]
+    key_positions = [columns.index(c) for c in UNIQUE_KEYS.get(name, ())]
+    seen = set()
+    data = [[] for _ in columns]
+    for row in rows:
+        values = [row[i] if i < len(row) else None for i in positions]
+        values = [
+            None if v is None or v in NA_VALUES else _to_text(v) if is_text else v
+            for v, is_text in zip(values, text)
+        ]
+        if all(v is None for v in values):
+            continue
+        if key_positions:
+            key = tuple(values[i] for i in key_positions)
+            if key in seen:
+                continue
+            seen.add(key)
+        for column, value in zip(data, values):
+            column.append(value)
+    return normalize_table(name, pd.DataFrame(dict(zip(columns, data))))
+
+
+def read_workbook(path: Path = WORKBOOK_PATH) -> dict[str, pd.DataFrame]:
+    """Parse every catalog sheet of the workbook at ``path``.
+
+    The sheets are streamed row by row with :class:`~src.utils.xlsx.XlsxReader`
+    instead of building the openpyxl object model, so memory stays bounded by
+    the catalog tables themselves whatever the size or styling of the
+    workbook.
+    """
+    from src.utils.xlsx import XlsxReader
+
+    with XlsxReader(path) as reader:
+        return {name: read_sheet(name, reader.rows(sheet)) for name, sheet in SHEETS.items()}
+
+
+def load_catalog_frames(path: Path = WORKBOOK_PATH, snapshot_dir=None):
+    """Return ``(size_df, features_df, materials_df)`` for the workbook.
+
+    The compiled snapshot is used when its recorded content hash matches the
+    workbook; otherwise the workbook is parsed and the snapshot rebuilt.
+    """
+    from src.utils.snapshot import SNAPSHOT_DIR, ensure_snapshot
+
+    tables = ensure_snapshot(path, snapshot_dir or SNAPSHOT_DIR)
+    return tables["size"], tables["features"], tables["materials"]
+
+
+def load_catalog_table(name: str, path: Path = WORKBOOK_PATH, snapshot_dir=None,
+                       workbook_hash: str | None = None) -> pd.DataFrame:
+    """Return the single catalog table ``name`` of the workbook.
+
+    Only that table is read from the snapshot of ``workbook_hash`` (the
+    version the catalog is pinned to).  Without it, the snapshot is rebuilt
+    only if the workbook on disk still has that content.
+
+    Raises
+    ------
+    StaleCatalogError
+        If the workbook has changed and the snapshot of ``workbook_hash`` is
+        gone: the table of that version can no longer be read.
+    """
+    from src.utils.snapshot import SNAPSHOT_DIR, ensure_snapshot, has_tables, read_table
+
+    snapshot_dir = snapshot_dir or SNAPSHOT_DIR
+    current_hash = file_hash(path) if workbook_hash is None else None
+    workbook_hash = workbook_hash or current_hash
+    if has_tables(snapshot_dir, workbook_hash):
+        return read_table(name, snapshot_dir, workbook_hash)
+    if current_hash is None:
+        current_hash = file_hash(path)
+    if current_hash != workbook_hash:
+        raise StaleCatalogError(
+            f"{Path(path).name} has changed since catalog {workbook_hash[:8]} was built"
+        )
+    return ensure_snapshot(path, snapshot_dir, workbook_hash)[name]
+
+
+def _pumps_section(catalog):
+    from src.utils.pumps import PumpCatalog
+
+    return PumpCatalog.from_frames(catalog.table("size"), catalog.table("features"))
+
+
+def _materials_section(catalog):
+    from src.utils.materials_index import MaterialsIndex
+    from src.utils.quality_rules import material_classes
+
+    return MaterialsIndex.from_frame(
+        catalog.table("materials"), material_classes(catalog.asset("quality_rules"))
+    )
+
+
+def _skf_decoder_section(catalog):
+    from src.utils.skf import SkfDecoder
+
+    return SkfDecoder.from_options(catalog.skf_options)
+
+
+def _search_section(catalog):
+    from src.utils.search_index import CatalogSearch
+
+    return CatalogSearch(catalog)
+
+
+def _sizes_section(catalog):
+    from src.utils.sizes import CatalogSizes
+
+    return CatalogSizes(catalog.bolts)
+
+
+def _quality_rules_section(catalog):
+    from src.utils.quality_rules import QualityRules
+
+    return QualityRules.from_data(catalog.asset("quality_rules"))
+
+
+# Catalog section -> builder; the asset sections are the frozen JSON files
+SECTIONS = {
+    "pumps": _pumps_section,
+    "materials": _materials_section,
+    "quality_rules": _quality_rules_section,
+    "skf_decoder": _skf_decoder_section,
+    "search": _search_section,
+    "sizes": _sizes_section,
+    **{name: (lambda catalog, name=name: catalog.asset(name)) for name in ASSET_NAMES},
+}
+
+
+class Catalog(Frozen):
+    """Immutable catalog shared by all sessions of the process.
+
+    The catalog is split into the sections of :data:`SECTIONS`: ``pumps`` and
+    ``materials`` are the lookup indexes used by the widgets, ``bolts`` and
+    ``skf_options`` the frozen content of the JSON asset files,
+    ``quality_rules`` the compiled quality rules, ``skf_decoder`` the
+    tries of the SKF designations, ``search`` the type-ahead indexes and
+    ``sizes`` the parsed size lists.  A section is built on first access and kept for the lifetime of the catalog, so a
+    session only pays for the sections of the parts it actually opens.  Raw
+    tables are loaded the same way and only reachable through :meth:`table`,
+    which returns a copy-on-write view so callers can never modify the shared
+    data.
+    """
+
+    def __init__(self, load_table, version: int = 1, source_hash: str = "", assets=None):
+        self._init_attrs(
+            _load_table=load_table,
+            _assets=deep_freeze(dict(assets or {})),
+            _tables={},
+            _sections={},
+            _lock=threading.RLock(),
+            version=version,
+            source_hash=source_hash,
+        )
+
+    @property
+    def label(self) -> str:
+        """Version string shown in the footer and stored with every item."""
+        return f"v{self.version} ({self.source_hash[:8]})"
+
+    def _cached(self, cache: dict, name: str, load):
+        # Lock-free once loaded; the lock only makes concurrent first accesses
+        # build the value once.
+        try:
+            return cache[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in cache:
+                cache[name] = load()
+            return cache[name]
+
+    def table(self, name: str) -> pd.DataFrame:
+        """Return a read-only view of the catalog table ``name``."""
+        if name not in SHEETS:
+            raise KeyError(name)
+        df = self._cached(self._tables, name, lambda: self._load_table(name))
+        return df.copy(deep=not _COPY_ON_WRITE)
+
+    def asset(self, name: str):
+        """Frozen content of the asset file ``name``, as read when the version was built."""
+        return self._assets[name]
+
+    def section(self, name: str):
+        """Return the catalog section ``name``, building it on first use."""
+        return self._cached(self._sections, name, lambda: SECTIONS[name](self))
+
+    def preload(self, names) -> None:
+        """Build the sections ``names`` now (e.g. those of the selected part)."""
+        for name in names:
+            self.section(name)
+
+    @property
+    def loaded_sections(self) -> tuple:
+        return tuple(self._sections)
+
+    @property
+    def table_names(self) -> tuple:
+        return tuple(SHEETS)
+
+    @property
+    def pumps(self):
+        return self.section("pumps")
+
+    @property
+    def materials(self):
+        return self.section("materials")
+
+    @property
+    def bolts(self):
+        return self.section("bolts")
+
+    @property
+    def skf_options(self):
+        return self.section("skf_options")
+
+    @property
+    def quality_rules(self):
+        return self.section("quality_rules")
+
+    @property
+    def skf_decoder(self):
+        return self.section("skf_decoder")
+
+    @property
+    def search(self):
+        return self.section("search")
+
+    @property
+    def sizes(self):
+        return self.section("sizes")
+
+
+def build_catalog(path: Path = WORKBOOK_PATH, snapshot_dir=None,
+                  version: int = 1) -> Catalog:
+    """Create the catalog of the workbook and assets at ``path``.
+
+    The source files are hashed and the asset files read here; tables and
+    sections are built lazily.  The workbook hash is pinned, so a table
+    loaded later still comes from this version's snapshot (see
+    :func:`load_catalog_table`).
+    """
+    workbook_hash, source_hash, assets = read_sources(path)
+    return Catalog(
+        functools.partial(load_catalog_table, path=path,
+                          snapshot_dir=snapshot_dir, workbook_hash=workbook_hash),
+        version=version,
+        source_hash=source_hash,
+        assets=assets,
+    )
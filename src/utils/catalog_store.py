@@ -0,0 +1,102 @@
+"""Hot reload of the catalog while the server keeps running.
+
+:class:`CatalogStore` holds the active :class:`~src.utils.catalog.Catalog`
+and a background thread polling the modification time of its source files
+(the workbook and ``assets/*.json``).  When one changes, a new catalog is
+built off the request path and swapped in with a single reference
+assignment under the next version number.  Each rerun reads
+:meth:`CatalogStore.current` once, so reruns already in flight finish
+against the version they started with.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(paths: Iterable[Path]) -> tuple:
+    entries = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            entries.append((str(path), None, None))
+        else:
+            entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+class CatalogStore:
+    """Versioned holder of the active catalog.
+
+    Parameters
+    ----------
+    builder : callable
+        ``builder(version)`` returns a new catalog tagged with ``version``.
+    sources : callable
+        Returns the paths whose changes trigger a rebuild.
+    poll_interval : float
+        Seconds between two modification time checks.
+    """
+
+    def __init__(self, builder: Callable, sources: Callable[[], Iterable[Path]],
+                 poll_interval: float = 5.0):
+        self._builder = builder
+        self._sources = sources
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._fingerprint = _fingerprint(sources())
+        self._current = builder(1)
+
+    def current(self):
+        """Return the active catalog; keep the reference for the whole rerun."""
+        return self._current
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    def poll(self) -> bool:
+        """Rebuild and swap the catalog if a source changed.
+
+        Returns ``True`` when a new version was installed.  A failed build
+        (e.g. a workbook still being saved) keeps the active version and is
+        retried on the next poll.
+        """
+        with self._lock:
+            fingerprint = _fingerprint(self._sources())
+            if fingerprint == self._fingerprint:
+                return False
+            try:
+                catalog = self._builder(self._current.version + 1)
+            except Exception:
+                logger.exception("Catalog reload failed; keeping version %s",
+                                 self._current.version)
+                return False
+            self._fingerprint = fingerprint
+            self._current = catalog
+            logger.info("Catalog reloaded as version %s", catalog.version)
+            return True
+
+    def start(self):
+        """Start the background poller (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="catalog-reload", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self._poll_interval):
+            self.poll()
@@ -94,6 +94,9 @@ dowel_diameters_mm_raw = [
     "Ø12", "Ø14", "Ø16", "Ø18", "Ø20", "Ø22", "Ø25", "Ø30",
 ]
 
+# Metric diameters as listed in the selector
+dowel_diameters_mm = [f"{d} mm" for d in dowel_diameters_mm_raw]
+
 dowel_lengths_mm = [
     "4mm", "5mm", "6mm", "8mm", "10mm", "12mm", "16mm", "20mm", "25mm", "30mm",
     "35mm", "40mm", "45mm", "50mm", "60mm", "70mm", "80mm", "90mm", "100mm",
@@ -109,6 +112,12 @@ dowel_lengths_in = [
     '1-3/4"', '2"', '2-1/4"', '2-1/2"', '3"', '3-1/2"', '4"',
 ]
 
+# ------------------ Pipe flange sizes ------------------
+flange_sizes = [
+    "1/8”", "1/4”", "3/8”", "1/2”", "3/4”", "1”", "1-1/4”", "1-1/2”", "2”",
+    "2-1/2”", "3”", "4”",
+]
+
 # ------------------ Gasket spiral wound materials ------------------
 winding_materials = [
     "SS316L",
@@ -141,3 +150,41 @@ color_codes = {
     "CERAMIC": "Light Gray",
     "GLASS": "Clear",
 }
+
+# ------------------ Gasket spiral wound colour coding ------------------
+# Winding / filler material -> (colour, RAL code)
+spiral_winding_colors = {
+    "304 stainless steel": ("Yellow", "RAL1021"),
+    "316L stainless steel": ("Green", "RAL6005"),
+    "317L stainless steel": ("Maroon", "RAL3003"),
+    "321 stainless steel": ("Turquoise", "RAL5018"),
+    "347 stainless steel": ("Blue", "RAL5017"),
+    "MONEL": ("Orange", "RAL2003"),
+    "Nickel": ("Red", "RAL3024"),
+    "Titanium": ("Purple", "RAL4003"),
+    "Alloy 20": ("Black", "RAL9005"),
+    "INCONEL 600": ("Gold", "RAL1004"),
+    "HASTELLOY B": ("Brown", "RAL8003"),
+    "HASTELLOY C": ("Beige", "RAL1011"),
+    "INCOLOY 800": ("White", "RAL9010"),
+    "DUPLEX": ("Yellow+Blue", "RAL1021+5017"),
+    "SUPERDUPLEX": ("Red+Black", "RAL3020+9005"),
+    "ALLOY 825": ("Orange+Green", "RAL2003+6005"),
+    "UNS S31254": ("Orange+Blue", "RAL2003+5017"),
+    "ZYRCONIUM 702": ("Gold+Green", "RAL1004+6005"),
+    "INCONEL X750HT": ("Gold+Black", "RAL1004+9005"),
+}
+
+spiral_filler_colors = {
+    "Graphite": ("Gray", "RAL7011"),
+    "PTFE": ("White", "RAL9010"),
+    "Ceramic": ("Light Green", "RAL6021"),
+    "Verdicarb (Mica Graphite)": ("Pink", "RAL3015"),
+}
+
+# Rating option -> (pressure label, gasket factors, stripes)
+spiral_ratings = {
+    "STANDARD PRESSURE - m=3; y=10000psi (1 stripe)": ("STANDARD PRESSURE", "m=3; y=10000psi", "1 stripe"),
+    "HIGH PRESSURE - m=3; y=17500psi (2 stripes)": ("HIGH PRESSURE", "m=3; y=17500psi", "2 stripes"),
+    "ULTRA HIGH PRESSURE - m=3; y=23500psi (3 stripes)": ("ULTRA HIGH PRESSURE", "m=3; y=23500psi", "3 stripes"),
+}
@@ -11,6 +11,11 @@ ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 
 @lru_cache(maxsize=None)
 def load_data(name: str) -> Any:
+    """Cached :func:`read_data`; the file is parsed once per process."""
+    return read_data(name)
+
+
+def read_data(name: str) -> Any:
     """Load JSON or CSV data from the assets directory.
 
     Parameters
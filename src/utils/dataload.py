@@ -1,8 +1,87 @@
-import csv
 import io
+import logging
+import sqlite3
+import tempfile
+
 import streamlit as st
 
+from src.utils.dataload_export import (
+    CREATE, ITEM_CODE_COLUMN, MODE_COLUMN, UPDATE, file_name, item_tokens, read_items,
+    tokens_csv, write_dataload,
+)
+from src.utils.history import current_user, existing_item_code, item_history, record_item_code
+from src.utils.item_codes import allocate, reservable_prefix
+from src.utils.item_master import open_index
+
+logger = logging.getLogger(__name__)
+
+# Exports larger than this are spooled to a temporary file while written
+SPOOL_BYTES = 8 * 2**20
+
+# Multi-item export format -> one file per item in a ZIP
+EXPORT_FORMATS = {"One DataLoad file (.csv)": False, "One file per item (.zip)": True}
+
+
+def _item_master():
+    """Last import of the Oracle item master, or None without one."""
+    try:
+        return open_index()
+    except (OSError, ValueError):
+        logger.exception("Could not open the item-master index")
+        return None
+
+
+def item_master_warnings(master, mode: str, item_code: str, data) -> list:
+    """Item-master checks of the DataLoad panel, as Markdown messages.
+
+    A new code must not exist in Oracle yet, nor the description of the
+    item; an updated code must exist.  Nothing is checked without ``master``.
+    """
+    if master is None:
+        return []
+    if mode == UPDATE:
+        if item_code and not master.has_code(item_code):
+            return [f"Item code **{item_code}** is not in the Oracle item master."]
+        return []
+    warnings = []
+    if item_code and master.has_code(item_code):
+        warnings.append(f"Item code **{item_code}** already exists in the Oracle item master.")
+    oracle_code = master.code_for_description(data.get("Description", "")) if data else None
+    if oracle_code and oracle_code != item_code:
+        warnings.append(f"The Oracle item master already has this description: **{oracle_code}**.")
+    return warnings
+
+
+def _reserve_next_code(item_code_key: str, prefix: str):
+    # Button callback: runs before the rerun, so the code field can still be set
+    try:
+        codes = allocate(prefix, history=item_history(), index=_item_master(), user=current_user())
+    except (OSError, ValueError, sqlite3.Error) as exc:
+        logger.exception("Could not reserve an item code of %s", prefix)
+        st.session_state[f"{item_code_key}_reserve_error"] = str(exc)
+        return
+    st.session_state[item_code_key] = codes[0]
+
+
+def render_reserve_code_button(item_code_key: str, data, master=None):
+    """Button filling ``item_code_key`` with the next free code of the item prefix.
+
+    Shown once the item master is imported, for a prefix with codes in it
+    (:func:`~src.utils.item_codes.reservable_prefix`); the code is reserved
+    in the item history, so nobody else gets it.
+    """
+    master = master if master is not None else _item_master()
+    prefix = reservable_prefix(data.get("Item", ""), master) if data else ""
+    if prefix:
+        st.button(f"🔢 Reserve next free {prefix}… code", key=f"{item_code_key}_reserve",
+                  on_click=_reserve_next_code, args=(item_code_key, prefix))
+    error = st.session_state.pop(f"{item_code_key}_reserve_error", None)
+    if error:
+        st.error(f"❌ Could not reserve an item code: {error}")
 
+
+# Fragment: item code and buttons rerun only this panel
+@st.fragment
 def render_dataload_panel(item_code_key: str,
                           create_btn_key: str,
                           update_btn_key: str,
@@ -17,109 +96,86 @@ def render_dataload_panel(item_code_key: str,
     item_code = st.text_input("Item Code", key=item_code_key)
     data = st.session_state.get(state_key, {})
 
-    raw_q = data.get("Quality", "")
-    # Gestione robusta del campo Quality
-    if isinstance(raw_q, list):
-        raw_q = "\n".join(raw_q)
-    elif not isinstance(raw_q, str):
-        raw_q = ""
-
-    raw_q = raw_q.strip()
-
-    if not raw_q:
-        quality_tokens = ["NA"]
-    else:
-        quality_tokens = []
-        for line in raw_q.splitlines():
-            quality_tokens.append(line)
-            quality_tokens.append("\\{NUMPAD ENTER}")
-        if quality_tokens and quality_tokens[-1] == "\\{NUMPAD ENTER}":
-            quality_tokens.pop()
-
-    def get_val(k, default="."):
-        v = data.get(k, "").strip()
-        return v if v else default
-
     if mode == "Create new item":
+        # Same item (up to spacing, case and order) already created in Oracle
+        existing = existing_item_code() if data else None
+        if existing and existing.item_code != item_code:
+            st.warning(
+                f"⚠️ An equivalent item already exists: **{existing.item_code}** "
+                f"(created by {existing.user or 'unknown'} on {existing.created_at[:10]}). "
+                "Use it instead of creating a new item code."
+            )
+        master = _item_master()
+        render_reserve_code_button(item_code_key, data, master)
+        for warning in item_master_warnings(master, CREATE, item_code, data):
+            st.warning(f"⚠️ {warning}")
         if st.button("Generate DataLoad string", key=create_btn_key):
             if not item_code:
                 st.error("❌ Please enter the item code first.")
             else:
-                fields = [
-                    "\\%FN",            item_code,
-                    "\\%TC",            get_val("Template"),
-                    "TAB",
-                    "\\%D", "\\%O",
-                    "TAB",
-                    get_val("Description"),
-                    *["TAB"]*6,
-                    get_val("Identificativo"),
-                    "TAB",
-                    get_val("Classe ricambi"),
-                    "TAB",
-                    "\\%O", "\\^S", "\\%TA",
-                    "TAB",
-                    f"{get_val('ERP_L1')}.{get_val('ERP_L2')}",
-                    "TAB", "FASCIA ITE", "TAB",
-                    item_code[:1], "TAB",
-                    "\\^S", "\\^{F4}", "\\%TG",
-                    get_val("Catalog"),
-                    *["TAB"]*4,
-                    get_val("Disegno"), "TAB",
-                    "\\^S", "\\^{F4}",
-                    "\\%TR", "MATER+DESCR_FPD", *["TAB"]*2,
-                    get_val("FPD material code"), "TAB",
-                    get_val("Material"), "\\^S", "\\^S", "\\^{F4}", "\\%VA",
-                    "TAB", "Quality", *["TAB"]*4,
-                    *quality_tokens,
-                    "\\^S", "\\^{F4}", "\\^S"
-                ]
-
+                # The newest code of this spec already: nothing new to record
+                if existing is None or existing.item_code != item_code:
+                    record_item_code(item_code)
                 st.success("✅ DataLoad string successfully generated. Download the CSV file below.")
-                buf = io.StringIO()
-                writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
-                for tok in fields:
-                    writer.writerow([tok])
                 st.download_button(
                     "💾 Download CSV for Import",
-                    data=buf.getvalue(),
-                    file_name=f"dataload_{item_code}.csv",
+                    data=tokens_csv(item_tokens(CREATE, item_code, data)),
+                    file_name=file_name(CREATE, item_code),
                     mime="text/csv",
                 )
 
     else:
+        for warning in item_master_warnings(_item_master(), UPDATE, item_code, data):
+            st.warning(f"⚠️ {warning}")
         if st.button("Generate Update string", key=update_btn_key):
             if not item_code:
                 st.error("❌ Please enter the item code first.")
             else:
-                fields = [
-                    "\\%VF",            item_code,
-                    "\\{NUMPAD ENTER}", "TAB",
-                    get_val("Description", "*?"),
-                    *["TAB"]*6,
-                    get_val("Identificativo"), "TAB",
-                    get_val("Classe ricambi"), "TAB",
-                    "\\%O", "\\^S", "\\%TA",
-                    "\\%VF",            "FASCIA ITE", "\\{NUMPAD ENTER}", "TAB",
-                    item_code[:1],     "\\^S",
-                    "\\%VF",           "TIPO ARTICOLO", "\\{NUMPAD ENTER}", "TAB",
-                    f"{get_val('ERP_L1')}.{get_val('ERP_L2')}", "\\^S", "\\^{F4}",
-                    "\\%TG",           get_val("Catalog"),
-                    *["TAB"]*3,        get_val("Disegno"), "TAB",
-                    "\\^S", "\\^{F4}", "\\^S",
-                    "\\%VA",           "TAB", "Quality", *["TAB"]*4,
-                    *quality_tokens,
-                    "\\^S", "\\^{F4}", "\\^S"
-                ]
-
                 st.success("✅ Update string successfully generated. Download the CSV file below.")
-                buf = io.StringIO()
-                writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
-                for tok in fields:
-                    writer.writerow([tok])
                 st.download_button(
                     "💾 Download CSV for Update",
-                    data=buf.getvalue(),
-                    file_name=f"update_{item_code}.csv",
+                    data=tokens_csv(item_tokens(UPDATE, item_code, data)),
+                    file_name=file_name(UPDATE, item_code),
                     mime="text/csv",
                 )
+
+
+def _export_file(content: bytes, name: str, mode: str, archive: bool):
+    """Callable building the export of an uploaded items file when the download starts."""
+
+    def build():
+        source = io.BytesIO(content)
+        source.name = name
+        out = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        # Items are read and written one chunk at a time
+        write_dataload(read_items(source, mode), out, archive=archive)
+        out.seek(0)
+        return out
+
+    return build
+
+
+@st.fragment
+def render_multi_dataload_panel():
+    with st.expander("📦 Multi-item DataLoad export"):
+        upload = st.file_uploader(
+            f"Items file (CSV or XLSX with an {ITEM_CODE_COLUMN!r} column, e.g. a batch output)",
+            type=["csv", "xlsx"], key="multi_dataload_items",
+        )
+        col_mode, col_format = st.columns(2)
+        mode = col_mode.radio(f"Operation type (rows without a {MODE_COLUMN!r}):",
+                              [CREATE, UPDATE], format_func=str.capitalize,
+                              key="multi_dataload_mode")
+        archive = EXPORT_FORMATS[col_format.radio("Download as:", list(EXPORT_FORMATS),
+                                                  key="multi_dataload_format")]
+        if upload is None:
+            st.caption("Rows without an item code, or with an Error, are skipped.")
+            return
+        stem = upload.name.rsplit(".", 1)[0]
+        st.download_button(
+            "💾 Download DataLoad export",
+            data=_export_file(upload.getvalue(), upload.name, mode, archive),
+            file_name=f"dataload_{stem}.{'zip' if archive else 'csv'}",
+            mime="application/zip" if archive else "text/csv",
+            key="multi_dataload_download",
+        )
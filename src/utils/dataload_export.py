@@ -0,0 +1,442 @@
+"""DataLoad token streams for generated items, one or many at a time.
+
+A DataLoad file is a one-column CSV of keystroke tokens that the DataLoad
+macro replays into the Oracle item forms.  :func:`item_tokens` builds the
+stream that creates or updates one item; :func:`write_dataload_csv`
+concatenates the streams of many items into a single file and
+:func:`write_dataload_zip` stores them as one file per item.  Both writers
+consume the items lazily and write each token as it is produced, so the
+size of an export is bounded by the output file, not by memory.
+
+The keystrokes of each Oracle form and mode are declared once in
+:data:`TEMPLATES` as literal tokens and :class:`Slot` placeholders, and
+compiled into token arrays with the slot positions indexed, so a chunk of
+items is filled by assigning each slot as a column.
+
+The items file is the CSV or XLSX written by a batch run (see
+:mod:`src.engine.batch`) with an ``Item code`` column.  Export it from the
+*Multi-item DataLoad export* panel of the app, or with::
+
+    python -m src.utils.dataload_export items.xlsx dataload.zip
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import itertools
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+CREATE = "create"
+UPDATE = "update"
+MODES = (CREATE, UPDATE)
+
+# Column of the items file holding the Oracle item code
+ITEM_CODE_COLUMN = "Item code"
+# Optional column overriding the export mode of a single item
+MODE_COLUMN = "Mode"
+
+ENTER = "\\{NUMPAD ENTER}"
+
+
+def quality_tokens(raw_q) -> list[str]:
+    """Quality lines separated by ENTER, or ``["NA"]`` without quality."""
+    if isinstance(raw_q, (list, tuple)):
+        raw_q = "\n".join(raw_q)
+    elif not isinstance(raw_q, str):
+        raw_q = ""
+    raw_q = raw_q.strip()
+    if not raw_q:
+        return ["NA"]
+    tokens = []
+    for line in raw_q.splitlines():
+        tokens.append(line)
+        tokens.append(ENTER)
+    if tokens and tokens[-1] == ENTER:
+        tokens.pop()
+    return tokens
+
+
+class Slot(NamedTuple):
+    """Template token filled from the item.
+
+    ``names`` are entries of :data:`SLOT_KEYS` (or ``item_code`` /
+    ``item_prefix``); several names are joined with ``sep``.  Empty values
+    become ``default``.
+    """
+
+    names: tuple
+    default: str = "."
+    sep: str = "."
+
+
+def slot(*names, default=".", sep=".") -> Slot:
+    """Placeholder for the fields ``names``."""
+    return Slot(names, default, sep)
+
+
+def tabs(n: int) -> tuple:
+    """``n`` TAB keystrokes."""
+    return ("TAB",) * n
+
+
+# Where the quality lines are spliced in
+QUALITY = "<quality>"
+
+# Slot name -> output fields read for it, first present wins (castings use
+# their own field names)
+SLOT_KEYS = {
+    "template": ("Template",),
+    "description": ("Description",),
+    "identificativo": ("Identificativo",),
+    "classe": ("Classe ricambi",),
+    "erp_l1": ("ERP_L1",),
+    "erp_l2": ("ERP_L2",),
+    "catalog": ("Catalog",),
+    "drawing": ("Disegno", "Casting drawing"),
+    "fpd_code": ("FPD material code", "FPD Material Code"),
+    "material": ("Material",),
+}
+
+# Further fields read for the items of a template.  Only the castings export
+# their "ERP L1" / "ERP L2": the baseplate shows the same fields, but its
+# DataLoad has always left the ERP category out ("...")
+TEMPLATE_SLOT_KEYS = {
+    "FPD_BUY_CASTING": {"erp_l1": ("ERP L1",), "erp_l2": ("ERP L2",)},
+}
+
+ITEM_CODE = slot("item_code")
+ITEM_PREFIX = slot("item_prefix")
+
+# (Oracle form, mode) -> keystrokes; tuples are flattened when compiled
+TEMPLATES = {
+    ("item", CREATE): (
+        "\\%FN", ITEM_CODE,
+        "\\%TC", slot("template"),
+        "TAB",
+        "\\%D", "\\%O",
+        "TAB",
+        slot("description"),
+        tabs(6),
+        slot("identificativo"),
+        "TAB",
+        slot("classe"),
+        "TAB",
+        "\\%O", "\\^S", "\\%TA",
+        "TAB",
+        slot("erp_l1", "erp_l2"),
+        "TAB", "FASCIA ITE", "TAB",
+        ITEM_PREFIX, "TAB",
+        "\\^S", "\\^{F4}", "\\%TG",
+        slot("catalog"),
+        tabs(4),
+        slot("drawing"), "TAB",
+        "\\^S", "\\^{F4}",
+        "\\%TR", "MATER+DESCR_FPD", tabs(2),
+        slot("fpd_code"), "TAB",
+        slot("material"), "\\^S", "\\^S", "\\^{F4}", "\\%VA",
+        "TAB", "Quality", tabs(4),
+        QUALITY,
+        "\\^S", "\\^{F4}", "\\^S",
+    ),
+    ("item", UPDATE): (
+        "\\%VF", ITEM_CODE,
+        ENTER, "TAB",
+        slot("description", default="*?"),
+        tabs(6),
+        slot("identificativo"), "TAB",
+        slot("classe"), "TAB",
+        "\\%O", "\\^S", "\\%TA",
+        "\\%VF", "FASCIA ITE", ENTER, "TAB",
+        ITEM_PREFIX, "\\^S",
+        "\\%VF", "TIPO ARTICOLO", ENTER, "TAB",
+        slot("erp_l1", "erp_l2"), "\\^S", "\\^{F4}",
+        "\\%TG", slot("catalog"),
+        tabs(3), slot("drawing"), "TAB",
+        "\\^S", "\\^{F4}", "\\^S",
+        "\\%VA", "TAB", "Quality", tabs(4),
+        QUALITY,
+        "\\^S", "\\^{F4}", "\\^S",
+    ),
+}
+
+
+def _flatten(tokens):
+    for tok in tokens:
+        if isinstance(tok, tuple) and not isinstance(tok, Slot):
+            yield from _flatten(tok)
+        else:
+            yield tok
+
+
+def _template_keys(data, name: str) -> tuple:
+    return TEMPLATE_SLOT_KEYS.get(data.get("Template"), {}).get(name, ())
+
+
+def _field(data, keys) -> str:
+    for key in keys:
+        if key in data:
+            value = data[key]
+            return value.strip() if isinstance(value, str) else str(value)
+    return ""
+
+
+class CompiledTemplate:
+    """A template flattened into static token arrays plus indexed slots.
+
+    The literal tokens before and after :data:`QUALITY` are kept as two
+    arrays with the slot positions left blank.  :meth:`fill` resolves each
+    slot for all the items as one column, then copies the arrays once per
+    item and drops the column values into the indexed positions.
+    """
+
+    def __init__(self, tokens):
+        flat = list(_flatten(tokens))
+        split = flat.index(QUALITY)
+        self.head, self.head_slots = self._compile(flat[:split])
+        self.tail, self.tail_slots = self._compile(flat[split + 1:])
+
+    @staticmethod
+    def _compile(tokens):
+        static = [tok if isinstance(tok, str) else "" for tok in tokens]
+        slots = tuple((i, tok) for i, tok in enumerate(tokens)
+                      if isinstance(tok, Slot))
+        return static, slots
+
+    @staticmethod
+    def _column(s: Slot, codes, records) -> list[str]:
+        parts = []
+        for name in s.names:
+            if name == "item_code":
+                values = codes
+            elif name == "item_prefix":
+                values = [code[:1] for code in codes]
+            else:
+                values = [_field(data, SLOT_KEYS[name] + _template_keys(data, name))
+                          for data in records]
+            parts.append([v if v else s.default for v in values])
+        if len(parts) == 1:
+            return parts[0]
+        return [s.sep.join(vs) for vs in zip(*parts)]
+
+    def _columns(self, slots, codes, records):
+        return [(i, self._column(s, codes, records)) for i, s in slots]
+
+    def fill(self, codes, records) -> list[list[str]]:
+        """Token streams of the items ``codes[i]`` with fields ``records[i]``."""
+        head_columns = self._columns(self.head_slots, codes, records)
+        tail_columns = self._columns(self.tail_slots, codes, records)
+        streams = []
+        for k, data in enumerate(records):
+            tokens = self.head.copy()
+            for i, column in head_columns:
+                tokens[i] = column[k]
+            tail = self.tail.copy()
+            for i, column in tail_columns:
+                tail[i] = column[k]
+            tokens += quality_tokens(data.get("Quality", ""))
+            tokens += tail
+            streams.append(tokens)
+        return streams
+
+
+COMPILED = {key: CompiledTemplate(tokens) for key, tokens in TEMPLATES.items()}
+
+
+def _template(mode: str, form: str = "item") -> CompiledTemplate:
+    try:
+        return COMPILED[form, mode]
+    except KeyError:
+        raise ValueError(
+            f"Unknown DataLoad mode {mode!r} (expected one of {MODES})"
+        ) from None
+
+
+def fill_items(mode: str, codes, records) -> list[list[str]]:
+    """Token streams of many items in the same ``mode``."""
+    return _template(mode).fill(list(codes), list(records))
+
+
+def create_tokens(item_code: str, data) -> list[str]:
+    """Tokens that create item ``item_code`` with the fields in ``data``."""
+    return fill_items(CREATE, [item_code], [data])[0]
+
+
+def update_tokens(item_code: str, data) -> list[str]:
+    """Tokens that update the existing item ``item_code`` with ``data``."""
+    return fill_items(UPDATE, [item_code], [data])[0]
+
+
+def item_tokens(mode: str, item_code: str, data) -> list[str]:
+    """Create or update tokens of one item."""
+    return fill_items(mode, [item_code], [data])[0]
+
+
+def iter_item_tokens(items: Iterable[tuple], chunk_size: int = 512,
+                     with_keys: bool = False) -> Iterator:
+    """Token streams of ``(mode, item_code, data)`` items, filled in chunks.
+
+    Only ``chunk_size`` items are held at a time.  With ``with_keys`` each
+    stream comes as ``(tokens, (mode, item_code))``.
+    """
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if not chunk:
+            return
+        streams = [None] * len(chunk)
+        for mode in dict.fromkeys(mode for mode, _, _ in chunk):
+            positions = [i for i, item in enumerate(chunk) if item[0] == mode]
+            filled = fill_items(mode, [chunk[i][1] for i in positions],
+                                [chunk[i][2] for i in positions])
+            for i, tokens in zip(positions, filled):
+                streams[i] = tokens
+        if with_keys:
+            yield from zip(streams, ((mode, code) for mode, code, _ in chunk))
+        else:
+            yield from streams
+
+
+def file_name(mode: str, item_code: str) -> str:
+    """Download name of the DataLoad file of one item."""
+    return f"{'dataload' if mode == CREATE else 'update'}_{item_code}.csv"
+
+
+def tokens_csv(tokens) -> str:
+    """One-column CSV text of ``tokens``."""
+    buf = io.StringIO()
+    _write_tokens(csv.writer(buf, quoting=csv.QUOTE_MINIMAL), tokens)
+    return buf.getvalue()
+
+
+def _write_tokens(writer, tokens):
+    writer.writerows([tok] for tok in tokens)
+
+
+def write_dataload_csv(items: Iterable[tuple], f) -> int:
+    """Write the token streams of ``items`` one after the other to ``f``.
+
+    ``items`` yields ``(mode, item_code, data)`` tuples and ``f`` is a text
+    file opened with ``newline=""``.  Returns the number of items written.
+    """
+    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+    count = 0
+    for tokens in iter_item_tokens(items):
+        _write_tokens(writer, tokens)
+        count += 1
+    return count
+
+
+def write_dataload_zip(items: Iterable[tuple], f) -> int:
+    """Write one DataLoad file per item of ``items`` into a ZIP archive.
+
+    ``f`` is a path or a binary file; it does not need to be seekable, so
+    the archive can be streamed.  Returns the number of items written.
+    """
+    seen = {}
+    count = 0
+    with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for tokens, (mode, item_code) in iter_item_tokens(items, with_keys=True):
+            name = file_name(mode, item_code)
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name[:-4]}_{seen[name]}.csv"
+            with archive.open(name, "w") as raw, io.TextIOWrapper(
+                raw, encoding="utf-8", newline=""
+            ) as text:
+                _write_tokens(csv.writer(text, quoting=csv.QUOTE_MINIMAL), tokens)
+            count += 1
+    return count
+
+
+def _cell_text(value) -> str:
+    # XLSX numbers are text in the token stream: 4020100001.0 -> "4020100001"
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _item_rows(source) -> Iterator[dict]:
+    """Rows of an items CSV or XLSX file (first worksheet), as dicts of text.
+
+    ``source`` is a path or a binary file with a ``name`` (e.g. an upload).
+    """
+    name = str(getattr(source, "name", source))
+    if Path(name).suffix.lower() in (".xlsx", ".xlsm"):
+        from src.utils.xlsx import XlsxReader
+
+        with XlsxReader(source) as book:
+            rows = book.rows(book.sheet_names[0])
+            header = [_cell_text(value).strip() for value in next(rows, ())]
+            for row in rows:
+                yield {key: _cell_text(value) for key, value in zip(header, row) if key}
+        return
+    if hasattr(source, "read"):
+        text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+        try:
+            yield from csv.DictReader(text)
+        finally:
+            text.detach()
+        return
+    with open(source, newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
+def read_items(source, mode: str = CREATE, skipped=None) -> Iterator[tuple]:
+    """Stream ``(mode, item_code, data)`` from an items CSV or XLSX file.
+
+    Rows without an item code, or with an ``Error`` (see
+    :mod:`src.engine.batch`), are skipped and their row numbers appended to
+    ``skipped`` when given.
+    """
+    for row_number, row in enumerate(_item_rows(source), start=1):
+        item_code = (row.get(ITEM_CODE_COLUMN) or "").strip()
+        if not item_code or (row.get("Error") or "").strip():
+            if skipped is not None:
+                skipped.append(row_number)
+            continue
+        yield (row.get(MODE_COLUMN) or "").strip().lower() or mode, item_code, row
+
+
+def write_dataload(items: Iterable[tuple], f, archive: bool = False) -> int:
+    """Write ``items`` to the binary file ``f`` as one CSV or, with ``archive``, a ZIP.
+
+    Returns the number of items written.
+    """
+    if archive:
+        return write_dataload_zip(items, f)
+    text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+    try:
+        count = write_dataload_csv(items, text)
+    finally:
+        text.flush()
+        text.detach()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export the DataLoad strings of many items to one CSV or ZIP file."
+    )
+    parser.add_argument("items", type=Path,
+                        help=f"items CSV or XLSX with an {ITEM_CODE_COLUMN!r} column")
+    parser.add_argument("out", type=Path, help="output .csv (one stream) or .zip (one file per item)")
+    parser.add_argument("--mode", choices=MODES, default=CREATE,
+                        help=f"default for rows without a {MODE_COLUMN!r} value")
+    args = parser.parse_args(argv)
+
+    skipped = []
+    items = read_items(args.items, args.mode, skipped)
+    with args.out.open("wb") as f:
+        count = write_dataload(items, f, archive=args.out.suffix.lower() == ".zip")
+    print(f"{count} items exported to {args.out}, {len(skipped)} rows skipped.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,37 @@
+"""Helpers for objects shared read-only between Streamlit sessions."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+
+class Frozen:
+    """Mixin rejecting attribute assignment once ``__init__`` has finished.
+
+    Subclasses set their attributes with :meth:`_init_attrs`; afterwards any
+    ``obj.attr = value`` or ``del obj.attr`` raises ``AttributeError``.
+    """
+
+    def _init_attrs(self, **attrs):
+        for name, value in attrs.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+
+def frozen_mapping(mapping) -> MappingProxyType:
+    """Read-only view of ``mapping``."""
+    return MappingProxyType(dict(mapping))
+
+
+def deep_freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(deep_freeze(v) for v in value)
+    return value
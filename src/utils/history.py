@@ -0,0 +1,116 @@
+"""Recording and browsing of the generated items.
+
+:func:`generate_output` is what the "Generate Output" buttons call: it
+generates the item, puts it in the output column and appends it to the
+shared item history (see :mod:`src.utils.history_store`).
+:func:`render_history_panel` lets anyone find an item generated earlier,
+and :func:`existing_item_code` tells the DataLoad panel when an equivalent
+item already has an Oracle code.
+"""
+
+import logging
+import os
+import sqlite3
+
+import streamlit as st
+
+from src.engine import generate_item
+from src.utils.history_store import ItemHistory
+
+logger = logging.getLogger(__name__)
+
+# Rows listed by the history panel
+HISTORY_LIMIT = 50
+
+# Session key of the history id and spec hash of the item in "output_data"
+OUTPUT_RECORD_KEY = "output_record"
+
+# User recorded without sign-in and without ORACLE_CONFIG_USER
+UNKNOWN_USER = "unknown"
+
+
+@st.cache_resource
+def item_history() -> ItemHistory:
+    """The item history shared by all sessions of the process."""
+    return ItemHistory()
+
+
+def current_user() -> str:
+    """Signed-in user, or ``ORACLE_CONFIG_USER`` (``"unknown"`` if unset) without sign-in.
+
+    The OS user is never used: on a server it is the service account, not
+    whoever generated the item.
+    """
+    user = st.user.get("email") if st.user.get("is_logged_in") else None
+    return user or os.environ.get("ORACLE_CONFIG_USER") or UNKNOWN_USER
+
+
+def generate_output(part: str, spec, catalog):
+    """Generate the item of ``part``, show it and record it in the history."""
+    record = generate_item(part, spec, catalog)
+    st.session_state["output_data"] = record.to_dict()
+    history_id = None
+    try:
+        history_id = item_history().append(record, spec, current_user())
+    except (OSError, sqlite3.Error):
+        # The history is a convenience: never lose the generated item over it
+        logger.exception("Could not record %s in the item history", part)
+    st.session_state[OUTPUT_RECORD_KEY] = {"history_id": history_id, "spec_hash": record.spec_hash}
+    return record
+
+
+def existing_item_code():
+    """:class:`~src.utils.history_store.ItemCode` of an item equivalent to the output, or None."""
+    output = st.session_state.get(OUTPUT_RECORD_KEY)
+    if not output:
+        return None
+    try:
+        return item_history().existing_code(output["spec_hash"])
+    except (OSError, sqlite3.Error):
+        logger.exception("Could not look up the item history")
+        return None
+
+
+def record_item_code(item_code: str) -> None:
+    """Record that the item in the output column was created as ``item_code``."""
+    output = st.session_state.get(OUTPUT_RECORD_KEY)
+    if not output or output["spec_hash"] is None:
+        return
+    try:
+        item_history().record_code(item_code, output["spec_hash"], output["history_id"],
+                                   current_user())
+    except (OSError, sqlite3.Error):
+        logger.exception("Could not record item code %s in the item history", item_code)
+
+
+@st.fragment
+def render_history_panel():
+    with st.expander("🕘 Item history"):
+        col_text, col_part = st.columns([3, 1])
+        text = col_text.text_input("Search descriptions", key="history_query",
+                                   placeholder="e.g. casing a351 cg3m")
+        part_only = col_part.checkbox("Selected part only", key="history_part_only")
+        part = st.session_state.get("selected_part") if part_only else None
+        try:
+            items = item_history().search(text, HISTORY_LIMIT, part=part or None)
+        except (OSError, sqlite3.Error) as exc:
+            st.error(f"❌ Item history not available: {exc}")
+            return
+        if not items:
+            st.info("No items recorded yet." if not text else "No matching items.")
+            return
+        st.dataframe(
+            [
+                {
+                    "Date": item.created_at,
+                    "User": item.user,
+                    "Part": item.part,
+                    "Description": item.description,
+                    "FPD material code": item.fpd_code,
+                    "Drawing": item.drawing,
+                    "Catalog": item.catalog_version,
+                }
+                for item in items
+            ],
+            hide_index=True,
+        )
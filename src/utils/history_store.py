@@ -0,0 +1,383 @@
+"""Append-only SQLite store of the generated items (no Streamlit).
+
+Every item generated in the UI is recorded with its spec, its output fields,
+the catalog version and the user, so an item entered once can be found again
+by anyone instead of being re-entered.  The database runs in WAL mode: the
+sessions of the server read while one of them appends, and each thread keeps
+its own connection.
+
+Lookups go through indexes only: equality filters on the part, the FPD
+material code, the drawing number and the hash of the normalized
+description use B-tree indexes ending in the row id, and free text goes
+through an FTS5 index of the descriptions (words of two to four characters
+match as prefixes, e.g. ``a35`` finds ``A351_``).  Results are returned newest
+first, so a lookup reads at most ``limit`` rows whatever the size of the
+history.
+
+The Oracle item codes created from the history are recorded against the
+:func:`~src.engine.record.spec_hash` of the item, so an equivalent item
+entered again is found with a single index probe
+(:meth:`ItemHistory.existing_code`).  New codes are reserved in the same
+database (:meth:`ItemHistory.reserve_codes`): a reservation holds the write
+lock while it picks the numbers and the code column is unique, so two users
+never get the same code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+from src.utils.dataload_export import SLOT_KEYS
+
+HISTORY_PATH = Path(
+    os.environ.get("ORACLE_HISTORY_DB")
+    or Path(__file__).resolve().parents[2] / ".item_history" / "items.db"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    user TEXT NOT NULL,
+    part TEXT NOT NULL,
+    catalog_version TEXT NOT NULL,
+    description TEXT NOT NULL,
+    description_hash INTEGER NOT NULL,
+    fpd_code TEXT NOT NULL,
+    drawing TEXT NOT NULL,
+    spec TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    spec_hash INTEGER
+);
+CREATE INDEX IF NOT EXISTS items_part ON items (part, id);
+CREATE INDEX IF NOT EXISTS items_fpd_code ON items (fpd_code, id);
+CREATE INDEX IF NOT EXISTS items_drawing ON items (drawing, id);
+CREATE INDEX IF NOT EXISTS items_description_hash ON items (description_hash, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    description, content='items', content_rowid='id', prefix='2 3 4'
+);
+CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, description) VALUES (new.id, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS items_no_update BEFORE UPDATE ON items BEGIN
+    SELECT RAISE(ABORT, 'the item history is append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS items_no_delete BEFORE DELETE ON items BEGIN
+    SELECT RAISE(ABORT, 'the item history is append-only');
+END;
+CREATE TABLE IF NOT EXISTS item_codes (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    user TEXT NOT NULL,
+    item_code TEXT NOT NULL,
+    spec_hash INTEGER NOT NULL,
+    history_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS item_codes_spec_hash ON item_codes (spec_hash, id);
+CREATE TRIGGER IF NOT EXISTS item_codes_no_update BEFORE UPDATE ON item_codes BEGIN
+    SELECT RAISE(ABORT, 'the item history is append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS item_codes_no_delete BEFORE DELETE ON item_codes BEGIN
+    SELECT RAISE(ABORT, 'the item history is append-only');
+END;
+CREATE TABLE IF NOT EXISTS code_reservations (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    user TEXT NOT NULL,
+    item_code TEXT NOT NULL UNIQUE
+);
+CREATE TRIGGER IF NOT EXISTS code_reservations_no_update BEFORE UPDATE ON code_reservations BEGIN
+    SELECT RAISE(ABORT, 'the item history is append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS code_reservations_no_delete BEFORE DELETE ON code_reservations BEGIN
+    SELECT RAISE(ABORT, 'the item history is append-only');
+END;
+"""
+
+# Columns added to a table since its first version: (table, column, type);
+# INDEXES runs once they exist
+UPGRADES = (
+    ("items", "spec_hash", "INTEGER"),
+)
+INDEXES = """
+CREATE INDEX IF NOT EXISTS items_spec_hash ON items (spec_hash, id);
+CREATE INDEX IF NOT EXISTS item_codes_item_code ON item_codes (item_code);
+"""
+
+_COLUMNS = "id, created_at, user, part, catalog_version, spec, fields, spec_hash"
+
+_INSERT = (
+    "INSERT INTO items (created_at, user, part, catalog_version, description,"
+    " description_hash, fpd_code, drawing, spec, fields, spec_hash)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Filters of :meth:`ItemHistory.find` -> indexed column
+FILTERS = ("part", "fpd_code", "drawing", "spec_hash")
+
+
+def normalize_description(text: str) -> str:
+    """Description compared case-insensitively, ignoring spacing and the ``*`` mark."""
+    return " ".join(str(text).casefold().split()).lstrip("* ")
+
+
+def description_hash(text: str) -> int:
+    """Signed 64-bit hash of the normalized description (an SQLite integer)."""
+    digest = hashlib.blake2b(normalize_description(text).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+# Longest word matched as a prefix (the FTS5 prefix indexes cover 2-4 characters)
+PREFIX_MAX = 4
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _prefix_range(prefix: str) -> tuple:
+    # Bounds of the codes starting with ``prefix`` (BINARY collation)
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _fts_query(text: str) -> str:
+    # Every word must match; quoting keeps FTS5 operators literal.  Longer
+    # prefixes would merge the postings of every matching term, so longer
+    # words match whole words only.
+    terms = []
+    for word in str(text).split():
+        quoted = '"{}"'.format(word.replace('"', '""'))
+        terms.append(f"{quoted}*" if 2 <= len(word) <= PREFIX_MAX else quoted)
+    return " ".join(terms)
+
+
+def _slot(fields, name: str) -> str:
+    # Castings and baseplates name some fields differently
+    return next((str(fields[key]) for key in SLOT_KEYS[name] if key in fields), "")
+
+
+class HistoryItem(NamedTuple):
+    id: int
+    created_at: str
+    user: str
+    part: str
+    catalog_version: str
+    spec: dict
+    fields: dict
+    spec_hash: int | None = None
+
+    @property
+    def description(self) -> str:
+        return self.fields.get("Description", "")
+
+    @property
+    def fpd_code(self) -> str:
+        return _slot(self.fields, "fpd_code")
+
+    @property
+    def drawing(self) -> str:
+        return _slot(self.fields, "drawing")
+
+
+def _item(row) -> HistoryItem:
+    return HistoryItem(*row[:5], json.loads(row[5]), json.loads(row[6]), row[7])
+
+
+class ItemCode(NamedTuple):
+    """Oracle item code given to an item of the history."""
+
+    item_code: str
+    created_at: str
+    user: str
+    history_id: int | None
+
+
+class ItemHistory:
+    """Item history in the SQLite database at ``path``.
+
+    Parameters
+    ----------
+    path : Path
+        Database file, created with its directory if missing.
+    timeout : float
+        Seconds a writer waits for another one to finish.
+    """
+
+    def __init__(self, path: Path = HISTORY_PATH, timeout: float = 5.0):
+        self.path = Path(path)
+        self._timeout = timeout
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+            for table, column, kind in UPGRADES:
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+            conn.executescript(INDEXES)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self._timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _row(record, spec, user: str, created_at: str | None = None) -> tuple:
+        fields = record.to_dict()
+        description = fields.get("Description", "")
+        return (
+            created_at or _now(),
+            user or "",
+            record.part,
+            fields.get("Catalog version", ""),
+            description,
+            description_hash(description),
+            _slot(fields, "fpd_code"),
+            _slot(fields, "drawing"),
+            json.dumps(dict(spec), ensure_ascii=False, default=str),
+            json.dumps(fields, ensure_ascii=False),
+            record.spec_hash,
+        )
+
+    def append_many(self, entries) -> int:
+        """Record ``(record, spec, user)`` entries in one transaction; return the count."""
+        rows = [self._row(*entry) for entry in entries]
+        with self._connection() as conn:
+            conn.executemany(_INSERT, rows)
+        return len(rows)
+
+    def append(self, record, spec, user: str = "") -> int:
+        """Record a generated :class:`~src.engine.OutputRecord`; return its id."""
+        with self._connection() as conn:
+            cursor = conn.execute(_INSERT, self._row(record, spec, user))
+        return cursor.lastrowid
+
+    def __len__(self):
+        return self._connection().execute("SELECT count(*) FROM items").fetchone()[0]
+
+    def get(self, item_id: int) -> HistoryItem | None:
+        row = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM items WHERE id = ?", (item_id,)
+        ).fetchone()
+        return _item(row) if row else None
+
+    def find(self, limit: int = 50, description: str | None = None, **filters) -> list:
+        """Newest items matching every filter given.
+
+        ``filters`` are exact values of ``part``, ``fpd_code`` and
+        ``drawing``; ``description`` matches the normalized description.
+        Without filters the newest items are returned.
+        """
+        unknown = set(filters) - set(FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown history filter(s): {', '.join(sorted(unknown))}")
+        clauses = [(f"{name} = ?", value) for name, value in filters.items() if value is not None]
+        if description is not None:
+            clauses.append(("description_hash = ?", description_hash(description)))
+        where = " AND ".join(clause for clause, _ in clauses) or "1"
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM items WHERE {where} ORDER BY id DESC LIMIT ?",
+            [value for _, value in clauses] + [limit],
+        ).fetchall()
+        items = [_item(row) for row in rows]
+        if description is not None:
+            # Drop hash collisions
+            key = normalize_description(description)
+            items = [item for item in items if normalize_description(item.description) == key]
+        return items
+
+    def search(self, text: str, limit: int = 50, part: str | None = None) -> list:
+        """Newest items whose description contains every word of ``text``.
+
+        Words of two to four characters also match longer words they start.
+        """
+        query = _fts_query(text)
+        if not query:
+            return self.find(limit, part=part)
+        if part is None:
+            sql = (f"SELECT {_COLUMNS} FROM items WHERE id IN (SELECT rowid FROM items_fts"
+                   " WHERE items_fts MATCH ? ORDER BY rowid DESC LIMIT ?) ORDER BY id DESC")
+            params = (query, limit)
+        else:
+            # Matches are walked newest first until ``limit`` of them are of the part
+            sql = (f"SELECT {_COLUMNS} FROM items_fts JOIN items ON items.id = items_fts.rowid"
+                   " WHERE items_fts MATCH ? AND items.part = ? ORDER BY items_fts.rowid DESC LIMIT ?")
+            params = (query, part, limit)
+        return [_item(row) for row in self._connection().execute(sql, params).fetchall()]
+
+    def record_code(self, item_code: str, spec_hash: int, history_id: int | None = None,
+                    user: str = "") -> int:
+        """Record that the item of ``spec_hash`` was created as ``item_code``."""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO item_codes (created_at, user, item_code, spec_hash, history_id)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (_now(), user or "", item_code, spec_hash, history_id),
+            )
+        return cursor.lastrowid
+
+    def existing_code(self, spec_hash: int | None) -> ItemCode | None:
+        """Newest item code recorded for an equivalent spec, if any (one index probe)."""
+        if spec_hash is None:
+            return None
+        row = self._connection().execute(
+            "SELECT item_code, created_at, user, history_id FROM item_codes"
+            " WHERE spec_hash = ? ORDER BY id DESC LIMIT 1",
+            (spec_hash,),
+        ).fetchone()
+        return ItemCode(*row) if row else None
+
+    def _codes_with_prefix(self, conn, prefix: str) -> list:
+        low, high = _prefix_range(prefix)
+        rows = conn.execute(
+            "SELECT item_code FROM code_reservations WHERE item_code >= ? AND item_code < ?"
+            " UNION SELECT item_code FROM item_codes WHERE item_code >= ? AND item_code < ?",
+            (low, high, low, high),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def reserve_codes(self, prefix: str, choose, user: str = "") -> list:
+        """Reserve the codes ``choose(taken)`` picks for ``prefix``; return them.
+
+        ``taken`` lists the codes starting with ``prefix`` that are already
+        reserved or recorded.  The write lock is held from that read to the
+        insert of the reservations, so concurrent reservations wait for each
+        other instead of picking the same codes.
+
+        Raises
+        ------
+        sqlite3.IntegrityError
+            If ``choose`` picks a code that is already reserved.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            codes = list(choose(self._codes_with_prefix(conn, prefix) if prefix else []))
+            now = _now()
+            conn.executemany(
+                "INSERT INTO code_reservations (created_at, user, item_code) VALUES (?, ?, ?)",
+                [(now, user or "", code) for code in codes],
+            )
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return codes
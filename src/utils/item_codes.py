@@ -0,0 +1,241 @@
+"""Next free Oracle item codes of a prefix (no Streamlit).
+
+The generated items show the prefix of their Oracle item code in the
+``Item`` field (``"40201…"``, ``"56230…"``, castings ``"7"`` + casting
+code); the rest of the code is a running number.  :func:`allocate` reserves
+the next free numbers of a prefix:
+
+* the codes of the prefix in the item master are one contiguous run of its
+  sorted codes (:meth:`~src.utils.item_master.ItemMasterIndex.codes_with_prefix`),
+  turned into numbers a block at a time with vectorized digit arithmetic;
+* the free numbers are read off the sorted numbers: after the highest one
+  (only the last block is read), or with ``fill_gaps`` from the gaps between
+  them first (blocks are read from the start until the gaps are enough);
+* the codes already reserved or created from the item history are skipped.
+
+The reservation is one transaction of the item history
+(:meth:`~src.utils.history_store.ItemHistory.reserve_codes`), so concurrent
+users never get the same code.
+
+Reserve codes from the command line with::
+
+    python -m src.utils.item_codes 40201 --count 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from src.utils.history_store import ItemHistory
+from src.utils.item_master import open_index
+
+# Length of the codes of a prefix that has no item in the item master yet
+DEFAULT_CODE_LENGTH = 10
+
+# Lowest running number given (all zeros is never used)
+FIRST_NUMBER = 1
+
+# Codes read to find the usual code length of a prefix
+LENGTH_SAMPLE = 1000
+
+# Item-master codes read at first when looking for free numbers (doubled until enough)
+SCAN_CODES = 4096
+
+
+def item_prefix(item: str) -> str:
+    """Code prefix of the ``Item`` field of a generated item (``"40201…"`` -> ``"40201"``)."""
+    return str(item).strip().rstrip("…. ")
+
+
+def reservable_prefix(item: str, index) -> str:
+    """Code prefix of ``item`` if codes of it can be reserved, else ``""``.
+
+    Only an all-digit prefix that already has codes in the item master
+    qualifies: placeholders such as the ``"7XX"`` of a casting without its
+    casting code never get a reservation.
+    """
+    prefix = item_prefix(item)
+    if not prefix.isdigit() or index is None or not len(index.codes_with_prefix(prefix)):
+        return ""
+    return prefix
+
+
+def code_length(codes, default: int = DEFAULT_CODE_LENGTH) -> int:
+    """Most common length of ``codes`` (byte strings), or ``default`` without codes.
+
+    Long runs are sampled evenly: they are sorted, so a sample sees every
+    length that is common.
+    """
+    if not len(codes):
+        return default
+    sample = np.asarray(codes[::max(1, len(codes) // LENGTH_SAMPLE)])
+    return int(np.bincount(np.char.str_len(sample)).argmax())
+
+
+def code_numbers(codes, prefix: str, length: int) -> np.ndarray:
+    """Running numbers of the ``codes`` of ``length`` characters starting with ``prefix``.
+
+    ``codes`` are byte strings (a fixed-width array of the item-master index)
+    or text; codes of another length, or whose number is not all digits,
+    are left out.  The numbers keep the order of ``codes``: the codes of a
+    prefix in the item master give sorted, unique numbers.
+    """
+    digits = length - len(prefix)
+    if digits <= 0:
+        raise ValueError(f"Codes of {length} characters leave no number after prefix {prefix!r}")
+    codes = np.asarray(codes)
+    if codes.dtype.kind == "U":
+        codes = np.char.encode(codes, "utf-8")
+    if not len(codes) or codes.dtype.kind != "S" or codes.dtype.itemsize < length:
+        return np.zeros(0, dtype=np.int64)
+    raw = np.ascontiguousarray(codes).view(np.uint8).reshape(len(codes), codes.dtype.itemsize)
+    keep = raw[:, length - 1] != 0
+    if raw.shape[1] > length:
+        keep &= raw[:, length] == 0
+    for column, char in enumerate(prefix.encode()):
+        keep &= raw[:, column] == char
+    # One column at a time: no (codes x digits) temporary
+    numbers = np.zeros(len(codes), dtype=np.int64)
+    for column in range(len(prefix), length):
+        digit = raw[:, column].astype(np.int64) - ord("0")
+        keep &= (digit >= 0) & (digit <= 9)
+        numbers = numbers * 10 + digit
+    return numbers[keep]
+
+
+def _unique(numbers: np.ndarray) -> np.ndarray:
+    numbers = np.sort(numbers)
+    return numbers[np.concatenate(([True], numbers[1:] != numbers[:-1]))] if len(numbers) else numbers
+
+
+def free_numbers(taken: np.ndarray, count: int, limit: int, fill_gaps: bool = False,
+                 also_taken=()) -> np.ndarray:
+    """The ``count`` lowest free numbers below ``limit``.
+
+    ``taken`` is sorted and unique (the item master); ``also_taken`` are
+    further taken numbers in any order (the reservations), so the large
+    array is never re-sorted.  Numbers come after the highest taken one, or
+    with ``fill_gaps`` from the gaps between taken numbers first.
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``count`` numbers are free.
+    """
+    taken = taken[np.searchsorted(taken, FIRST_NUMBER):np.searchsorted(taken, limit)]
+    extra = _unique(np.asarray(also_taken, dtype=np.int64))
+    extra = extra[(extra >= FIRST_NUMBER) & (extra < limit)]
+    if not fill_gaps:
+        start = max(int(taken[-1]) if len(taken) else 0, int(extra[-1]) if len(extra) else 0,
+                    FIRST_NUMBER - 1) + 1
+        if limit - start < count:
+            raise ValueError(f"only {max(limit - start, 0)} free numbers left")
+        return np.arange(start, start + count, dtype=np.int64)
+    # Gap i of ``taken`` holds sizes[i] numbers from starts[i]; ends[i] are free before gap i + 1
+    bounds = np.concatenate(([FIRST_NUMBER - 1], taken, [limit]))
+    starts, sizes = bounds[:-1] + 1, np.diff(bounds) - 1
+    ends = np.cumsum(sizes)
+    # Enough candidates to still have ``count`` once the other taken numbers are dropped
+    wanted = np.arange(min(count + len(extra), int(ends[-1])), dtype=np.int64)
+    gap = np.searchsorted(ends, wanted, side="right")
+    candidates = starts[gap] + wanted - (ends[gap] - sizes[gap])
+    free = candidates[~np.isin(candidates, extra)] if len(extra) else candidates
+    if len(free) < count:
+        raise ValueError(f"only {len(free)} free numbers left")
+    return free[:count]
+
+
+def _next_numbers(codes, prefix: str, length: int, count: int, fill_gaps: bool,
+                  also_taken) -> np.ndarray:
+    # The sorted item-master codes are read only as far as needed: from the
+    # end for the highest number, from the start until the gaps are enough
+    limit = 10 ** (length - len(prefix))
+    size = SCAN_CODES
+    if not fill_gaps:
+        stop = len(codes)
+        while stop > 0:
+            numbers = code_numbers(codes[max(0, stop - size):stop], prefix, length)
+            if len(numbers):
+                return free_numbers(numbers[-1:], count, limit, False, also_taken)
+            stop, size = stop - size, size * 2
+        return free_numbers(np.zeros(0, dtype=np.int64), count, limit, False, also_taken)
+    stop = 0
+    while True:
+        stop = min(len(codes), stop + size)
+        numbers = code_numbers(codes[:stop], prefix, length)
+        if stop == len(codes):
+            return free_numbers(numbers, count, limit, True, also_taken)
+        if len(numbers):
+            # Every taken number below the last one read is known
+            try:
+                return free_numbers(numbers, count, int(numbers[-1]), True, also_taken)
+            except ValueError:
+                pass
+        size *= 2
+
+
+def allocate(prefix: str, count: int = 1, *, history: ItemHistory, index=None, user: str = "",
+             length: int | None = None, fill_gaps: bool = False) -> list:
+    """Reserve the next ``count`` free item codes of ``prefix``; return them in order.
+
+    Parameters
+    ----------
+    prefix : str
+        Code prefix, or the ``Item`` field of a generated item.
+    history : ItemHistory
+        Store of the reservations and of the codes created from the UI.
+    index : ItemMasterIndex, optional
+        Imported item master; without it only the history is checked.
+    length : int, optional
+        Length of the codes; by default the most common length of the codes
+        of ``prefix`` in the item master.
+    fill_gaps : bool
+        Use the numbers left free between taken ones first.
+
+    Raises
+    ------
+    ValueError
+        If the prefix is empty or has fewer than ``count`` free codes.
+    """
+    prefix = item_prefix(prefix)
+    if not prefix:
+        raise ValueError("No item code prefix")
+    if count < 1:
+        raise ValueError(f"Cannot reserve {count} item codes")
+    master = index.codes_with_prefix(prefix) if index is not None else []
+    length = length or code_length(master)
+    digits = length - len(prefix)
+    if digits <= 0:
+        raise ValueError(f"Codes of {length} characters leave no number after prefix {prefix!r}")
+
+    def choose(taken):
+        reserved = code_numbers(taken, prefix, length)
+        try:
+            free = _next_numbers(master, prefix, length, count, fill_gaps, reserved)
+        except ValueError as exc:
+            raise ValueError(f"Cannot reserve {count} codes of prefix {prefix!r}: {exc}") from None
+        return [f"{prefix}{number:0{digits}d}" for number in free.tolist()]
+
+    return history.reserve_codes(prefix, choose, user)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reserve the next free Oracle item codes of a prefix.")
+    parser.add_argument("prefix", help='code prefix, e.g. 40201 or "40201…"')
+    parser.add_argument("--count", type=int, default=1, help="codes to reserve")
+    parser.add_argument("--length", type=int, help="code length (default: as in the item master)")
+    parser.add_argument("--fill-gaps", action="store_true",
+                        help="use the numbers left free between existing codes first")
+    parser.add_argument("--user", default="", help="user recorded with the reservation")
+    args = parser.parse_args(argv)
+
+    codes = allocate(args.prefix, args.count, history=ItemHistory(), index=open_index(),
+                     user=args.user, length=args.length, fill_gaps=args.fill_gaps)
+    print("\n".join(codes))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,401 @@
+"""On-disk index of the Oracle item-master export (no Streamlit).
+
+The item master is exported from Oracle as a CSV of millions of rows.
+:func:`import_export` streams it row by row (it is never loaded into
+pandas) and writes a compact index that :class:`ItemMasterIndex` memory-maps:
+
+* ``codes.bin``: the item codes, sorted, as fixed-width byte strings, so a
+  code is found by binary search;
+* ``hashes.bin``: the hash of the normalized description of each code;
+* ``table_keys.bin`` / ``table_codes.bin``: an open-addressing hash table
+  from description hash to code, so a description is found in one probe;
+* ``bloom.bin``: a Bloom filter of the codes, so most unknown codes are
+  rejected without touching the sorted codes at all.
+
+Each import writes a new ``index-<n>`` directory and then swaps
+``manifest.json``, so readers keep a consistent index while an import runs.
+A delta import (``delta=True``) only applies the rows updated after the
+watermark of the previous import (the newest *last update date* seen) and
+merges them into the existing index.
+
+Import from the command line with::
+
+    python -m src.utils.item_master item_master.csv
+    python -m src.utils.item_master item_master_delta.csv --delta
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from src.utils.history_store import description_hash
+
+ITEM_MASTER_DIR = Path(
+    os.environ.get("ORACLE_ITEM_MASTER_DIR")
+    or Path(__file__).resolve().parents[2] / ".item_master"
+)
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+# Index field -> accepted export headers (compared case-insensitively)
+COLUMNS = {
+    "code": ("Item", "Item Number", "Item Code", "ITEM_NUMBER", "SEGMENT1"),
+    "description": ("Description", "Item Description", "DESCRIPTION"),
+    "updated": ("Last Update Date", "LAST_UPDATE_DATE", "Last Updated"),
+}
+
+# Rows converted to arrays at a time while streaming
+CHUNK_ROWS = 100_000
+
+BLOOM_BITS_PER_CODE = 10
+BLOOM_HASHES = 7
+
+# Date formats of the Oracle exports besides ISO 8601
+DATE_FORMATS = ("%d-%b-%Y %H:%M:%S", "%d-%b-%y %H:%M:%S", "%d-%b-%Y", "%d-%b-%y",
+                "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y")
+
+_MASK64 = (1 << 64) - 1
+
+
+class ImportResult(NamedTuple):
+    rows: int
+    skipped: int
+    codes: int
+    watermark: str
+
+
+@lru_cache(maxsize=4096)
+def timestamp(text: str) -> str:
+    """``text`` as an ISO 8601 timestamp, or ``""`` if it is not a date."""
+    text = text.strip()
+    if not text:
+        return ""
+    try:
+        return datetime.fromisoformat(text).isoformat()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).isoformat()
+        except ValueError:
+            continue
+    return ""
+
+
+def code_hash(code: str) -> int:
+    """Unsigned 64-bit hash of an item code (Bloom filter positions)."""
+    return int.from_bytes(hashlib.blake2b(code.encode(), digest_size=8).digest(), "big")
+
+
+def text_hash(description: str) -> int:
+    """Unsigned 64-bit hash of the normalized description; never 0 (empty slot)."""
+    return (description_hash(description) & _MASK64) or 1
+
+
+def _bloom_positions(hashes: np.ndarray, bits: int, k: int) -> np.ndarray:
+    # Double hashing: position i = h1 + i * h2 (mod bits)
+    h1 = hashes & np.uint64(0xFFFFFFFF)
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    return np.stack([(h1 + np.uint64(i) * h2) % np.uint64(bits) for i in range(k)])
+
+
+def _columns(header) -> dict:
+    names = {str(name).strip().casefold(): i for i, name in enumerate(header)}
+    found = {}
+    for field, candidates in COLUMNS.items():
+        found[field] = next((names[c.casefold()] for c in candidates if c.casefold() in names), None)
+    if found["code"] is None:
+        raise ValueError(f"No item code column (expected one of {', '.join(COLUMNS['code'])})")
+    return found
+
+
+def read_export(path, since: str = "", delimiter: str | None = None,
+                skipped: list | None = None) -> Iterator[tuple]:
+    """Stream ``(code, description, updated)`` from an item-master export.
+
+    Rows without a code, and rows last updated at or before ``since`` (an
+    ISO timestamp), are left out; their row numbers are appended to
+    ``skipped`` when given.
+    """
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        if delimiter is None:
+            sample = f.readline()
+            f.seek(0)
+            delimiter = max(",;\t|", key=sample.count)
+        rows = csv.reader(f, delimiter=delimiter)
+        columns = _columns(next(rows, ()))
+        code_at, text_at, updated_at = columns["code"], columns["description"], columns["updated"]
+        for row_number, row in enumerate(rows, start=1):
+            code = row[code_at].strip() if code_at < len(row) else ""
+            updated = timestamp(row[updated_at]) if updated_at is not None and updated_at < len(row) else ""
+            if not code or (since and updated and updated <= since):
+                if skipped is not None:
+                    skipped.append(row_number)
+                continue
+            text = row[text_at] if text_at is not None and text_at < len(row) else ""
+            yield code, text, updated
+
+
+def _collect(rows) -> tuple:
+    """Codes (bytes array) and description hashes of ``rows``, plus the watermark."""
+    code_chunks, hash_chunks = [], []
+    codes, hashes, watermark = [], [], ""
+
+    def flush():
+        if codes:
+            code_chunks.append(np.array(codes, dtype=np.bytes_))
+            hash_chunks.append(np.array(hashes, dtype=np.uint64))
+            codes.clear()
+            hashes.clear()
+
+    for code, text, updated in rows:
+        codes.append(code.encode())
+        hashes.append(text_hash(text))
+        if updated > watermark:
+            watermark = updated
+        if len(codes) == CHUNK_ROWS:
+            flush()
+    flush()
+    if not code_chunks:
+        return np.array([], dtype="S1"), np.array([], dtype=np.uint64), watermark
+    return np.concatenate(code_chunks), np.concatenate(hash_chunks), watermark
+
+
+def _hash_table(hashes: np.ndarray) -> tuple:
+    """Open-addressing table (linear probing) of description hash -> code index."""
+    unique, first = np.unique(hashes, return_index=True)
+    capacity = 8
+    while capacity < 2 * len(unique):
+        capacity *= 2
+    keys = np.zeros(capacity, dtype=np.uint64)
+    values = np.zeros(capacity, dtype=np.uint32)
+    mask = np.uint64(capacity - 1)
+    pending = np.arange(len(unique))
+    probe = np.uint64(0)
+    # Insert every pending key whose slot is free, one probe step per round
+    while len(pending):
+        slots = (unique[pending] + probe) & mask
+        free = keys[slots] == 0
+        slots_free, winners = np.unique(slots[free], return_index=True)
+        placed = pending[free][winners]
+        keys[slots_free] = unique[placed]
+        values[slots_free] = first[placed]
+        done = np.zeros(len(pending), dtype=bool)
+        done[np.flatnonzero(free)[winners]] = True
+        pending = pending[~done]
+        probe += np.uint64(1)
+    return keys, values
+
+
+def _write_index(directory: Path, codes: np.ndarray, hashes: np.ndarray, meta: dict) -> None:
+    manifest_path = directory / MANIFEST
+    previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    generation = previous.get("generation", 0) + 1
+    folder = directory / f"index-{generation}"
+    folder.mkdir(parents=True, exist_ok=True)
+
+    codes.tofile(folder / "codes.bin")
+    hashes.astype(np.uint64).tofile(folder / "hashes.bin")
+    keys, values = _hash_table(hashes)
+    keys.tofile(folder / "table_keys.bin")
+    values.tofile(folder / "table_codes.bin")
+
+    bloom_bits = max(64, -(-len(codes) * BLOOM_BITS_PER_CODE // 64) * 64)
+    bits = np.zeros(bloom_bits, dtype=bool)
+    code_hashes = np.fromiter((code_hash(c.decode()) for c in codes), dtype=np.uint64, count=len(codes))
+    bits[_bloom_positions(code_hashes, bloom_bits, BLOOM_HASHES).ravel()] = True
+    np.packbits(bits, bitorder="little").tofile(folder / "bloom.bin")
+
+    meta = {
+        **meta,
+        "format": FORMAT_VERSION,
+        "generation": generation,
+        "folder": folder.name,
+        "codes": int(len(codes)),
+        "width": int(codes.dtype.itemsize),
+        "capacity": int(len(keys)),
+        "bloom_bits": bloom_bits,
+        "bloom_hashes": BLOOM_HASHES,
+    }
+    tmp = directory / f"{MANIFEST}.tmp"
+    tmp.write_text(json.dumps(meta, indent=2))
+    os.replace(tmp, manifest_path)
+    # Older generations may still be mapped by a reader on some platforms
+    for old in directory.glob("index-*"):
+        if old.name != folder.name:
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def import_export(path, directory: Path = ITEM_MASTER_DIR, delta: bool = False,
+                  delimiter: str | None = None) -> ImportResult:
+    """Build (or, with ``delta``, update) the index in ``directory`` from an export.
+
+    Raises
+    ------
+    ValueError
+        If the export has no item code column, or ``delta`` is set and
+        there is no index to update.
+    """
+    directory = Path(directory)
+    base = None
+    if delta:
+        base = ItemMasterIndex(directory) if (directory / MANIFEST).exists() else None
+        if base is None:
+            raise ValueError(f"No item-master index in {directory} to apply a delta to")
+    skipped = []
+    codes, hashes, watermark = _collect(
+        read_export(path, base.watermark if base else "", delimiter, skipped)
+    )
+    rows = len(codes)
+    # Later rows win: reverse them, put them before the current index and
+    # keep the first occurrence of every code
+    codes, hashes = codes[::-1], hashes[::-1]
+    if base is not None:
+        codes = np.concatenate([codes, np.asarray(base._codes)])
+        hashes = np.concatenate([hashes, np.asarray(base._hashes)])
+        watermark = max(watermark, base.watermark)
+        base.close()
+    codes, first = np.unique(codes, return_index=True)
+    hashes = hashes[first]
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_index(directory, codes, hashes, {
+        "source": Path(path).name,
+        "imported_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "watermark": watermark,
+    })
+    return ImportResult(rows, len(skipped), len(codes), watermark)
+
+
+class ItemMasterIndex:
+    """Memory-mapped item-master index in ``directory``."""
+
+    def __init__(self, directory: Path = ITEM_MASTER_DIR):
+        directory = Path(directory)
+        meta = json.loads((directory / MANIFEST).read_text())
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported item-master index format {meta.get('format')!r}")
+        folder = directory / meta["folder"]
+        count = meta["codes"]
+
+        def mapped(name, dtype, shape):
+            if not shape:
+                return np.zeros(0, dtype=dtype)
+            return np.memmap(folder / name, dtype=dtype, mode="r", shape=(shape,))
+
+        self.meta = meta
+        self._codes = mapped("codes.bin", f"S{meta['width']}", count)
+        self._hashes = mapped("hashes.bin", np.uint64, count)
+        self._keys = mapped("table_keys.bin", np.uint64, meta["capacity"])
+        self._values = mapped("table_codes.bin", np.uint32, meta["capacity"])
+        self._bloom = mapped("bloom.bin", np.uint8, meta["bloom_bits"] // 8)
+
+    def __len__(self):
+        return self.meta["codes"]
+
+    @property
+    def watermark(self) -> str:
+        return self.meta.get("watermark", "")
+
+    def close(self) -> None:
+        for name in ("_codes", "_hashes", "_keys", "_values", "_bloom"):
+            mapped = getattr(self, name)
+            if isinstance(mapped, np.memmap):
+                mapped._mmap.close()
+
+    def _maybe_code(self, code: str) -> bool:
+        # Same positions as _bloom_positions, for one code
+        bits, bloom = self.meta["bloom_bits"], self._bloom
+        h = code_hash(code)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(self.meta["bloom_hashes"]):
+            position = (h1 + i * h2) % bits
+            if not bloom[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def has_code(self, code: str) -> bool:
+        """Whether ``code`` is an item of the item master."""
+        code = code.strip()
+        if not code or not len(self) or not self._maybe_code(code):
+            return False
+        key = code.encode()
+        if len(key) > self._codes.dtype.itemsize:
+            return False
+        i = int(np.searchsorted(self._codes, key))
+        return i < len(self) and self._codes[i] == key
+
+    def codes_with_prefix(self, prefix: str) -> np.ndarray:
+        """Codes starting with ``prefix``, sorted, as a view of the index (two binary searches)."""
+        key = prefix.encode()
+        if not key or not len(self) or len(key) > self._codes.dtype.itemsize:
+            return self._codes[:0]
+        start = int(np.searchsorted(self._codes, key))
+        stop = int(np.searchsorted(self._codes, key + b"\xff"))
+        return self._codes[start:stop]
+
+    def code_for_description(self, description: str) -> str | None:
+        """Code of an item with the same normalized description, if any."""
+        if not len(self) or not description.strip():
+            return None
+        h = text_hash(description)
+        mask = len(self._keys) - 1
+        slot = h & mask
+        while True:
+            key = int(self._keys[slot])
+            if key == 0:
+                return None
+            if key == h:
+                return self._codes[int(self._values[slot])].decode()
+            slot = (slot + 1) & mask
+
+
+_OPEN = {}
+
+
+def open_index(directory: Path = ITEM_MASTER_DIR) -> ItemMasterIndex | None:
+    """Index in ``directory`` as last imported, or None if nothing was imported.
+
+    The index is reopened when an import replaces the manifest.
+    """
+    manifest = Path(directory) / MANIFEST
+    try:
+        stamp = manifest.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _OPEN.get(manifest)
+    if cached is None or cached[0] != stamp:
+        cached = _OPEN[manifest] = (stamp, ItemMasterIndex(directory))
+    return cached[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Index the Oracle item-master export for existing code and description checks."
+    )
+    parser.add_argument("export", type=Path, help="item-master export (.csv)")
+    parser.add_argument("--index", type=Path, default=ITEM_MASTER_DIR, help="index directory")
+    parser.add_argument("--delta", action="store_true",
+                        help="apply only the rows updated after the last import")
+    parser.add_argument("--delimiter", help="field separator (default: guessed from the header)")
+    args = parser.parse_args(argv)
+
+    result = import_export(args.export, args.index, args.delta, args.delimiter)
+    print(f"{result.rows} rows imported ({result.skipped} skipped), "
+          f"{result.codes} item codes in {args.index}, watermark {result.watermark or '-'}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""Rerun scoping shared by the part forms.
+
+By default every widget of the input column reruns the whole script as soon
+as it changes.  With the *form input* toggle on, :func:`input_form` wraps
+the input column in an ``st.form``: edits are collected in the browser and
+the script reruns once, when "Generate Output" is pressed.  The selects that
+change the options of other inputs (pump model -> sizes and features,
+material type -> prefixes -> names ...) are rendered in
+:func:`option_inputs`, above the form: they still rerun the script, so the
+dependent lists are filled before the one submit.
+
+The output and DataLoad columns are rendered as fragments (``st.fragment``),
+so editing the item code or pressing a DataLoad button reruns that column
+alone.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import streamlit as st
+
+# Session key of the form input toggle
+FORM_INPUT_KEY = "form_input"
+
+# Container above the form of the input column being rendered (form input mode)
+_OPTION_INPUTS = ContextVar("option_inputs", default=None)
+
+
+def form_input() -> bool:
+    """Whether the input columns are batched in a form."""
+    return bool(st.session_state.get(FORM_INPUT_KEY, False))
+
+
+def render_form_input_toggle():
+    st.sidebar.toggle(
+        "Submit inputs with Generate Output",
+        key=FORM_INPUT_KEY,
+        help="Rerun the page only when the output is generated, not at every input change.",
+    )
+
+
+@contextmanager
+def input_form(key: str):
+    """Input column of a part, inside an ``st.form`` in form input mode."""
+    if form_input():
+        options = st.container()
+        token = _OPTION_INPUTS.set(options)
+        try:
+            with st.form(f"{key}_form", border=False):
+                yield
+        finally:
+            _OPTION_INPUTS.reset(token)
+    else:
+        yield
+
+
+@contextmanager
+def option_inputs():
+    """Inputs that change the options of others, kept out of the form.
+
+    In form input mode they go above the form of :func:`input_form` and
+    rerun the script when changed; otherwise they stay where they are.
+    """
+    options = _OPTION_INPUTS.get()
+    if options is None:
+        yield
+    else:
+        with options:
+            yield
+
+
+def generate_button(key: str | None = None) -> bool:
+    """The "Generate Output" button, submitting the form in form input mode."""
+    if form_input():
+        return st.form_submit_button("Generate Output", key=key)
+    return st.button("Generate Output", key=key)
+
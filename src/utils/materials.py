@@ -1,37 +1,26 @@
 import streamlit as st
-import pandas as pd
-
-
-def render_material_selector(prefix: str, material_types, materials_df):
-    mtype = st.selectbox("Material Type", [""] + material_types, key=f"{prefix}_mtype")
-    pref_df = materials_df[(materials_df["Material Type"] == mtype) & (materials_df["Prefix"].notna())]
-    prefixes = sorted(pref_df["Prefix"].unique()) if mtype != "MISCELLANEOUS" else []
-    mprefix = st.selectbox("Material Prefix", [""] + prefixes, key=f"{prefix}_mprefix")
-    if mtype == "MISCELLANEOUS":
-        names = materials_df[materials_df["Material Type"] == mtype]["Name"].dropna().tolist()
-    else:
-        names = materials_df[(materials_df["Material Type"] == mtype) & (materials_df["Prefix"] == mprefix)]["Name"].dropna().tolist()
-    mname = st.selectbox("Material Name", [""] + names, key=f"{prefix}_mname")
-    material_note = st.text_area("Material note", height=60, key=f"{prefix}_matnote")
-    match = materials_df[(materials_df["Material Type"] == mtype) & (materials_df["Prefix"] == mprefix) & (materials_df["Name"] == mname)]
-    codice_fpd = match["FPD Code"].values[0] if not match.empty else ""
-    materiale = f"{mtype} {mprefix} {mname}".strip() if mtype != "MISCELLANEOUS" else mname
-    return materiale, codice_fpd, material_note, mtype, mprefix, mname
-
-
-def select_material(materials_df: pd.DataFrame, key_prefix: str):
+
+from src.utils.materials_index import MaterialsIndex, material_label
+from src.utils.layout import option_inputs
+from src.utils.search import search_input, search_select
+
+
+def render_material_selector(prefix: str, materials_index: MaterialsIndex):
+    return select_material(materials_index, prefix)
+
+
+def select_material(materials_index: MaterialsIndex, key_prefix: str):
     """Render a material selection widget and return chosen values.
 
     This helper encapsulates the common logic used throughout the app for
     material type/prefix/name lookup and FPD code retrieval.  It exposes a
-    uniform interface so callers only need to provide the dataframe and a key
-    prefix for the Streamlit widgets.
+    uniform interface so callers only need to provide the materials index and
+    a key prefix for the Streamlit widgets.
 
     Parameters
     ----------
-    materials_df: pandas.DataFrame
-        DataFrame containing columns ``Material Type``, ``Prefix``, ``Name``
-        and ``FPD Code``.
+    materials_index: MaterialsIndex
+        Index built from the materials table at catalog load time.
     key_prefix: str
         Prefix used to generate unique keys for the Streamlit widgets.
 
@@ -42,84 +31,48 @@ def select_material(materials_df: pd.DataFrame, key_prefix: str):
         ``materiale`` is the human readable material string and ``fpd_code`` is
         the associated FPD code (empty string if not found).
     """
+    if search_input():
+        return _search_material(materials_index, key_prefix)
 
-    material_types = materials_df["Material Type"].dropna().unique().tolist()
+    # Each select fills the options of the next one
+    with option_inputs():
+        mtype = st.selectbox(
+            "Material Type", [""] + list(materials_index.types), key=f"{key_prefix}_mtype"
+        )
 
-    mtype = st.selectbox(
-        "Material Type", [""] + material_types, key=f"{key_prefix}_mtype"
-    )
+        prefixes = materials_index.prefixes(mtype) if mtype != "MISCELLANEOUS" else ()
+        mprefix = st.selectbox(
+            "Material Prefix", [""] + list(prefixes), key=f"{key_prefix}_mprefix"
+        )
 
-    pref_df = materials_df[
-        (materials_df["Material Type"] == mtype) & (materials_df["Prefix"].notna())
-    ]
-    prefixes = sorted(pref_df["Prefix"].unique()) if mtype != "MISCELLANEOUS" else []
-    mprefix = st.selectbox(
-        "Material Prefix", [""] + prefixes, key=f"{key_prefix}_mprefix"
-    )
+        if mtype == "MISCELLANEOUS":
+            names = materials_index.names_for_type(mtype)
+        else:
+            names = materials_index.names(mtype, mprefix)
 
-    if mtype == "MISCELLANEOUS":
-        names = (
-            materials_df[materials_df["Material Type"] == mtype]["Name"].dropna().tolist()
+        mname = st.selectbox(
+            "Material Name", [""] + list(names), key=f"{key_prefix}_mname"
         )
-    else:
-        names = materials_df[
-            (materials_df["Material Type"] == mtype)
-            & (materials_df["Prefix"] == mprefix)
-        ]["Name"].dropna().tolist()
-
-    mname = st.selectbox(
-        "Material Name", [""] + names, key=f"{key_prefix}_mname"
-    )
     material_note = st.text_area(
         "Material note", height=60, key=f"{key_prefix}_matnote"
     )
 
-    match = materials_df[
-        (materials_df["Material Type"] == mtype)
-        & (materials_df["Prefix"] == mprefix)
-        & (materials_df["Name"] == mname)
-    ]
-    fpd_code = match["FPD Code"].values[0] if not match.empty else ""
-
-    materiale = (
-        f"{mtype} {mprefix} {mname}".strip() if mtype != "MISCELLANEOUS" else mname
-    )
+    fpd_code = materials_index.fpd_code(mtype, mprefix, mname)
+    materiale = material_label(mtype, mprefix, mname)
 
     return materiale, fpd_code, material_note, mtype, mprefix, mname
 
 
-def get_fpd_code(materials_df: pd.DataFrame, mat_type, mat_prefix, mat_name):
-    row = materials_df[
-        (materials_df["Material Type"] == mat_type)
-        & (materials_df["Prefix"] == mat_prefix)
-        & (materials_df["Name"] == mat_name)
-    ]
-    if not row.empty and "FPD Code" in row.columns:
-        return row.iloc[0]["FPD Code"]
-    return "NOT AVAILABLE"
-
-
-def get_casting_code(dfm: pd.DataFrame) -> str:
-    """Extract the last two characters of the casting code.
-
-    Parameters
-    ----------
-    dfm : pandas.DataFrame
-        DataFrame potentially containing a ``Casting code`` column.
-
-    Returns
-    -------
-    str
-        The last two characters of the ``Casting code`` value in the first row
-        of ``dfm``.  If the dataframe is empty, the column is missing or the
-        value is null, the default ``"XX"`` is returned.
-    """
-
-    if dfm.empty or "Casting code" not in dfm.columns:
-        return "XX"
-
-    value = dfm.iloc[0].get("Casting code")
-    if pd.isna(value):
-        return "XX"
-
-    return str(value)[-2:]
+def _search_material(materials_index: MaterialsIndex, key_prefix: str):
+    """:func:`select_material` as one search selector over every material."""
+    entry = search_select(
+        "Material", materials_index.search, f"{key_prefix}_material",
+        format_func=lambda e: " ".join(filter(None, e)),
+    )
+    mtype, mprefix, mname = entry or ("", "", "")
+    material_note = st.text_area(
+        "Material note", height=60, key=f"{key_prefix}_matnote"
+    )
+    fpd_code = materials_index.fpd_code(mtype, mprefix, mname)
+    materiale = material_label(mtype, mprefix, mname)
+    return materiale, fpd_code, material_note, mtype, mprefix, mname
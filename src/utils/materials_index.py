@@ -0,0 +1,216 @@
+"""Material lookups over the catalog materials table (no Streamlit)."""
+
+from functools import cached_property
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils.frozen import Frozen, frozen_mapping
+from src.utils.quality_rules import MATERIAL_KEYS
+
+NO_FLAGS = frozenset()
+
+
+class MaterialRow(NamedTuple):
+    """Lookup result for one ``(type, prefix, name)`` material.
+
+    ``flags`` holds the names of the material classes of the quality rules
+    (``"CG"``, ``"SQ121"`` ...) the material belongs to.
+    """
+
+    fpd_code: object
+    casting_code: object
+    display: str
+    flags: frozenset = NO_FLAGS
+
+
+def material_label(mtype, mprefix, mname) -> str:
+    """Human readable material string shown in descriptions."""
+    if mtype == "MISCELLANEOUS":
+        return mname
+    return f"{mtype} {mprefix} {mname}".strip()
+
+
+class MaterialsIndex(Frozen):
+    """Dictionary based lookups over the materials table.
+
+    Built once when the catalog is loaded so that widgets and generators
+    resolve material types, prefixes, names and codes without scanning
+    ``materials_df`` on every rerun.  Given the material classes of the
+    quality rules, each class is evaluated once over the whole table and
+    every row keeps the names of its classes in :attr:`MaterialRow.flags`.
+    """
+
+    def __init__(self, types, prefixes, names, type_names, rows, classes=None):
+        self._init_attrs(
+            types=types,
+            _prefixes=frozen_mapping(prefixes),
+            _names=frozen_mapping(names),
+            _type_names=frozen_mapping(type_names),
+            _rows=frozen_mapping(rows),
+            _classes=frozen_mapping(classes or {}),
+            _unlisted={},
+        )
+
+    @classmethod
+    def from_frame(cls, materials_df: pd.DataFrame, classes=None) -> "MaterialsIndex":
+        """Index of ``materials_df``.
+
+        ``classes`` maps class names to
+        :class:`~src.utils.quality_rules.MaterialClass` (see
+        :func:`~src.utils.quality_rules.material_classes`).
+        """
+        types = []
+        prefixes = {}
+        names = {}
+        type_names = {}
+        rows = {}
+        columns = ["Material Type", "Prefix", "Name"]
+        fpd = materials_df["FPD Code"] if "FPD Code" in materials_df else None
+        casting = (
+            materials_df["Casting code"] if "Casting code" in materials_df else None
+        )
+        keys = materials_df[columns].set_axis(list(MATERIAL_KEYS), axis=1)
+        flag_columns = {
+            name: material_class.frame_mask(keys)
+            for name, material_class in (classes or {}).items()
+        }
+        for i, (mtype, mprefix, mname) in enumerate(
+            materials_df[columns].itertuples(index=False, name=None)
+        ):
+            if pd.isna(mtype):
+                continue
+            if mtype not in prefixes:
+                types.append(mtype)
+                prefixes[mtype] = set()
+                type_names[mtype] = []
+            if pd.isna(mprefix):
+                if not pd.isna(mname):
+                    type_names[mtype].append(mname)
+                continue
+            prefixes[mtype].add(mprefix)
+            if pd.isna(mname):
+                continue
+            type_names[mtype].append(mname)
+            names.setdefault((mtype, mprefix), []).append(mname)
+            rows.setdefault(
+                (mtype, mprefix, mname),
+                MaterialRow(
+                    fpd.iat[i] if fpd is not None else None,
+                    casting.iat[i] if casting is not None else None,
+                    material_label(mtype, mprefix, mname),
+                    frozenset(n for n, column in flag_columns.items() if column[i]) or NO_FLAGS,
+                ),
+            )
+        return cls(
+            tuple(types),
+            {t: tuple(sorted(p)) for t, p in prefixes.items()},
+            {k: tuple(v) for k, v in names.items()},
+            {t: tuple(v) for t, v in type_names.items()},
+            rows,
+            classes,
+        )
+
+    def prefixes(self, mtype) -> tuple:
+        """Sorted prefixes available for ``mtype``."""
+        return self._prefixes.get(mtype, ())
+
+    def names(self, mtype, mprefix) -> tuple:
+        """Material names for ``(mtype, mprefix)`` in catalog order."""
+        return self._names.get((mtype, mprefix), ())
+
+    def names_for_type(self, mtype) -> tuple:
+        """Every material name of ``mtype`` regardless of prefix."""
+        return self._type_names.get(mtype, ())
+
+    def row(self, mtype, mprefix, mname) -> Optional[MaterialRow]:
+        """Return the catalog row for the material, or ``None``."""
+        return self._rows.get((mtype, mprefix, mname))
+
+    def flags(self, mtype, mprefix, mname) -> frozenset:
+        """Material classes of the material.
+
+        Catalog materials answer from their row; a material typed outside
+        the catalog (e.g. in a batch spec) is classified once and memoized.
+        """
+        row = self._rows.get((mtype, mprefix, mname))
+        if row is not None:
+            return row.flags
+        key = (mtype, mprefix, mname)
+        try:
+            return self._unlisted[key]
+        except KeyError:
+            pass
+        flags = frozenset(
+            name for name, material_class in self._classes.items()
+            if material_class.matches(mtype, mprefix, mname)
+        ) or NO_FLAGS
+        self._unlisted[key] = flags
+        return flags
+
+    @cached_property
+    def search(self):
+        """:class:`~src.utils.search_index.SearchIndex` of ``type prefix name``
+        over every material; its values are ``(type, prefix, name)``."""
+        from src.utils.search_index import SearchIndex, material_entries
+
+        entries = material_entries(self)
+        return SearchIndex((" ".join(filter(None, entry)) for entry in entries), entries)
+
+    def fpd_code(self, mtype, mprefix, mname, default=""):
+        """FPD code of the material, ``default`` when it is not in the catalog."""
+        row = self.row(mtype, mprefix, mname)
+        return row.fpd_code if row is not None else default
+
+
+def get_fpd_code(materials_index: MaterialsIndex, mat_type, mat_prefix, mat_name):
+    return materials_index.fpd_code(mat_type, mat_prefix, mat_name, "NOT AVAILABLE")
+
+
+def casting_suffix(value) -> str:
+    """Last two characters of a casting code, ``"XX"`` when missing."""
+    if value is None or pd.isna(value):
+        return "XX"
+    return str(value)[-2:]
+
+
+def filter_materials(materials_df: pd.DataFrame, mtype=None, mprefix=None,
+                     mname=None) -> pd.DataFrame:
+    """Rows of the catalog materials table matching the given keys.
+
+    Keys left to ``None`` are not filtered on.  The key columns are
+    categoricals (see :data:`src.utils.catalog.CATEGORICAL_COLUMNS`), so each
+    condition is an integer comparison on the category codes.
+    """
+    from src.utils.catalog import category_mask
+
+    mask = np.ones(len(materials_df), dtype=bool)
+    for column, value in (
+        ("Material Type", mtype), ("Prefix", mprefix), ("Name", mname)
+    ):
+        if value is not None:
+            mask &= category_mask(materials_df[column], value)
+    return materials_df[mask]
+
+
+def get_casting_code(dfm: pd.DataFrame) -> str:
+    """Extract the last two characters of the casting code.
+
+    Parameters
+    ----------
+    dfm : pandas.DataFrame
+        DataFrame potentially containing a ``Casting code`` column.
+
+    Returns
+    -------
+    str
+        The last two characters of the ``Casting code`` value in the first row
+        of ``dfm``.  If the dataframe is empty, the column is missing or the
+        value is null, the default ``"XX"`` is returned.
+    """
+
+    if dfm.empty or "Casting code" not in dfm.columns:
+        return "XX"
+
+    return casting_suffix(dfm.iloc[0].get("Casting code"))
@@ -0,0 +1,69 @@
+"""Natural ordering of dropdown options (no Streamlit).
+
+Option labels are compared chunk by chunk: runs of digits, decimals,
+fractions (``5/16``), mixed fractions (``1-1/4``) and number screw gauges
+(``#10``, by their diameter in inches) compare by their value, the text
+between them case-insensitively.  So ``M8`` sorts before ``M10``,
+``#10-24UNC`` before ``5/16"-18UNC`` and ``Ø1.5`` before ``Ø10``.
+
+:func:`sorted_options` memoizes the sorted tuple of each option list, so a
+list seen on an earlier rerun is not sorted again.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from src.utils.sizes import NUMBER_PATTERN, number_value
+
+_NUMBER = re.compile(NUMBER_PATTERN)
+
+# Chunk kinds: numbers sort before text at the same position
+NUMBER, TEXT = 0, 1
+
+
+@lru_cache(maxsize=65536)
+def _text_key(text: str) -> tuple:
+    chunks, pos = [], 0
+    for match in _NUMBER.finditer(text):
+        if match.start() > pos:
+            chunks.append((TEXT, text[pos:match.start()].casefold()))
+        chunks.append((NUMBER, number_value(match.groups())))
+        pos = match.end()
+    if pos < len(text):
+        chunks.append((TEXT, text[pos:].casefold()))
+    return tuple(chunks)
+
+
+def natural_key(value) -> tuple:
+    """Sort key of an option; ties fall back to the option text."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return ((NUMBER, float(value)),), str(value)
+    text = str(value)
+    return _text_key(text), text
+
+
+def _sort(options) -> tuple:
+    items = list(options)
+    # Empty placeholders stay on top
+    placeholders = [item for item in items if item == ""]
+    return tuple(placeholders + sorted((item for item in items if item != ""), key=natural_key))
+
+
+@lru_cache(maxsize=256)
+def _sorted_cached(options: tuple) -> tuple:
+    return _sort(options)
+
+
+def sorted_options(options) -> tuple:
+    """``options`` in natural order, empty placeholders first.
+
+    The result is cached on the content of the list; lists with unhashable
+    options are sorted every time.
+    """
+    options = tuple(options)
+    try:
+        return _sorted_cached(options)
+    except TypeError:
+        return _sort(options)
@@ -0,0 +1,52 @@
+"""Pump model, size and feature lookups."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from src.utils.frozen import Frozen, frozen_mapping
+
+
+class PumpCatalog(Frozen):
+    """Lookup tables over the "Pump Size" and "Features" sheets.
+
+    Built once when the catalog is loaded; widgets read the pre-sorted model
+    list and the per-model sizes/features instead of filtering the sheets on
+    every rerun.
+    """
+
+    def __init__(self, models, sizes, features):
+        self._init_attrs(
+            models=models,
+            _sizes=frozen_mapping(sizes),
+            _features=frozen_mapping(features),
+        )
+
+    @classmethod
+    def from_frames(cls, size_df: pd.DataFrame, features_df: pd.DataFrame) -> "PumpCatalog":
+        sizes = {}
+        for model, size in size_df[["Pump Model", "Size"]].itertuples(index=False, name=None):
+            if pd.isna(model) or pd.isna(size):
+                continue
+            sizes.setdefault(model, {})[size] = None
+
+        features = {}
+        columns = ["Pump Model", "Feature Type", "Feature"]
+        for model, ftype, feature in features_df[columns].itertuples(index=False, name=None):
+            if pd.isna(feature):
+                continue
+            features.setdefault((model, ftype), []).append(feature)
+
+        return cls(
+            tuple(sorted(size_df["Pump Model"].dropna().unique())),
+            {model: tuple(s) for model, s in sizes.items()},
+            {key: tuple(f) for key, f in features.items()},
+        )
+
+    def sizes(self, model) -> tuple:
+        """Unique sizes of ``model`` in catalog order."""
+        return self._sizes.get(model, ())
+
+    def features(self, model, feature_type: str = "features1") -> tuple:
+        """Features of ``feature_type`` available for ``model``."""
+        return self._features.get((model, feature_type), ())
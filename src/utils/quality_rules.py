@@ -0,0 +1,383 @@
+"""Quality tags and lines of an item, compiled from ``assets/quality_rules.json``.
+
+The rules file has three sections:
+
+``materials``
+    Named material classes.  A class lists any of ``types``, ``prefixes``
+    and ``names`` (every list given must contain the material's value) or
+    ``pairs`` of ``[prefix, name]``.
+``lines``
+    The quality line printed for each tag.
+``rulesets``
+    Each ruleset lists the ``parts`` it applies to and its ``rules`` in tag
+    order.  A rule emits its ``tag`` and line (``line`` overrides the shared
+    text) when all of its conditions hold: ``parts`` / ``except_parts``,
+    ``flag`` (a spec flag is set), ``spec`` (``{key: [values]}``) and
+    ``material`` (a material class).  ``lines_first`` moves the lines of some
+    tags to the top of the quality text; ``standard`` marks the default tags.
+
+The material classes are resolved once per catalog: every row of the
+materials index carries the names of its classes (see
+:meth:`src.utils.materials_index.MaterialsIndex.flags`), so a material
+condition is a set lookup instead of a comparison of names.
+
+The rules are compiled once per catalog into a :class:`PartRules` per part.
+Part conditions are resolved at compile time; every other condition becomes
+one bit of the item's *facts* word and each rule keeps the mask of the facts
+it requires, so a rule fires when ``facts & require == require``.  The rule
+mask of each facts word and the :class:`QualityResult` of each rule mask are
+memoized, so evaluating an item costs its condition tests and two dictionary
+lookups, and the tag and line texts of a result are joined once.
+:meth:`PartRules.frame_facts` and :meth:`PartRules.masks` evaluate a whole
+table of specs with numpy; they serve callers that hold their specs as a
+table.  :func:`src.engine.batch.generate_batch` does not use them: each row
+goes through its part generator, which evaluates the rules of that item.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property, lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils.data import load_data
+from src.utils.frozen import Frozen, frozen_mapping
+
+# Spec keys of the selected material
+MATERIAL_KEYS = ("material_type", "material_prefix", "material_name")
+
+# Text values of a flag that count as set
+TRUE_TEXT = frozenset({"1", "true", "yes", "y", "x"})
+
+# Facts and rules of a part are packed in 64-bit words
+MAX_BITS = 64
+
+
+def flag_value(value) -> bool:
+    """Boolean spec value; text such as ``"Yes"`` or ``"true"`` counts as set."""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_TEXT
+    return bool(value)
+
+
+class MaterialClass(NamedTuple):
+    """Materials matching every given list (``None``: any value)."""
+
+    types: Optional[frozenset] = None
+    prefixes: Optional[frozenset] = None
+    names: Optional[frozenset] = None
+    pairs: Optional[frozenset] = None
+
+    @classmethod
+    def from_data(cls, data) -> "MaterialClass":
+        def values(key):
+            return frozenset(data[key]) if key in data else None
+
+        pairs = frozenset(map(tuple, data["pairs"])) if "pairs" in data else None
+        return cls(values("types"), values("prefixes"), values("names"), pairs)
+
+    def matches(self, mtype, mprefix, mname) -> bool:
+        return (
+            (self.types is None or mtype in self.types)
+            and (self.prefixes is None or mprefix in self.prefixes)
+            and (self.names is None or mname in self.names)
+            and (self.pairs is None or (mprefix, mname) in self.pairs)
+        )
+
+    def frame_mask(self, frame: pd.DataFrame) -> np.ndarray:
+        """Rows of ``frame`` (one column per material spec key) in the class."""
+        mtype, mprefix, mname = (_column(frame, key) for key in MATERIAL_KEYS)
+        mask = np.ones(len(frame), dtype=bool)
+        for column, values in ((mtype, self.types), (mprefix, self.prefixes),
+                               (mname, self.names)):
+            if values is not None:
+                mask &= column.isin(values).to_numpy()
+        if self.pairs is not None:
+            keys = mprefix.astype(str) + "\x1f" + mname.astype(str)
+            mask &= keys.isin({f"{p}\x1f{n}" for p, n in self.pairs}).to_numpy()
+        return mask
+
+
+def material_classes(data) -> dict:
+    """Material class name -> :class:`MaterialClass` of a rules file."""
+    return {name: MaterialClass.from_data(m) for name, m in data["materials"].items()}
+
+
+def _column(frame: pd.DataFrame, key) -> pd.Series:
+    if key in frame:
+        return frame[key]
+    return pd.Series("", index=frame.index, dtype=object)
+
+
+class Condition(NamedTuple):
+    """A per-item test.
+
+    ``arg`` is a flag name, ``(key, values)`` or ``(class name, class)``.
+    """
+
+    kind: str
+    arg: object
+
+    def test(self, spec, flags=None) -> bool:
+        """Whether ``spec`` meets the condition.
+
+        ``flags`` are the material classes of the spec's material, as given by
+        the materials index; without them the class is matched on the names.
+        """
+        if self.kind == "flag":
+            return flag_value(spec.get(self.arg, False))
+        if self.kind == "spec":
+            key, values = self.arg
+            return spec.get(key) in values
+        name, material_class = self.arg
+        if flags is not None:
+            return name in flags
+        return material_class.matches(*(spec.get(key, "") for key in MATERIAL_KEYS))
+
+    def frame_mask(self, frame: pd.DataFrame) -> np.ndarray:
+        if self.kind == "flag":
+            column = _column(frame, self.arg)
+            if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column):
+                return column.fillna(0).astype(bool).to_numpy()
+            text = column.astype("string").str.strip().str.lower()
+            return text.isin(TRUE_TEXT).fillna(False).to_numpy(dtype=bool)
+        if self.kind == "spec":
+            key, values = self.arg
+            return _column(frame, key).isin(values).to_numpy()
+        return self.arg[1].frame_mask(frame)
+
+
+class QualityResult(Frozen):
+    """Quality tags and lines of an item.
+
+    ``tags`` are the tag IDs (``"[SQ58]"``, ``"<SQ113>"`` ...) in description
+    order and ``lines`` the quality lines in print order, as shared by the
+    compiled rules.  Results are immutable and hashable; the texts are only
+    joined when first asked for and then kept, and items with the same rules
+    share one result.
+    """
+
+    def __init__(self, tags=(), lines=()):
+        self._init_attrs(tags=tuple(tags), lines=tuple(lines))
+
+    def __eq__(self, other):
+        if not isinstance(other, QualityResult):
+            return NotImplemented
+        return self.tags == other.tags and self.lines == other.lines
+
+    def __hash__(self):
+        return hash((self.tags, self.lines))
+
+    def __bool__(self):
+        return bool(self.tags)
+
+    def __repr__(self):
+        return f"QualityResult({self.tags!r})"
+
+    @cached_property
+    def tag_text(self) -> str:
+        """Tags separated by spaces, as appended to the description."""
+        return " ".join(self.tags)
+
+    @cached_property
+    def suffix(self) -> str:
+        """``" " + tag_text``, or ``""`` without tags."""
+        return " " + self.tag_text if self.tags else ""
+
+    @cached_property
+    def text(self) -> str:
+        """Lines separated by newlines, the "Quality" field."""
+        return "\n".join(self.lines)
+
+    def inserted(self, extra, before: Optional[str] = None) -> "QualityResult":
+        """Result with the ``(tag, line)`` pairs of ``extra`` added before tag
+        ``before`` (at the end when ``before`` is not set)."""
+        if not extra:
+            return self
+        at = self.tags.index(before) if before in self.tags else len(self.tags)
+        return QualityResult(
+            self.tags[:at] + tuple(tag for tag, _ in extra) + self.tags[at:],
+            self.lines[:at] + tuple(line for _, line in extra) + self.lines[at:],
+        )
+
+
+NO_QUALITY = QualityResult()
+
+
+class Rule(NamedTuple):
+    tag: str
+    line: str
+    require: int
+    standard: bool
+
+
+class PartRules(Frozen):
+    """The compiled rules of one part.
+
+    ``conditions[i]`` sets bit ``i`` of the facts word and ``rules[j]`` sets
+    bit ``j`` of the rule mask.  ``uses_materials`` tells whether any rule
+    depends on the material classes.
+    """
+
+    def __init__(self, conditions, rules, line_order):
+        if len(conditions) > MAX_BITS or len(rules) > MAX_BITS:
+            raise ValueError(f"At most {MAX_BITS} conditions and rules per part")
+        standard = 0
+        for j, rule in enumerate(rules):
+            if rule.standard:
+                standard |= 1 << j
+        self._init_attrs(
+            conditions=tuple(conditions),
+            rules=tuple(rules),
+            standard=standard,
+            uses_materials=any(c.kind == "material" for c in conditions),
+            _line_order=tuple(line_order),
+            _masks={},
+            _rendered={},
+        )
+
+    def facts(self, spec, flags=None) -> int:
+        facts = 0
+        for i, condition in enumerate(self.conditions):
+            if condition.test(spec, flags):
+                facts |= 1 << i
+        return facts
+
+    def mask(self, facts: int) -> int:
+        """Rule mask of the facts word ``facts``."""
+        try:
+            return self._masks[facts]
+        except KeyError:
+            pass
+        mask = 0
+        for j, rule in enumerate(self.rules):
+            if facts & rule.require == rule.require:
+                mask |= 1 << j
+        self._masks[facts] = mask
+        return mask
+
+    def render(self, mask: int) -> QualityResult:
+        """Result of the rules set in ``mask``."""
+        try:
+            return self._rendered[mask]
+        except KeyError:
+            pass
+        result = QualityResult(
+            (rule.tag for j, rule in enumerate(self.rules) if mask >> j & 1),
+            (self.rules[j].line for j in self._line_order if mask >> j & 1),
+        ) if mask else NO_QUALITY
+        self._rendered[mask] = result
+        return result
+
+    def evaluate(self, spec, flags=None) -> QualityResult:
+        """Result of the item ``spec``; see :meth:`Condition.test`."""
+        return self.render(self.mask(self.facts(spec, flags)))
+
+    def frame_facts(self, frame: pd.DataFrame) -> np.ndarray:
+        """Facts words of every row of ``frame``, one column per spec key."""
+        facts = np.zeros(len(frame), dtype=np.uint64)
+        for i, condition in enumerate(self.conditions):
+            facts |= condition.frame_mask(frame).astype(np.uint64) << np.uint64(i)
+        return facts
+
+    def masks(self, facts: np.ndarray) -> np.ndarray:
+        """Rule masks of an array of facts words."""
+        facts = np.asarray(facts, dtype=np.uint64)
+        masks = np.zeros(len(facts), dtype=np.uint64)
+        for j, rule in enumerate(self.rules):
+            require = np.uint64(rule.require)
+            masks |= ((facts & require) == require).astype(np.uint64) << np.uint64(j)
+        return masks
+
+    def evaluate_frame(self, frame: pd.DataFrame) -> list:
+        """:class:`QualityResult` of every row of ``frame``.
+
+        Library entry point for tabular callers; the item generators and
+        the batch use :meth:`evaluate`.
+        """
+        masks = self.masks(self.frame_facts(frame))
+        unique, inverse = np.unique(masks, return_inverse=True)
+        rendered = [self.render(int(mask)) for mask in unique]
+        return [rendered[i] for i in inverse]
+
+
+def _applies(rule, part) -> bool:
+    if "parts" in rule and part not in rule["parts"]:
+        return False
+    return part not in rule.get("except_parts", ())
+
+
+def compile_part(data, ruleset: str, part=None) -> PartRules:
+    """Compile the rules of ``ruleset`` that apply to ``part``.
+
+    With ``part=None`` only the rules without a ``parts`` list are kept.
+    """
+    classes = material_classes(data)
+    lines = data["lines"]
+    declared = data["rulesets"][ruleset]
+    conditions = {}
+    rules = []
+    for rule in declared["rules"]:
+        if not _applies(rule, part):
+            continue
+        tests = []
+        if "flag" in rule:
+            tests.append(Condition("flag", rule["flag"]))
+        for key, values in rule.get("spec", {}).items():
+            tests.append(Condition("spec", (key, frozenset(values))))
+        if "material" in rule:
+            name = rule["material"]
+            tests.append(Condition("material", (name, classes[name])))
+        require = 0
+        for test in tests:
+            require |= 1 << conditions.setdefault(test, len(conditions))
+        tag = rule["tag"]
+        rules.append(Rule(tag, rule.get("line", lines.get(tag, "")), require,
+                          rule.get("standard", False)))
+    first = declared.get("lines_first", ())
+    line_order = sorted(range(len(rules)), key=lambda j: (
+        first.index(rules[j].tag) if rules[j].tag in first else len(first), j
+    ))
+    return PartRules(conditions, rules, line_order)
+
+
+class QualityRules(Frozen):
+    """Compiled :class:`PartRules` of every part named in a rules file."""
+
+    def __init__(self, parts, generic=None):
+        self._init_attrs(_parts=frozen_mapping(parts), _generic=frozen_mapping(generic or {}))
+
+    @classmethod
+    def from_data(cls, data) -> "QualityRules":
+        parts = {}
+        for name, ruleset in data["rulesets"].items():
+            for part in ruleset["parts"]:
+                if part in parts:
+                    raise ValueError(f"Part {part!r} is in more than one ruleset")
+                parts[part] = compile_part(data, name, part)
+        generic = {name: compile_part(data, name) for name in data["rulesets"]}
+        return cls(parts, generic)
+
+    @property
+    def parts(self) -> tuple:
+        return tuple(self._parts)
+
+    def part(self, part) -> PartRules:
+        """Rules of ``part``; raises ``KeyError`` for a part without rules."""
+        return self._parts[part]
+
+    def generic(self, ruleset) -> PartRules:
+        """Rules of ``ruleset`` that are not tied to a specific part."""
+        return self._generic[ruleset]
+
+    def evaluate(self, part, spec, flags=None) -> QualityResult:
+        """Result of item ``spec`` of ``part``."""
+        return self._parts[part].evaluate(spec, flags)
+
+
+@lru_cache(maxsize=None)
+def default_rules() -> QualityRules:
+    """Rules of ``assets/quality_rules.json``, compiled once per process."""
+    return QualityRules.from_data(load_data("quality_rules"))
@@ -0,0 +1,65 @@
+"""Search-style selectors for the long option lists.
+
+A ``st.selectbox`` sends all of its options to the browser at every rerun.
+With the *search* toggle on, the SKF model, bolt size/length and material
+selectors become a text box plus a selectbox holding only the top matches
+of the typed text (see :class:`src.utils.search_index.SearchIndex`).
+"""
+
+import streamlit as st
+
+from src.utils.layout import option_inputs
+from src.utils.search_index import SearchIndex
+
+# Session key of the search toggle
+SEARCH_INPUT_KEY = "search_input"
+
+# Matches sent to the browser per selector
+SEARCH_LIMIT = 20
+
+
+class RankedOptions(list):
+    """Selectbox options already in display order (best match first).
+
+    The app sorts the options of every ``st.selectbox``; it leaves these as
+    they are.
+    """
+
+
+def search_input() -> bool:
+    """Whether the long lists are shown as search selectors."""
+    return bool(st.session_state.get(SEARCH_INPUT_KEY, False))
+
+
+def render_search_toggle():
+    st.sidebar.toggle(
+        "Search long lists",
+        key=SEARCH_INPUT_KEY,
+        help="Type to filter SKF models, bolt sizes and materials instead of scrolling the full lists.",
+    )
+
+
+def search_select(label: str, index: SearchIndex, key: str, extra=(), format_func=str):
+    """Text box plus a selectbox of the top matches of the typed text.
+
+    The current selection stays among the options, so changing the text
+    does not reset it; ``extra`` options (e.g. ``"Altro..."``) are always
+    listed.  Both stay out of the form of the input column, so typing
+    fills the matches without submitting it.
+    """
+    with option_inputs():
+        query = st.text_input(f"Search {label.lower()}", key=f"{key}_query",
+                              placeholder="Type to search")
+        options = index.search(query, SEARCH_LIMIT)
+        current = st.session_state.get(key)
+        if current and current not in options and current not in extra:
+            options.insert(0, current)
+        return st.selectbox(label, RankedOptions([""] + options + list(extra)), key=key,
+                            format_func=lambda value: format_func(value) if value else "")
+
+
+def select_option(label: str, options, index: SearchIndex, key: str, extra=()):
+    """``st.selectbox`` of ``options``, or :func:`search_select` in search mode."""
+    if search_input():
+        return search_select(label, index, key, extra)
+    return st.selectbox(label, [""] + list(options) + list(extra), key=key)
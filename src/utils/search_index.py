@@ -0,0 +1,192 @@
+"""Type-ahead search over long option lists (no Streamlit).
+
+:class:`SearchIndex` maps every 1-, 2- and 3-character gram of the
+normalized option labels to the options containing it.  The options
+containing a query token are among those of its rarest trigram (or of the
+token itself, up to three characters); a query scans the rarest such list
+of its tokens and keeps the labels containing every token.
+Matches are ranked by how each token matches (whole label, label prefix,
+word prefix, anywhere), then shorter labels first, then catalog order, and
+only the top ``k`` are returned.
+
+:class:`CatalogSearch` holds the indexes of the catalog lists (SKF models,
+bolt sizes and lengths, materials), each built on first use.
+"""
+
+from __future__ import annotations
+
+import heapq
+from functools import cached_property
+
+from src.utils.frozen import Frozen, frozen_mapping
+
+GRAM = 3
+
+# Rank of a token matching the whole label, its start, a word start, anywhere
+EXACT, PREFIX, WORD, INSIDE = range(4)
+
+
+def normalize(text) -> str:
+    """Case-folded text with runs of whitespace collapsed."""
+    return " ".join(str(text).casefold().split())
+
+
+def _grams(text: str, sizes=range(1, GRAM + 1)):
+    for size in sizes:
+        for i in range(len(text) - size + 1):
+            yield text[i:i + size]
+
+
+def _rank(label: str, token: str) -> int:
+    if label == token:
+        return EXACT
+    pos = label.find(token)
+    if pos == 0:
+        return PREFIX
+    while pos > 0:
+        if not label[pos - 1].isalnum():
+            return WORD
+        pos = label.find(token, pos + 1)
+    return INSIDE
+
+
+class SearchIndex(Frozen):
+    """N-gram index of option labels.
+
+    Options are numbered by rank order (shorter labels first, then catalog
+    order), so every posting list is already sorted best first.  Besides the
+    list of every gram, each gram keeps the options where it starts the
+    label and where it starts a word: a one-word query walks these three
+    lists in turn and stops after ``k`` matches, however many options match.
+
+    Parameters
+    ----------
+    labels : iterable of str
+        Text searched for each option, in catalog order.
+    values : iterable, optional
+        Value returned for each option (default: the labels).
+    """
+
+    def __init__(self, labels, values=None):
+        labels = tuple(labels)
+        values = tuple(values) if values is not None else labels
+        keys = [normalize(label) for label in labels]
+        order = sorted(range(len(keys)), key=lambda i: (len(keys[i]), i))
+        keys = [keys[i] for i in order]
+        head, word, anywhere = {}, {}, {}
+        for p, key in enumerate(keys):
+            for gram in set(_grams(key)):
+                anywhere.setdefault(gram, []).append(p)
+            starts = [i for i in range(len(key)) if i == 0 or not key[i - 1].isalnum()]
+            grams = {key[i:i + size] for i in starts for size in range(1, GRAM + 1)
+                     if i + size <= len(key)}
+            for gram in grams:
+                word.setdefault(gram, []).append(p)
+            for size in range(1, min(GRAM, len(key)) + 1):
+                head.setdefault(key[:size], []).append(p)
+        self._init_attrs(
+            labels=labels,
+            values=values,
+            _keys=tuple(keys),
+            _ranked=tuple(values[i] for i in order),
+            # Posting lists of the label starts, word starts and every gram
+            _postings=tuple(
+                frozen_mapping({g: tuple(ids) for g, ids in tier.items()})
+                for tier in (head, word, anywhere)
+            ),
+        )
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _pool(self, token: str) -> tuple:
+        """Smallest posting list holding every option that contains ``token``."""
+        anywhere = self._postings[-1]
+        if len(token) <= GRAM:
+            return anywhere.get(token, ())
+        return min((anywhere.get(g, ()) for g in set(_grams(token, (GRAM,)))), key=len)
+
+    def _top_token(self, token: str, k: int) -> list:
+        """Top ``k`` options of a single query token, best first."""
+        head, word, anywhere = self._postings
+        keys = self._keys
+        gram = token[:GRAM]
+        if len(token) <= GRAM:
+            tiers = ((head.get(gram, ()), None), (word.get(gram, ()), None),
+                     (anywhere.get(gram, ()), None))
+        else:
+            pool = self._pool(token)
+            if len(pool) <= len(head.get(gram, ())):
+                # A rare token: rank its few candidates directly
+                ids = [p for p in pool if token in keys[p]]
+                return heapq.nsmallest(k, ids, key=lambda p: (_rank(keys[p], token), p))
+            tiers = ((head.get(gram, ()), lambda key: key.startswith(token)),
+                     (word.get(gram, ()), lambda key: _rank(key, token) <= WORD),
+                     (pool, lambda key: token in key))
+        found, seen = [], set()
+        for ids, test in tiers:
+            for p in ids:
+                if p not in seen and (test is None or test(keys[p])):
+                    seen.add(p)
+                    found.append(p)
+                    if len(found) == k:
+                        return found
+        return found
+
+    def search(self, query: str, k: int = 20) -> list:
+        """Values of the top ``k`` options matching ``query``.
+
+        An empty query returns the first ``k`` options in catalog order.
+        """
+        tokens = normalize(query).split()
+        if not tokens:
+            return list(self.values[:k])
+        if len(tokens) == 1:
+            return [self._ranked[p] for p in self._top_token(tokens[0], k)]
+        # Scan the rarest token's options for the others
+        rarest = min(tokens, key=lambda token: len(self._pool(token)))
+        keys = self._keys
+        ids = self._pool(rarest)
+        for token in tokens:
+            ids = [p for p in ids if token in keys[p]]
+        best = heapq.nsmallest(k, ids, key=lambda p: (sum(_rank(keys[p], t) for t in tokens), p))
+        return [self._ranked[p] for p in best]
+
+
+def material_entries(materials_index) -> list:
+    """``(type, prefix, name)`` of every material, as the selector returns it.
+
+    Materials of the MISCELLANEOUS type have no prefix in the selector.
+    """
+    entries = []
+    for mtype in materials_index.types:
+        if mtype == "MISCELLANEOUS":
+            entries.extend((mtype, "", name) for name in materials_index.names_for_type(mtype))
+            continue
+        for mprefix in materials_index.prefixes(mtype):
+            entries.extend((mtype, mprefix, name) for name in materials_index.names(mtype, mprefix))
+    return entries
+
+
+class CatalogSearch(Frozen):
+    """Search indexes of the catalog option lists, built on first use."""
+
+    def __init__(self, catalog):
+        self._init_attrs(_catalog=catalog)
+
+    @cached_property
+    def skf_models(self) -> SearchIndex:
+        return SearchIndex(self._catalog.skf_options["models"])
+
+    @cached_property
+    def bolt_sizes(self) -> SearchIndex:
+        return SearchIndex(self._catalog.bolts["sizes"])
+
+    @cached_property
+    def bolt_lengths(self) -> SearchIndex:
+        return SearchIndex(self._catalog.bolts["lengths"])
+
+    @property
+    def materials(self) -> SearchIndex:
+        """Materials searched on ``type prefix name``; values are key tuples."""
+        return self._catalog.materials.search
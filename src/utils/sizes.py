@@ -0,0 +1,172 @@
+"""Numeric values of the size labels (no Streamlit).
+
+Sizes are shown as text in several formats: threads (``M20x2.5``,
+``1-1/8"-12UNF``, ``#10-24UNC``), lengths (``2-1/4"in``, ``50mm``),
+diameters (``Ø1.5 mm``, ``5/32"``) and pipe sizes (``1-1/4”``).
+:func:`parse_size` turns any of them into a :class:`Size` holding the
+nominal value in millimetres, the thread pitch and the unit system.
+
+:class:`SizeTable` holds the parsed labels of one option list sorted by
+nominal size, so range queries (``table.between("M12", "M24")``) are two
+binary searches; :class:`CatalogSizes` has the tables of every size list of
+the catalog, parsed once when the section is loaded.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import NamedTuple
+
+from src.utils.frozen import Frozen, frozen_mapping
+
+INCH_MM = 25.4
+
+METRIC, INCH = "metric", "inch"
+
+# Screw gauge, mixed fraction, fraction, or decimal number
+NUMBER_PATTERN = r"#(\d+)|(\d+)-(\d+)/(\d+)|(\d+)/(\d+)|(\d+(?:\.\d+)?)"
+
+_METRIC_THREAD = re.compile(r"M(\d+(?:\.\d+)?)(?:\s*X\s*(\d+(?:\.\d+)?))?")
+_INCH_THREAD = re.compile(rf"({NUMBER_PATTERN})\"?\s*-\s*(\d+(?:\.\d+)?)\s*(UN[A-Z]*|NPTF?)")
+_INCH = re.compile(rf"Ø?\s*({NUMBER_PATTERN})\s*(\"|IN|\"IN)?")
+_METRIC = re.compile(r"Ø?\s*(\d+(?:\.\d+)?)\s*(MM)?")
+
+# Typographic inch marks written as a plain double quote
+_QUOTES = str.maketrans({"”": '"', "“": '"', "″": '"'})
+
+
+def number_value(groups) -> float:
+    """Value of a :data:`NUMBER_PATTERN` match from its seven groups.
+
+    Number screw gauges (``#10``) are their major diameter in inches.
+    """
+    gauge, whole, num, den, fnum, fden, plain = groups
+    if plain is not None:
+        return float(plain)
+    if gauge is not None:
+        # ASME B18.6.3 number sizes: 0.060" + 0.013" per gauge
+        return 0.060 + 0.013 * int(gauge)
+    if whole is not None:
+        return int(whole) + (int(num) / int(den) if int(den) else 0.0)
+    return int(fnum) / int(fden) if int(fden) else float(fnum)
+
+
+class Size(NamedTuple):
+    """Parsed size label.
+
+    ``pitch_mm`` is the thread pitch (inch threads: 25.4 / threads per
+    inch) and ``thread`` the thread series (``"M"``, ``"UNC"``, ``"UNF"``
+    ...); both are empty for sizes that are not threads.
+    """
+
+    text: str
+    system: str
+    nominal_mm: float
+    pitch_mm: float | None = None
+    thread: str = ""
+
+    @property
+    def tpi(self) -> float | None:
+        """Threads per inch of an inch thread."""
+        if self.system != INCH or not self.pitch_mm:
+            return None
+        return round(INCH_MM / self.pitch_mm, 3)
+
+
+@lru_cache(maxsize=4096)
+def parse_size(text: str) -> Size:
+    """Parse a size label.
+
+    Raises
+    ------
+    ValueError
+        If ``text`` is not one of the known size formats.
+    """
+    label = str(text)
+    value = label.strip().translate(_QUOTES).upper()
+    if match := _METRIC_THREAD.fullmatch(value):
+        pitch = float(match[2]) if match[2] else None
+        return Size(label, METRIC, float(match[1]), pitch, "M")
+    if match := _INCH_THREAD.fullmatch(value):
+        inches = number_value(match.groups()[1:8])
+        return Size(label, INCH, inches * INCH_MM, INCH_MM / float(match[9]), match[10])
+    if (match := _INCH.fullmatch(value)) and (match[9] or value.lstrip("Ø ").startswith("#")):
+        return Size(label, INCH, number_value(match.groups()[1:8]) * INCH_MM)
+    if (match := _METRIC.fullmatch(value)) and (match[2] or value.startswith("Ø")):
+        return Size(label, METRIC, float(match[1]))
+    raise ValueError(f"Unrecognized size {label!r}")
+
+
+def _millimetres(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return parse_size(value).nominal_mm
+
+
+class SizeTable(Frozen):
+    """Size labels of one option list, parsed and sorted by nominal size.
+
+    Parameters
+    ----------
+    labels : iterable of str
+        Labels in catalog order; every label must parse.
+    """
+
+    def __init__(self, labels):
+        sizes = tuple(parse_size(label) for label in labels)
+        ranked = tuple(sorted(sizes, key=lambda size: size.nominal_mm))
+        self._init_attrs(
+            sizes=sizes,
+            _by_text=frozen_mapping((size.text, size) for size in sizes),
+            _ranked=ranked,
+            _nominal=tuple(size.nominal_mm for size in ranked),
+        )
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __contains__(self, label):
+        return label in self._by_text
+
+    def __getitem__(self, label) -> Size:
+        return self._by_text[label]
+
+    @property
+    def labels(self) -> tuple:
+        return tuple(size.text for size in self.sizes)
+
+    def between(self, low=None, high=None, system=None, thread=None) -> tuple:
+        """Labels whose nominal size is within ``low`` and ``high``, smallest first.
+
+        The bounds are millimetres or size labels (``"M12"``, ``'1/2"'``)
+        and are inclusive; ``None`` leaves that side open.  ``system`` and
+        ``thread`` restrict the result to one unit system or thread series.
+        """
+        start = 0 if low is None else bisect_left(self._nominal, _millimetres(low) - 1e-9)
+        stop = len(self._nominal) if high is None else bisect_right(self._nominal, _millimetres(high) + 1e-9)
+        return tuple(
+            size.text for size in self._ranked[start:stop]
+            if (system is None or size.system == system) and (thread is None or size.thread == thread)
+        )
+
+    def invalid(self, labels) -> list:
+        """The labels that are not options of this table, in order."""
+        by_text = self._by_text
+        return [label for label in labels if label not in by_text]
+
+
+class CatalogSizes(Frozen):
+    """Size tables of the bolt asset file and of the part constants."""
+
+    def __init__(self, bolts):
+        from src.utils import constants
+
+        self._init_attrs(
+            bolt_sizes=SizeTable(bolts["sizes"]),
+            bolt_lengths=SizeTable(bolts["lengths"]),
+            dowel_diameters=SizeTable(constants.dowel_diameters_mm + constants.dowel_diameters_in),
+            dowel_lengths=SizeTable(constants.dowel_lengths_mm + constants.dowel_lengths_in),
+            flange_sizes=SizeTable(constants.flange_sizes),
+        )
@@ -0,0 +1,263 @@
+"""SKF rolling bearing designations, built and decoded with prefix tries.
+
+A designation is the bearing model followed by its suffix codes in a fixed
+order (:data:`SKF_SUFFIXES`), e.g. ``7210BECBM/C3``: model ``7210``, design
+``BE``, pairing ``CB``, cage ``M``, clearance ``C3``.  :class:`SkfDecoder`
+keeps one trie of the known models, one of the series of
+:data:`~src.utils.constants.base_series_desc` and one per suffix group,
+built once from ``skf_options.json`` and ``constants.py``.
+
+The model is a known model or a series followed by its bore digits.  The
+suffix groups are walked in order, trying the codes of each group that
+start at the current position, longest first, before skipping the group,
+so a code shared by two groups (``CC``) goes to the earlier one.  The first
+split that consumes the whole designation wins; otherwise the longest split
+is kept and the rest is returned as ``extra``.  Separators (``/``, ``-``)
+only end the model.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import NamedTuple
+
+from src.utils.constants import (
+    base_series_desc,
+    cage_desc,
+    clearance_desc,
+    design_desc,
+    grease_desc,
+    heat_desc,
+    pairing_desc,
+    tolerance_desc,
+    vibration_desc,
+)
+from src.utils.frozen import Frozen, frozen_mapping
+
+# Suffix spec keys of a rolling bearing, in designation order
+SKF_SUFFIXES = (
+    "seal", "design", "pairing", "cage", "clearance", "tolerance", "heat", "grease", "vibration",
+)
+
+# Suffix spec key -> description table, in description order
+SKF_SUFFIX_DESC = (
+    ("design", design_desc),
+    ("pairing", pairing_desc),
+    ("cage", cage_desc),
+    ("clearance", clearance_desc),
+    ("tolerance", tolerance_desc),
+    ("heat", heat_desc),
+    ("grease", grease_desc),
+    ("vibration", vibration_desc),
+)
+
+# skf_options.json list of each suffix key
+OPTION_LISTS = {
+    "seal": "seals", "design": "design", "pairing": "pairing", "cage": "cages",
+    "clearance": "clearances", "tolerance": "tolerances", "heat": "heat",
+    "grease": "greases", "vibration": "vibration",
+}
+
+_SEPARATORS = str.maketrans("", "", "/-")
+
+# Decoded designations kept by a decoder
+DECODE_CACHE_SIZE = 1024
+
+
+def short(sigla: str) -> str:
+    """Code of an SKF option label such as ``"C3 (Clearance greater than normal)"``."""
+    return sigla.split(" ")[0] if sigla else ""
+
+
+class Trie:
+    """Prefix tree of string keys, each with a value."""
+
+    _END = object()
+
+    def __init__(self, items=()):
+        self._root = {}
+        for key, value in items:
+            self.add(key, value)
+
+    def add(self, key: str, value) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[self._END] = value
+
+    def matches(self, text: str, start: int = 0) -> list:
+        """``(end, value)`` of every key that is a prefix of ``text[start:]``,
+        longest first."""
+        found = []
+        node = self._root
+        for end in range(start, len(text)):
+            node = node.get(text[end])
+            if node is None:
+                break
+            if self._END in node:
+                found.append((end + 1, node[self._END]))
+        found.reverse()
+        return found
+
+    def longest(self, text: str, start: int = 0):
+        """``(end, value)`` of the longest key prefixing ``text[start:]``, or ``None``."""
+        found = self.matches(text, start)
+        return found[0] if found else None
+
+
+class Designation(NamedTuple):
+    """Parts of a decoded SKF designation; codes are ``""`` when absent."""
+
+    code: str
+    model: str
+    series: str
+    bearing_type: str
+    seal: str = ""
+    design: str = ""
+    pairing: str = ""
+    cage: str = ""
+    clearance: str = ""
+    tolerance: str = ""
+    heat: str = ""
+    grease: str = ""
+    vibration: str = ""
+    extra: str = ""
+    descriptions: tuple = ()
+
+
+class SkfDecoder(Frozen):
+    """Tries of the SKF models, series and suffix codes."""
+
+    def __init__(self, models, series, suffixes, labels):
+        self._init_attrs(
+            _models=Trie((m, m) for m in models),
+            _series=Trie(series.items()),
+            _suffixes=tuple((key, Trie((c, c) for c in suffixes[key])) for key in SKF_SUFFIXES),
+            _labels=frozen_mapping(labels),
+            _codes=frozen_mapping({label: code for (_, code), label in labels.items()}),
+            # Bounded: a long-running app decodes any number of designations
+            _decoded=lru_cache(maxsize=DECODE_CACHE_SIZE)(self._decode),
+        )
+
+    @classmethod
+    def from_options(cls, options) -> "SkfDecoder":
+        """Decoder of the ``skf_options.json`` content and the constant tables."""
+        suffixes = {key: set() for key in SKF_SUFFIXES}
+        labels = {}
+        for key, list_name in OPTION_LISTS.items():
+            for label in options.get(list_name, ()):
+                code = short(label).upper()
+                if code:
+                    suffixes[key].add(code)
+                    labels.setdefault((key, code), label)
+        for key, table in SKF_SUFFIX_DESC:
+            suffixes[key].update(code.upper() for code in table)
+        return cls(
+            [m.upper() for m in options.get("models", ())], base_series_desc, suffixes, labels,
+        )
+
+    def code(self, label: str) -> str:
+        """Code of an option label, precomputed for the labels of the options."""
+        code = self._codes.get(label)
+        return code if code is not None else short(label)
+
+    def label(self, key: str, code: str) -> str:
+        """Option label of a suffix code (the code itself when not an option)."""
+        return self._labels.get((key, code), code)
+
+    def bearing_type(self, model: str) -> str:
+        """Bearing family of a model, from its longest known series prefix."""
+        found = self._series.longest(model)
+        return found[1] if found else ""
+
+    def describe(self, model: str, codes) -> list:
+        """Bearing family and suffix descriptions, as printed in descriptions."""
+        texts = []
+        bearing_type = self.bearing_type(model)
+        if bearing_type:
+            texts.append(bearing_type)
+        for key, table in SKF_SUFFIX_DESC:
+            text = table.get(codes.get(key, ""), "")
+            if text:
+                texts.append(text)
+        return texts
+
+    def _model_ends(self, text: str) -> list:
+        """Candidate ends of the model at the start of ``text``: the known
+        models, longest first, then the series and its bore digits."""
+        ends = [end for end, _ in self._models.matches(text)]
+        series = self._series.longest(text)
+        end = series[0] if series else 0
+        while end < len(text) and text[end].isdigit():
+            end += 1
+        if end not in ends:
+            ends.append(end)
+        return ends
+
+    def _split(self, text: str, start: int) -> tuple:
+        """``(end, codes)``: the best split of ``text[start:]`` in suffix groups."""
+        best = {}
+
+        def walk(group: int, pos: int) -> tuple:
+            if pos == len(text) or group == len(self._suffixes):
+                return pos, ()
+            if (group, pos) in best:
+                return best[(group, pos)]
+            key, trie = self._suffixes[group]
+            result = (pos, ())
+            for end, code in trie.matches(text, pos):
+                tail_end, tail = walk(group + 1, end)
+                if tail_end > result[0]:
+                    result = (tail_end, ((key, code),) + tail)
+                    if tail_end == len(text):
+                        break
+            if result[0] < len(text):
+                skipped = walk(group + 1, pos)
+                if skipped[0] > result[0]:
+                    result = skipped
+            best[(group, pos)] = result
+            return result
+
+        end, codes = walk(0, start)
+        return end, dict(codes)
+
+    def decode(self, designation: str) -> Designation:
+        """Parts of one designation, e.g. ``"7210BECBM/C3"``."""
+        return self._decoded(designation)
+
+    def _decode(self, designation: str) -> Designation:
+        text = "".join(str(designation).upper().split())
+        best = None
+        for model_end in self._model_ends(text):
+            suffix = text[model_end:].translate(_SEPARATORS)
+            end, codes = self._split(suffix, 0)
+            if best is None or len(suffix) - end < len(best[1]) - best[2]:
+                best = (text[:model_end], suffix, end, codes)
+            if end == len(suffix):
+                break
+        model, suffix, end, codes = best
+        series = self._series.longest(model)
+        return Designation(
+            code=model + suffix,
+            model=model,
+            series=model[:series[0]] if series else "",
+            bearing_type=series[1] if series else "",
+            extra=suffix[end:],
+            descriptions=tuple(self.describe(model, codes)),
+            **codes,
+        )
+
+    def decode_many(self, designations) -> list:
+        """:meth:`decode` of every designation, e.g. the lines of a bearing BOM.
+
+        Repeated designations are decoded once.
+        """
+        return [self.decode(d) for d in designations]
+
+    def spec(self, designation: Designation) -> dict:
+        """"Bearing, Rolling" spec of a decoded designation, with option labels."""
+        spec = {"model": designation.model, "extra_suffix": designation.extra}
+        for key in SKF_SUFFIXES:
+            code = getattr(designation, key)
+            spec[key] = self.label(key, code) if code else ""
+        return spec
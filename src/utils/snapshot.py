@@ -0,0 +1,181 @@
+"""Compiled Parquet snapshot of the catalog workbook.
+
+The snapshot directory holds one Parquet file per catalog table plus a
+``manifest.json`` recording the SHA-256 of the workbook it was built from.
+A snapshot whose hash does not match the current workbook is stale and is
+rebuilt automatically by :func:`ensure_snapshot`.
+
+Table files are named after the workbook hash (``materials-<hash>.parquet``),
+so a catalog version pinned to a hash reads its own tables only, even while
+a newer snapshot is written next to them.  A rebuild keeps the tables of the
+previous snapshot for the versions still using them and removes older ones.
+
+Build it ahead of time (e.g. during deploy) with::
+
+    python -m src.utils.snapshot
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from src.utils.catalog import SHEETS, WORKBOOK_PATH, file_hash, read_workbook
+
+SNAPSHOT_DIR = Path(__file__).resolve().parents[2] / ".catalog_snapshot"
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 3
+
+# Characters of the workbook hash in the table file names
+HASH_CHARS = 16
+
+
+def _read_manifest(snapshot_dir: Path):
+    try:
+        with (snapshot_dir / MANIFEST).open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def table_path(name: str, snapshot_dir: Path, source_hash: str) -> Path:
+    """File of table ``name`` in the snapshot of the workbook hashed ``source_hash``."""
+    return Path(snapshot_dir) / f"{name}-{source_hash[:HASH_CHARS]}.parquet"
+
+
+def has_tables(snapshot_dir: Path, source_hash: str) -> bool:
+    """Return ``True`` if every table of the workbook hashed ``source_hash`` is on disk."""
+    return all(table_path(name, snapshot_dir, source_hash).exists() for name in SHEETS)
+
+
+def is_fresh(path: Path = WORKBOOK_PATH, snapshot_dir: Path = SNAPSHOT_DIR,
+             source_hash: str | None = None) -> bool:
+    """Return ``True`` if the snapshot matches the workbook content."""
+    snapshot_dir = Path(snapshot_dir)
+    manifest = _read_manifest(snapshot_dir)
+    if not manifest or manifest.get("format") != FORMAT_VERSION:
+        return False
+    source_hash = source_hash or file_hash(path)
+    if manifest.get("source_hash") != source_hash:
+        return False
+    return has_tables(snapshot_dir, source_hash)
+
+
+def build_snapshot(path: Path = WORKBOOK_PATH, snapshot_dir: Path = SNAPSHOT_DIR,
+                   tables: dict | None = None, source_hash: str | None = None):
+    """Parse the workbook and write its snapshot to ``snapshot_dir``.
+
+    Files are written to temporary names and moved into place, with the
+    manifest last, so a concurrent reader never sees a half-written snapshot
+    as fresh.  Tables of snapshots older than the previous one are removed.
+    Returns the parsed tables.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    source_hash = source_hash or file_hash(path)
+    previous = _read_manifest(snapshot_dir) or {}
+    if tables is None:
+        tables = read_workbook(path)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    def write_atomic(target: Path, write):
+        fd, tmp = tempfile.mkstemp(dir=snapshot_dir, prefix=f".{target.name}.")
+        os.close(fd)
+        try:
+            write(tmp)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    for name, df in tables.items():
+        write_atomic(table_path(name, snapshot_dir, source_hash),
+                     lambda tmp, df=df: df.to_parquet(tmp, index=False))
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "source": Path(path).name,
+        "source_hash": source_hash,
+        "tables": {name: SHEETS[name] for name in tables},
+    }
+
+    def write_manifest(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+    write_atomic(snapshot_dir / MANIFEST, write_manifest)
+
+    keep = {table_path(name, snapshot_dir, h).name
+            for h in (source_hash, previous.get("source_hash") or "") if h for name in SHEETS}
+    for old in snapshot_dir.glob("*.parquet"):
+        if old.name not in keep:
+            old.unlink(missing_ok=True)
+    return tables
+
+
+def read_table(name: str, snapshot_dir: Path = SNAPSHOT_DIR,
+               source_hash: str | None = None) -> pd.DataFrame:
+    """Read the single table ``name`` of the snapshot in ``snapshot_dir``.
+
+    ``source_hash`` selects the snapshot of that workbook content; by
+    default the one of the manifest is read.
+    """
+    if source_hash is None:
+        source_hash = (_read_manifest(Path(snapshot_dir)) or {}).get("source_hash", "")
+    return pd.read_parquet(table_path(name, snapshot_dir, source_hash))
+
+
+def read_snapshot(snapshot_dir: Path = SNAPSHOT_DIR,
+                  source_hash: str | None = None) -> dict[str, pd.DataFrame]:
+    """Read every table of the snapshot in ``snapshot_dir``."""
+    if source_hash is None:
+        source_hash = (_read_manifest(Path(snapshot_dir)) or {}).get("source_hash", "")
+    return {name: read_table(name, snapshot_dir, source_hash) for name in SHEETS}
+
+
+def ensure_snapshot(path: Path = WORKBOOK_PATH,
+                    snapshot_dir: Path = SNAPSHOT_DIR,
+                    source_hash: str | None = None) -> dict[str, pd.DataFrame]:
+    """Return the catalog tables, rebuilding the snapshot if it is stale.
+
+    When the snapshot directory is not writable the freshly parsed tables are
+    still returned, so the app keeps working on read-only deployments.
+    """
+    source_hash = source_hash or file_hash(path)
+    if is_fresh(path, snapshot_dir, source_hash):
+        return read_snapshot(snapshot_dir, source_hash)
+    tables = read_workbook(path)
+    try:
+        build_snapshot(path, snapshot_dir, tables=tables, source_hash=source_hash)
+    except OSError:
+        pass
+    return tables
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build the compiled catalog snapshot from the workbook."
+    )
+    parser.add_argument("--workbook", type=Path, default=WORKBOOK_PATH)
+    parser.add_argument("--out", type=Path, default=SNAPSHOT_DIR)
+    parser.add_argument(
+        "--force", action="store_true",
+        help="rebuild even if the snapshot already matches the workbook",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.force and is_fresh(args.workbook, args.out):
+        print(f"Snapshot in {args.out} is up to date.")
+        return 0
+    build_snapshot(args.workbook, args.out)
+    print(f"Snapshot of {args.workbook.name} written to {args.out}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""Minimal streaming reader for the cell values of ``.xlsx`` worksheets.
+
+The worksheet XML is parsed with :func:`xml.etree.ElementTree.iterparse`
+straight from the zip archive and every row is discarded once it has been
+yielded, so memory does not grow with the sheet size.  Styles, formulas and
+the rest of the workbook object model are never read: cached formula
+results, shared and inline strings, numbers and booleans are returned as
+plain Python values, like openpyxl with ``read_only=True, data_only=True``.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Iterator
+from xml.etree.ElementTree import iterparse
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_ROW = f"{_MAIN}row"
+_CELL = f"{_MAIN}c"
+_VALUE = f"{_MAIN}v"
+_TEXT = f"{_MAIN}t"
+_PHONETIC = f"{_MAIN}rPh"
+_SHEET_DATA = f"{_MAIN}sheetData"
+
+_COLUMN_RE = re.compile(r"[A-Z]+")
+
+
+def _column_index(ref: str) -> int:
+    index = 0
+    for char in _COLUMN_RE.match(ref).group():
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _string_text(elem) -> str:
+    # Plain (<t>) or rich text (<r><t>) string, without phonetic runs
+    parts = []
+    for child in elem:
+        if child.tag == _TEXT:
+            parts.append(child.text or "")
+        elif child.tag != _PHONETIC:
+            parts.extend(t.text or "" for t in child.iter(_TEXT))
+    return "".join(parts)
+
+
+def _number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+class XlsxReader:
+    """Read-only access to the worksheets of the workbook at ``path``.
+
+    ``path`` may also be a binary file (e.g. an upload).
+
+    Use as a context manager; :meth:`rows` yields one tuple of cell values per
+    non-empty row, with ``None`` for empty cells.
+    """
+
+    def __init__(self, path):
+        self._zip = zipfile.ZipFile(path if hasattr(path, "read") else Path(path))
+        targets = self._relationships("xl/_rels/workbook.xml.rels")
+        self._sheets = {}
+        with self._zip.open("xl/workbook.xml") as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f"{_MAIN}sheet":
+                    self._sheets[elem.get("name")] = targets[elem.get(f"{_DOC_REL}id")][1]
+        shared = [target for kind, target in targets.values()
+                  if kind.endswith("/sharedStrings")]
+        self._shared_strings = self._read_shared_strings(shared[0]) if shared else []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._zip.close()
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self._sheets)
+
+    def _relationships(self, name: str) -> dict:
+        rels = {}
+        with self._zip.open(name) as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f"{_PKG_REL}Relationship":
+                    target = elem.get("Target")
+                    if target.startswith("/"):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join("xl", target))
+                    rels[elem.get("Id")] = (elem.get("Type"), target)
+        return rels
+
+    def _read_shared_strings(self, name: str) -> list[str]:
+        strings = []
+        with self._zip.open(name) as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f"{_MAIN}si":
+                    strings.append(_string_text(elem))
+                    elem.clear()
+        return strings
+
+    def _cell_value(self, cell):
+        kind = cell.get("t", "n")
+        if kind == "inlineStr":
+            inline = cell.find(f"{_MAIN}is")
+            return _string_text(inline) if inline is not None else None
+        value = cell.find(_VALUE)
+        if value is None or value.text is None:
+            return None
+        text = value.text
+        if kind == "s":
+            return self._shared_strings[int(text)]
+        if kind == "b":
+            return text == "1"
+        if kind in ("str", "e"):
+            return text
+        return _number(text)
+
+    def rows(self, sheet_name: str, numbered: bool = False) -> Iterator[tuple]:
+        """Yield the rows of the worksheet ``sheet_name``.
+
+        Empty rows are skipped; with ``numbered`` each row comes as
+        ``(row number, values)``, the row number as shown by Excel.
+        """
+        try:
+            target = self._sheets[sheet_name]
+        except KeyError:
+            raise KeyError(f"Worksheet {sheet_name!r} does not exist") from None
+        with self._zip.open(target) as f:
+            sheet_data = None
+            number = 0
+            for event, elem in iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == _SHEET_DATA:
+                        sheet_data = elem
+                    continue
+                if elem.tag != _ROW:
+                    continue
+                number = int(elem.get("r") or number + 1)
+                values = []
+                for position, cell in enumerate(elem.iter(_CELL)):
+                    ref = cell.get("r")
+                    index = _column_index(ref) if ref else position
+                    if index >= len(values):
+                        values.extend([None] * (index + 1 - len(values)))
+                    values[index] = self._cell_value(cell)
+                if sheet_data is not None:
+                    sheet_data.clear()
+                if any(v is not None for v in values):
+                    yield (number, tuple(values)) if numbered else tuple(values)
@@ -0,0 +1,105 @@
+from pathlib import Path
+import csv
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import generate_item
+from src.engine.batch import generate_batch, main, read_specs
+
+ROWS = [
+    {"Part": "Bolt, Hexagonal", "size": "M20x2.5", "full_thread": "Yes"},
+    {"Part": "Ring, Wear", "model": "HPX", "ring_type": "Rotary", "hf_service": "x"},
+    {"Part": "Flux capacitor"},
+    {"Part": "Gasket, Flat", "thickness": "3", "material": "GRAPHITE"},
+] * 3
+
+
+def write_csv(path, rows):
+    columns = list(dict.fromkeys(k for row in rows for k in row))
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_read_specs_skips_empty_cells(tmp_path):
+    path = tmp_path / "specs.csv"
+    write_csv(path, ROWS)
+    specs = read_specs(path)
+    assert specs[0] == {"Part": "Bolt, Hexagonal", "size": "M20x2.5", "full_thread": "Yes", "Row": 2}
+    assert len(specs) == len(ROWS)
+
+    xlsx = tmp_path / "specs.xlsx"
+    pd.read_csv(path, dtype=str).to_excel(xlsx, index=False)
+    assert read_specs(xlsx) == specs
+
+
+def test_numeric_xlsx_cells_are_text(tmp_path):
+    xlsx = tmp_path / "specs.xlsx"
+    pd.DataFrame([
+        {"Part": "Ring, Wear", "model": "HPX", "internal_diameter": 120},
+        {"Part": "Impeller casting", "pattern_mod_1": 12},
+    ]).to_excel(xlsx, index=False)
+    specs = read_specs(xlsx)
+    assert specs[0]["internal_diameter"] == "120" and specs[1]["pattern_mod_1"] == "12"
+    rows = generate_batch(specs, workers=1)
+    assert all("Error" not in row for row in rows)
+    assert "120" in rows[0]["Description"]
+
+
+def test_rows_are_spreadsheet_rows(tmp_path):
+    path = tmp_path / "specs.csv"
+    # Rows 3 (empty cells) and 6 (blank) are skipped; row 4 spans two lines
+    path.write_text('Part,note\n"Gasket, Flat",\n,\n"Gasket, Flat","two\nlines"\n\nFlux capacitor,\n')
+    rows = generate_batch(read_specs(path), workers=1)
+    assert [row["Row"] for row in rows] == [2, 4, 7]
+    assert "Error" in rows[2]
+
+    xlsx = tmp_path / "specs.xlsx"
+    pd.DataFrame([{"Part": "Gasket, Flat"}, {"Part": None}, {"Part": "Flux capacitor"}]).to_excel(
+        xlsx, index=False)
+    assert [spec["Row"] for spec in read_specs(xlsx)] == [2, 4]
+
+
+def test_read_specs_requires_part_column(tmp_path):
+    path = tmp_path / "specs.csv"
+    path.write_text("model,size\nHPX,3HPX10A\n")
+    with pytest.raises(ValueError):
+        read_specs(path)
+
+
+def test_batch_order_does_not_depend_on_workers():
+    serial = generate_batch(ROWS, workers=1)
+    pooled = generate_batch(ROWS, workers=2, chunk_size=2)
+    assert pooled == serial
+    assert [row["Row"] for row in serial] == list(range(1, len(ROWS) + 1))
+    assert "Error" in serial[2]
+    spec = {k: v for k, v in ROWS[1].items() if k != "Part"}
+    assert serial[1]["Description"] == generate_item("Ring, Wear", spec).description
+
+
+def test_cli_writes_one_row_per_spec(tmp_path, capsys):
+    specs = tmp_path / "specs.csv"
+    write_csv(specs, ROWS)
+    out = tmp_path / "items.csv"
+    assert main([str(specs), str(out), "--workers", "1"]) == 1
+    written = pd.read_csv(out, dtype=str, keep_default_na=False)
+    assert len(written) == len(ROWS)
+    assert written.columns[-1] == "Error"
+    assert "9 items written" in capsys.readouterr().out
+
+
+def test_unused_columns_fail_the_row():
+    rows = generate_batch([
+        {"Part": "Impeller casting", "modle": "HPX", "sizee": "3HPX10A"},
+        {"Part": "Gasket, Flat", "thickness": "3", "model": "HPX"},
+        {"Part": "Gasket, Flat", "thickness": "3", "Item code": "A1", "Mode": "update"},
+    ], workers=1)
+    assert rows[0]["Error"] == "ValueError: Columns not used by 'Impeller casting': modle, sizee"
+    assert "Description" not in rows[0]
+    assert rows[1]["Error"].endswith(": model")
+    assert "Error" not in rows[2]
@@ -5,7 +5,7 @@ import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from src.utils.materials import get_casting_code
+from src.utils.materials_index import get_casting_code
 
 def test_get_casting_code_missing_column():
     df = pd.DataFrame({"FPD Code": ["123"]})
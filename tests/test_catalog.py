@@ -0,0 +1,142 @@
+from pathlib import Path
+import json
+import shutil
+import sys
+import zipfile
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.parts import PART_SECTIONS
+from src.utils import catalog as catalog_module
+from src.utils.catalog import (
+    SECTIONS, WORKBOOK_PATH, StaleCatalogError, build_catalog, file_hash, read_sheet,
+)
+from src.utils.quality import build_quality_tags
+
+
+@pytest.fixture(scope="module")
+def catalog(tmp_path_factory):
+    return build_catalog(snapshot_dir=tmp_path_factory.mktemp("snapshot"))
+
+
+def test_catalog_attributes_are_read_only(catalog):
+    with pytest.raises(AttributeError):
+        catalog.materials = None
+    with pytest.raises(AttributeError):
+        catalog.pumps.models = ()
+    with pytest.raises(AttributeError):
+        del catalog.materials.types
+
+
+def test_catalog_lookup_tables_are_read_only(catalog):
+    with pytest.raises(TypeError):
+        catalog.materials._rows[("X", "Y", "Z")] = None
+    with pytest.raises(TypeError):
+        catalog.pumps._sizes["HPX"] = ()
+
+
+def test_table_views_do_not_leak_writes(catalog):
+    view = catalog.table("materials")
+    original = view.loc[0, "FPD Code"]
+    view.loc[0, "FPD Code"] = "CHANGED"
+    view["Extra"] = 1
+    fresh = catalog.table("materials")
+    assert fresh.loc[0, "FPD Code"] == original
+    assert "Extra" not in fresh.columns
+
+
+def test_catalog_carries_version_and_frozen_assets(catalog):
+    assert catalog.version == 1
+    assert catalog.label == f"v1 ({catalog.source_hash[:8]})"
+    assert "M20x2.5" in catalog.bolts["sizes"]
+    with pytest.raises(TypeError):
+        catalog.bolts["sizes"] = ()
+
+
+def test_sections_load_on_first_use(tmp_path):
+    catalog = build_catalog(snapshot_dir=tmp_path)
+    assert catalog.loaded_sections == ()
+
+    materials = catalog.materials
+    assert catalog.loaded_sections == ("materials",)
+    assert catalog.materials is materials
+
+    catalog.preload(PART_SECTIONS["Bolt, Eye"])
+    assert set(catalog.loaded_sections) == {"materials", "bolts"}
+
+
+def test_part_sections_are_known():
+    for part, sections in PART_SECTIONS.items():
+        assert set(sections) <= set(SECTIONS), part
+
+
+def test_read_sheet_follows_declared_schema():
+    rows = iter([
+        ("Pump Model", "Notes", "Size"),
+        ("HPX", "ignored", "1.5HPX15A"),
+        (None, None, None),
+        ("HDO", "x", "NA"),
+    ])
+    df = read_sheet("size", rows)
+    assert list(df.columns) == ["Pump Model", "Size"]
+    assert df["Pump Model"].tolist() == ["HPX", "HDO"]
+    assert pd.isna(df.loc[1, "Size"])
+
+    with pytest.raises(ValueError, match="Size"):
+        read_sheet("size", iter([("Pump Model",), ("HPX",)]))
+
+
+def _resave(source, target, level):
+    # Same sheets, other bytes: a workbook edit as far as the hashes go
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(
+            target, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as dst:
+        for item in src.infolist():
+            dst.writestr(item.filename, src.read(item.filename))
+
+
+def test_pinned_version_reads_only_its_own_snapshot(tmp_path):
+    workbook, snapshot = tmp_path / "dati_config4.xlsx", tmp_path / "snapshot"
+    _resave(WORKBOOK_PATH, workbook, 1)
+    old = build_catalog(workbook, snapshot_dir=snapshot)
+    old.table("size")
+    old_hash = file_hash(workbook)
+
+    _resave(WORKBOOK_PATH, workbook, 9)
+    assert file_hash(workbook) != old_hash
+    new = build_catalog(workbook, snapshot_dir=snapshot, version=2)
+    new.table("materials")
+    manifest = json.loads((snapshot / "manifest.json").read_text())
+    assert manifest["source_hash"] == file_hash(workbook)
+    # The old version still reads its own tables, never the new workbook's
+    assert not old.table("features").empty
+
+    stale = build_catalog(workbook, snapshot_dir=tmp_path / "other")
+    _resave(WORKBOOK_PATH, workbook, 5)
+    with pytest.raises(StaleCatalogError):
+        stale.table("size")
+    assert not (tmp_path / "other").exists()
+
+
+def test_assets_are_read_when_the_version_is_built(tmp_path, monkeypatch):
+    assets = tmp_path / "assets"
+    shutil.copytree(catalog_module.ASSETS_DIR, assets)
+    monkeypatch.setattr(catalog_module, "ASSETS_DIR", assets)
+    catalog = build_catalog(snapshot_dir=tmp_path / "snapshot")
+
+    rules = json.loads((assets / "quality_rules.json").read_text(encoding="utf-8"))
+    rules["lines"] = {tag: "EDITED" for tag in rules["lines"]}
+    (assets / "quality_rules.json").write_text(json.dumps(rules), encoding="utf-8")
+    bolts = json.loads((assets / "bolts.json").read_text(encoding="utf-8"))
+    bolts["sizes"] = ["M1"]
+    (assets / "bolts.json").write_text(json.dumps(bolts), encoding="utf-8")
+
+    assert "M20x2.5" in catalog.bolts["sizes"]
+    _, lines = build_quality_tags({"hf_service": True}, catalog)
+    assert "EDITED" not in lines
+    edited = build_catalog(snapshot_dir=tmp_path / "snapshot", version=2)
+    assert edited.source_hash != catalog.source_hash
+    assert edited.bolts["sizes"] == ("M1",)
+    assert "EDITED" in build_quality_tags({"hf_service": True}, edited)[1]
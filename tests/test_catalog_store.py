@@ -0,0 +1,52 @@
+from pathlib import Path
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog_store import CatalogStore
+
+
+def _touch(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _store(source, builds):
+    def builder(version):
+        builds.append(version)
+        return SimpleNamespace(version=version, content=source.read_text())
+
+    return CatalogStore(builder, lambda: [source], poll_interval=60)
+
+
+def test_poll_swaps_in_new_version_on_change(tmp_path):
+    source = tmp_path / "catalog.json"
+    source.write_text("a")
+    store = _store(source, [])
+    pinned = store.current()
+    assert store.poll() is False
+
+    _touch(source, "b")
+    assert store.poll() is True
+    assert store.version == 2
+    assert store.current().content == "b"
+    # A rerun that started before the swap keeps its version
+    assert pinned.version == 1 and pinned.content == "a"
+
+
+def test_failed_rebuild_keeps_active_version(tmp_path):
+    source = tmp_path / "catalog.json"
+    source.write_text("a")
+    builds = []
+    store = _store(source, builds)
+
+    def broken(version):
+        raise ValueError("half-written workbook")
+
+    store._builder = broken
+    _touch(source, "b")
+    assert store.poll() is False
+    assert store.version == 1
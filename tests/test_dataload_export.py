@@ -0,0 +1,152 @@
+from pathlib import Path
+import csv
+import io
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import generate_item
+from src.engine.batch import generate_batch, write_items
+from src.utils.dataload_export import (
+    COMPILED,
+    create_tokens,
+    fill_items,
+    item_tokens,
+    main,
+    quality_tokens,
+    read_items,
+    tokens_csv,
+    update_tokens,
+    write_dataload,
+    write_dataload_csv,
+    write_dataload_zip,
+)
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.chunks.append(bytes(b))
+        return len(b)
+
+
+def test_quality_tokens():
+    assert quality_tokens("") == ["NA"]
+    assert quality_tokens(["A", "B"]) == ["A", "\\{NUMPAD ENTER}", "B"]
+    assert quality_tokens("A\nB\n") == ["A", "\\{NUMPAD ENTER}", "B"]
+
+
+def test_item_tokens():
+    data = generate_item("Gasket, Flat", {"thickness": "3", "material": "GRAPHITE"}).to_dict()
+    tokens = create_tokens("50158X", data)
+    assert tokens[:4] == ["\\%FN", "50158X", "\\%TC", "FPD_BUY_2"]
+    assert "55_GASKETS_OR_SEAL.20_OTHER" in tokens
+    assert update_tokens("50158X", {})[4] == "*?"
+    with pytest.raises(ValueError):
+        item_tokens("delete", "50158X", data)
+
+
+def test_compiled_templates_fill_many_items():
+    template = COMPILED["item", "create"]
+    assert all(template.head[i] == "" for i, _ in template.head_slots)
+    records = [
+        generate_item("Bolt, Eye", {"size": "M12"}).to_dict(),
+        generate_item("Gasket, Flat", {"thickness": "3", "material": "GRAPHITE"}).to_dict(),
+    ]
+    filled = fill_items("create", ["A1", "B2"], records)
+    assert filled == [create_tokens("A1", records[0]), create_tokens("B2", records[1])]
+
+
+def test_casting_fields_reach_the_template():
+    data = generate_item("Impeller casting", {
+        "base_pattern": "P1", "casting_drawing": "DWG-9",
+        "material_type": "ASTM", "material_prefix": "A351_", "material_name": "CG3M",
+    }).to_dict()
+    tokens = create_tokens("4020X", data)
+    assert tokens[tokens.index("MATER+DESCR_FPD") + 3] == data["FPD Material Code"]
+    assert "DWG-9" in tokens
+    assert f"{data['ERP L1']}.{data['ERP L2'] or '.'}" in tokens
+
+
+def test_baseplate_leaves_the_erp_category_out():
+    data = generate_item("Baseplate, Pump", {"model": "HPX", "size": "4"}).to_dict()
+    tokens = create_tokens("4770000001", data)
+    assert tokens[tokens.index("FASCIA ITE") - 2] == "..."
+
+
+def test_csv_export_concatenates_item_streams():
+    data = generate_item("Bolt, Eye", {"size": "M12"}).to_dict()
+    items = [("create", "A1", data), ("update", "A2", data)]
+    buf = io.StringIO()
+    assert write_dataload_csv(iter(items), buf) == 2
+    expected = tokens_csv(create_tokens("A1", data)) + tokens_csv(update_tokens("A2", data))
+    assert buf.getvalue() == expected
+
+
+def test_zip_export_streams_one_file_per_item():
+    data = generate_item("Bolt, Eye", {"size": "M12"}).to_dict()
+    items = (("create", f"A{i % 3}", data) for i in range(5))
+    out = Unseekable()
+    assert write_dataload_zip(items, out) == 5
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(out.chunks)))
+    assert archive.namelist() == [
+        "dataload_A0.csv", "dataload_A1.csv", "dataload_A2.csv",
+        "dataload_A0_2.csv", "dataload_A1_2.csv",
+    ]
+    assert archive.read("dataload_A1.csv").decode() == tokens_csv(create_tokens("A1", data))
+
+
+def test_cli_exports_batch_output(tmp_path, capsys):
+    specs = [
+        {"Part": "Bolt, Eye", "Item code": "55150A", "size": "M12"},
+        {"Part": "Gasket, Flat", "Item code": "50158B", "Mode": "Update"},
+        {"Part": "Gasket, Flat"},
+        {"Part": "Flux capacitor", "Item code": "X"},
+    ]
+    items = tmp_path / "items.csv"
+    write_items(generate_batch(specs, workers=1), items)
+
+    skipped = []
+    rows = list(read_items(items, skipped=skipped))
+    assert [(mode, code) for mode, code, _ in rows] == [("create", "55150A"), ("update", "50158B")]
+    assert skipped == [3, 4]
+
+    out = tmp_path / "dataload.csv"
+    assert main([str(items), str(out)]) == 0
+    assert "2 items exported" in capsys.readouterr().out
+    tokens = [row[0] for row in csv.reader(out.open(newline=""))]
+    assert tokens.count("\\%FN") == 1 and tokens[tokens.index("\\%VF") + 1] == "50158B"
+
+
+def test_xlsx_items_and_uploads_are_read(tmp_path):
+    specs = [
+        {"Part": "Bolt, Eye", "Item code": 5515000001, "size": "M12"},
+        {"Part": "Gasket, Flat", "Item code": "50158B", "Mode": "Update"},
+    ]
+    xlsx, items = tmp_path / "items.xlsx", tmp_path / "items.csv"
+    rows = generate_batch(specs, workers=1)
+    write_items(rows, xlsx)
+    write_items(rows, items)
+    from_xlsx = list(read_items(xlsx))
+    assert [(mode, code) for mode, code, _ in from_xlsx] == [("create", "5515000001"), ("update", "50158B")]
+    assert [data["Description"] for _, _, data in from_xlsx] == [row["Description"] for row in rows]
+
+    upload = io.BytesIO(xlsx.read_bytes())
+    upload.name = "items.xlsx"
+    assert list(read_items(upload)) == from_xlsx
+    upload = io.BytesIO(items.read_bytes())
+    upload.name = "items.csv"
+    assert [code for _, code, _ in read_items(upload)] == ["5515000001", "50158B"]
+
+    out = io.BytesIO()
+    assert write_dataload(read_items(xlsx), out) == 2
+    assert out.getvalue().decode() == "".join(
+        tokens_csv(item_tokens(mode, code, data)) for mode, code, data in from_xlsx)
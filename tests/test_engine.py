@@ -0,0 +1,116 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import OutputRecord, generate_item, part_names, spec_hash
+from src.parts import PART_SECTIONS
+from src.utils.catalog import build_catalog
+
+CG3M = {"material_type": "ASTM", "material_prefix": "A351_", "material_name": "CG3M"}
+
+
+@pytest.fixture(scope="module")
+def catalog(tmp_path_factory):
+    return build_catalog(snapshot_dir=tmp_path_factory.mktemp("snapshot"))
+
+
+def test_every_part_has_a_generator():
+    assert set(part_names()) == set(PART_SECTIONS) | {
+        "Flange, Pipe", "Gasket, Flat", "Gasket, Ring Type Joint", "Gasket, Spiral Wound",
+    }
+
+
+@pytest.mark.parametrize("part", part_names())
+def test_generate_item_with_empty_spec(part, catalog):
+    record = generate_item(part, {}, catalog)
+    assert record.part == part
+    assert record.description.startswith("*")
+    assert record["Catalog version"] == catalog.label
+
+
+def test_pump_part_matches_ui_output(catalog):
+    record = generate_item(
+        "Casing, Pump", {"model": "HPX", "size": "3HPX10A", "hf_service": True, **CG3M}, catalog
+    )
+    assert record.description == (
+        "*CASING, PUMP - HPX - 3HPX10A - ASTM A351_ CG3M"
+        " [SQ58] [CORP-ENG-0115] <SQ113> [CORP-ENG-0194] [SQ95]"
+    )
+    assert record["FPD material code"] == catalog.materials.fpd_code("ASTM", "A351_", "CG3M")
+    assert record["Template"] == "FPD_MAKE"
+    assert generate_item("Diffuser, Pump", {"make_or_buy": "Make"}, catalog)["Template"] == "FPD_MAKE"
+    assert generate_item("Diffuser, Pump", {}, catalog)["Template"] == "FPD_BUY_1"
+
+
+def test_shaft_adds_sq123_for_multistage_pumps(catalog):
+    spec = {"model": "QL", "material_type": "ASTM", "material_prefix": "A276_",
+            "material_name": "Tp. 410 Cond A"}
+    record = generate_item("Shaft, Pump", spec, catalog)
+    assert "[SQ123] [SQ60]" in record.description
+    assert record["Quality"].startswith("SQ 123 - ")
+
+
+def test_casting_tags(catalog):
+    record = generate_item(
+        "Impeller casting",
+        {"impeller_pump_type": "DMX", "pattern_mod_1": "A", "pattern_mod_3": "B",
+         "material_type": "ASTM", "material_prefix": "A351_", "material_name": "CF3M"},
+        catalog,
+    )
+    assert record["Pattern item"] == "A/B"
+    assert record.description.endswith(
+        "[CORP-ENG-0229] [SQ58] [CORP-ENG-0115] [DE2390.002] [SQ121] [DE2920.025]"
+        " [DE2390.001] [CORP-ENG-0523] [CORP-ENG-0090]"
+    )
+    # Service flags do not apply to dry castings
+    dry = generate_item("Bearing cover casting", {"water": True, "hf_service": True}, catalog)
+    assert "<PI23>" not in dry.description and "<SQ113>" not in dry.description
+
+
+def test_rolling_bearing_designation(catalog):
+    record = generate_item(
+        "Bearing, Rolling",
+        {"model": "7210", "design": "BE (40° AC, paired)", "clearance": "C3", "od": "90"},
+        catalog,
+    )
+    assert record.description.startswith("*BEARING, ROLLING - 7210BEC3 (")
+    assert record.description.endswith(" - OD 90")
+
+
+def test_text_flags_and_list_quality(catalog):
+    bolt = generate_item("Bolt, Hexagonal", {"full_thread": "Yes", "zinc_plated": "No"}, catalog)
+    assert bolt.description == "*HEXAGONAL BOLT - FULL THREADED"
+    baseplate = generate_item("Baseplate, Pump", CG3M, catalog).to_dict()
+    assert baseplate["Quality"][-1].startswith("SQ 95 - ")
+
+
+def test_output_record_is_read_only(catalog):
+    record = generate_item("Baseplate, Pump", {}, catalog)
+    with pytest.raises(AttributeError):
+        record.part = "Other"
+    with pytest.raises(TypeError):
+        record.fields["Item"] = "X"
+    assert isinstance(record.fields["Quality"], tuple)
+    data = record.to_dict()
+    data["Item"] = "X"
+    assert record["Item"] == "477..."
+    assert record == OutputRecord("Baseplate, Pump", record.fields)
+
+
+def test_unknown_part(catalog):
+    with pytest.raises(ValueError):
+        generate_item("Flux capacitor", {}, catalog)
+
+
+def test_spec_hash_ignores_spacing_case_and_order(catalog):
+    spec = {"model": "HPX", "size": "1HPX7A", "material_note": "NACE MR0175, PMI", **CG3M}
+    same = {**CG3M, "material_note": " pmi ;nace  mr0175", "size": "1hpx7a", "model": "HPX",
+            "note": "", "hf_service": False}
+    record = generate_item("Casing, Pump", spec, catalog)
+    assert record.spec_hash == spec_hash("Casing, Pump", same)
+    assert record.spec_hash != spec_hash("Casing Cover, Pump", spec)
+    assert record.spec_hash != spec_hash("Casing, Pump", {**spec, "material_note": "PMI"})
+
@@ -0,0 +1,75 @@
+from pathlib import Path
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import generate_item
+from src.utils.history_store import ItemHistory
+
+SPEC = {
+    "model": "HPX", "size": "1HPX7A", "dwg": "D123",
+    "material_type": "ASTM", "material_prefix": "A351_", "material_name": "CG3M",
+}
+
+
+def test_records_and_indexed_lookups(tmp_path):
+    history = ItemHistory(tmp_path / "items.db")
+    casing = generate_item("Casing, Pump", SPEC)
+    item_id = history.append(casing, SPEC, user="mrossi")
+    history.append_many([
+        (generate_item("Bolt, Hexagonal", {"size": "M12x1.75"}), {"size": "M12x1.75"}, "lbianchi"),
+        (generate_item("Impeller, Pump", SPEC), SPEC, "mrossi"),
+    ])
+    assert len(history) == 3
+    item = history.get(item_id)
+    assert item.spec == SPEC and item.fields == casing.to_dict() and item.user == "mrossi"
+    assert item.catalog_version == casing["Catalog version"]
+    assert [i.part for i in history.find()] == ["Impeller, Pump", "Bolt, Hexagonal", "Casing, Pump"]
+    assert [i.id for i in history.find(part="Casing, Pump")] == [item_id]
+    assert [i.part for i in history.find(fpd_code=item.fpd_code, drawing="D123")] == [
+        "Impeller, Pump", "Casing, Pump",
+    ]
+    assert [i.id for i in history.find(description="  " + casing.description.lower())] == [item_id]
+
+
+def test_full_text_search(tmp_path):
+    history = ItemHistory(tmp_path / "items.db")
+    history.append(generate_item("Casing, Pump", SPEC), SPEC)
+    history.append(generate_item("Impeller, Pump", SPEC), SPEC)
+    assert [i.part for i in history.search("a35 cg3m")] == ["Impeller, Pump", "Casing, Pump"]
+    assert [i.part for i in history.search("casing a351", part="Casing, Pump")] == ["Casing, Pump"]
+    assert history.search("cg3m", part="Shaft, Pump") == []
+    assert history.search('"or AND') == []
+
+
+def test_history_is_append_only(tmp_path):
+    history = ItemHistory(tmp_path / "items.db")
+    history.append(generate_item("Casing, Pump", SPEC), SPEC)
+    with pytest.raises(sqlite3.IntegrityError):
+        history._connection().execute("DELETE FROM items")
+    assert history._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_existing_code_of_an_equivalent_spec(tmp_path):
+    history = ItemHistory(tmp_path / "items.db")
+    record = generate_item("Casing, Pump", {**SPEC, "note": "A, B"})
+    item_id = history.append(record, SPEC)
+    assert history.existing_code(record.spec_hash) is None
+    history.record_code("4020100001", record.spec_hash, item_id, user="mrossi")
+    again = generate_item("Casing, Pump", {**SPEC, "note": "b;a  "})
+    code = history.existing_code(again.spec_hash)
+    assert (code.item_code, code.user, code.history_id) == ("4020100001", "mrossi", item_id)
+    assert history.find(spec_hash=again.spec_hash)[0].id == item_id
+
+
+
+def test_user_without_sign_in_is_never_the_os_user(monkeypatch):
+    from src.utils.history import current_user
+
+    monkeypatch.setenv("ORACLE_CONFIG_USER", "planner")
+    assert current_user() == "planner"
+    monkeypatch.delenv("ORACLE_CONFIG_USER")
+    assert current_user() == "unknown"
@@ -0,0 +1,89 @@
+from pathlib import Path
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils import item_codes
+from src.utils.history_store import ItemHistory
+from src.utils.item_codes import allocate, code_numbers, free_numbers, item_prefix, reservable_prefix
+from src.utils.item_master import ItemMasterIndex, import_export
+
+EXPORT = """Item,Description
+4020100001,*CASING 1
+4020100002,*CASING 2
+4020100007,*CASING 7
+402010000X,*NOT A NUMBER
+40201000011,*LONGER CODE
+5623000001,*HEXAGONAL BOLT - M12x1.75
+"""
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text(EXPORT, encoding="utf-8")
+    import_export(path, tmp_path / "index")
+    return ItemMasterIndex(tmp_path / "index")
+
+
+def test_prefix_and_numbers():
+    assert item_prefix("40201…") == "40201"
+    assert item_prefix("477...") == "477"
+    assert item_prefix("73002") == "73002"
+    codes = np.array([b"4020100003", b"4020100001", b"402010000X", b"40201000011"], dtype="S11")
+    assert code_numbers(codes, "40201", 10).tolist() == [3, 1]
+    assert code_numbers(["4020100009", "5623000001"], "40201", 10).tolist() == [9]
+    taken = np.array([1, 2, 5, 9])
+    assert free_numbers(taken, 3, 100).tolist() == [10, 11, 12]
+    assert free_numbers(taken, 5, 100, fill_gaps=True).tolist() == [3, 4, 6, 7, 8]
+    assert free_numbers(taken, 3, 100, fill_gaps=True, also_taken=[4, 3, 50]).tolist() == [6, 7, 8]
+    assert free_numbers(taken, 2, 100, also_taken=[50, 12]).tolist() == [51, 52]
+    with pytest.raises(ValueError):
+        free_numbers(taken, 91, 100)
+
+
+@pytest.mark.parametrize("scan", [1, 4096])
+def test_allocate_skips_master_and_reserved_codes(tmp_path, index, monkeypatch, scan):
+    # The item master is read a block at a time; a block of one code tests the joins
+    monkeypatch.setattr(item_codes, "SCAN_CODES", scan)
+    history = ItemHistory(tmp_path / "items.db")
+    assert len(index.codes_with_prefix("40201")) == 5 and not len(index.codes_with_prefix("4021"))
+    assert allocate("40201…", 2, history=history, index=index) == ["4020100008", "4020100009"]
+    assert allocate("40201", 3, history=history, index=index, fill_gaps=True) == [
+        "4020100003", "4020100004", "4020100005"]
+    history.record_code("4020100010", spec_hash=1)
+    assert allocate("40201", history=history, index=index) == ["4020100011"]
+    assert allocate("999", history=history, index=index) == ["9990000001"]
+    with pytest.raises(ValueError):
+        allocate("…", history=history, index=index)
+
+
+def test_concurrent_reservations_never_share_a_code(tmp_path, index):
+    history = ItemHistory(tmp_path / "items.db", timeout=30)
+    reserved = []
+
+    def worker():
+        for _ in range(10):
+            reserved.extend(allocate("56230", 5, history=history, index=index, fill_gaps=True))
+        history.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(reserved) == len(set(reserved)) == 200
+    assert "5623000001" not in reserved
+
+
+def test_only_known_digit_prefixes_are_reservable(index):
+    assert reservable_prefix("40201…", index) == "40201"
+    assert reservable_prefix("56230...", index) == "56230"
+    # Casting placeholder, prefix unknown to the item master, no item master
+    assert reservable_prefix("7XX", index) == ""
+    assert reservable_prefix("999…", index) == ""
+    assert reservable_prefix("40201…", None) == ""
@@ -0,0 +1,77 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.item_master import ItemMasterIndex, import_export, open_index
+
+EXPORT = """Item,Description,Last Update Date,UOM
+4020100001,"*CASING, PUMP - HPX - ASTM A351_ CG3M",15-JAN-2024 10:00:00,EA
+5623000001,*HEXAGONAL BOLT - M12x1.75,2024-01-20,EA
+,*NO CODE,2024-01-21,EA
+5623000002,*HEXAGONAL BOLT - M16x2,2024-01-10,EA
+"""
+
+DELTA = """ITEM_NUMBER;DESCRIPTION;LAST_UPDATE_DATE
+5623000002;*HEXAGONAL BOLT - M16x2 - ZINC PLATED;2024-02-01 08:00:00
+5623000001;*STALE ROW;2024-01-05
+7000000001;*NEW ITEM;2024-02-02
+"""
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_import_and_lookups(tmp_path):
+    result = import_export(write(tmp_path, "export.csv", EXPORT), tmp_path / "index")
+    assert (result.rows, result.skipped, result.codes) == (3, 1, 3)
+    assert result.watermark == "2024-01-20T00:00:00"
+    index = ItemMasterIndex(tmp_path / "index")
+    assert index.has_code("5623000001") and index.has_code(" 4020100001 ")
+    assert not index.has_code("5623000003") and not index.has_code("")
+    assert index.code_for_description("casing, pump - hpx -  astm a351_ cg3m") == "4020100001"
+    assert index.code_for_description("*HEXAGONAL BOLT - M20x2.5") is None
+
+
+def test_delta_import_applies_rows_after_the_watermark(tmp_path):
+    import_export(write(tmp_path, "export.csv", EXPORT), tmp_path / "index")
+    first = open_index(tmp_path / "index")
+    result = import_export(write(tmp_path, "delta.csv", DELTA), tmp_path / "index", delta=True)
+    assert (result.rows, result.skipped, result.codes) == (2, 1, 4)
+    assert result.watermark == "2024-02-02T00:00:00"
+    index = open_index(tmp_path / "index")
+    assert index is not first and len(index) == 4
+    assert index.has_code("7000000001")
+    assert index.code_for_description("*HEXAGONAL BOLT - M16x2 - ZINC PLATED") == "5623000002"
+    assert index.code_for_description("*HEXAGONAL BOLT - M16x2") is None
+    assert index.code_for_description("*STALE ROW") is None
+    assert sorted(p.name for p in (tmp_path / "index").iterdir()) == ["index-2", "manifest.json"]
+
+
+def test_import_errors(tmp_path):
+    assert open_index(tmp_path / "missing") is None
+    with pytest.raises(ValueError):
+        import_export(write(tmp_path, "delta.csv", DELTA), tmp_path / "index", delta=True)
+    with pytest.raises(ValueError):
+        import_export(write(tmp_path, "bad.csv", "Code,Text\n1,a\n"), tmp_path / "index")
+
+
+def test_dataload_warnings(tmp_path):
+    from src.utils.dataload import item_master_warnings
+
+    import_export(write(tmp_path, "export.csv", EXPORT), tmp_path / "index")
+    index = ItemMasterIndex(tmp_path / "index")
+    casing = {"Description": "*CASING, PUMP - HPX - ASTM A351_ CG3M"}
+    assert item_master_warnings(index, "create", "4020100001", casing) == [
+        "Item code **4020100001** already exists in the Oracle item master."]
+    assert item_master_warnings(index, "create", "4020100009", casing) == [
+        "The Oracle item master already has this description: **4020100001**."]
+    assert item_master_warnings(index, "update", "4020100001", casing) == []
+    assert item_master_warnings(index, "update", "4020100009", casing) == [
+        "Item code **4020100009** is not in the Oracle item master."]
+    assert item_master_warnings(None, "create", "4020100001", casing) == []
@@ -0,0 +1,87 @@
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import read_workbook
+from src.utils.materials_index import MaterialsIndex, filter_materials, get_fpd_code
+from src.utils.quality_rules import material_classes
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "Material Type": ["ASTM", "ASTM", "ASTM", "MISCELLANEOUS", "EN"],
+            "Prefix": ["A351_", "A216_", "A351_", "_", None],
+            "Name": ["CG3M", "WCB", "CF3M", "VITON", "X5"],
+            "FPD Code": ["C3125", "C3009", "C3021", "L1013", "E1"],
+            "Casting code": [None, "7004", "7011", None, None],
+        }
+    )
+
+
+def test_index_lookups():
+    index = MaterialsIndex.from_frame(_frame())
+    assert index.types == ("ASTM", "MISCELLANEOUS", "EN")
+    assert index.prefixes("ASTM") == ("A216_", "A351_")
+    assert index.names("ASTM", "A351_") == ("CG3M", "CF3M")
+    assert index.names_for_type("EN") == ("X5",)
+    row = index.row("ASTM", "A216_", "WCB")
+    assert row.fpd_code == "C3009"
+    assert row.casting_code == "7004"
+    assert row.display == "ASTM A216_ WCB"
+    assert index.row("ASTM", "A216_", "CG3M") is None
+
+
+def test_fpd_code_defaults():
+    index = MaterialsIndex.from_frame(_frame())
+    assert index.fpd_code("ASTM", "", "") == ""
+    assert get_fpd_code(index, "ASTM", "A351_", "CF3M") == "C3021"
+    assert get_fpd_code(index, "ASTM", "A351_", "X") == "NOT AVAILABLE"
+
+
+def test_index_matches_mask_filtering_on_catalog():
+    materials_df = read_workbook()["materials"]
+    index = MaterialsIndex.from_frame(materials_df)
+    for mtype in index.types:
+        mask = materials_df["Material Type"] == mtype
+        assert index.prefixes(mtype) == tuple(
+            sorted(materials_df[mask]["Prefix"].dropna().unique())
+        )
+        for mprefix in index.prefixes(mtype):
+            expected = materials_df[mask & (materials_df["Prefix"] == mprefix)]
+            assert list(index.names(mtype, mprefix)) == expected["Name"].dropna().tolist()
+            for _, row in expected.dropna(subset=["Name"]).iterrows():
+                assert index.fpd_code(mtype, mprefix, row["Name"]) == row["FPD Code"] or (
+                    pd.isna(row["FPD Code"])
+                )
+
+
+def test_filter_materials_matches_string_masks():
+    materials_df = read_workbook()["materials"]
+    assert all(
+        isinstance(materials_df[c].dtype, pd.CategoricalDtype)
+        for c in ["Material Type", "Prefix", "Name"]
+    )
+    as_text = materials_df.astype({c: object for c in ["Material Type", "Prefix", "Name"]})
+    expected = as_text[(as_text["Material Type"] == "ASTM") & (as_text["Prefix"] == "A351_")]
+    result = filter_materials(materials_df, "ASTM", "A351_")
+    assert result.index.tolist() == expected.index.tolist()
+    assert len(filter_materials(materials_df, "ASTM", "A351_", "CG3M")) == 1
+    assert filter_materials(materials_df, "NOT A TYPE").empty
+
+
+def test_rows_carry_material_classes():
+    classes = material_classes({"materials": {
+        "CG": {"pairs": [["A351_", "CG3M"]]},
+        "SQ121": {"names": ["CG3M", "CF3M"]},
+    }})
+    index = MaterialsIndex.from_frame(_frame(), classes)
+    assert index.row("ASTM", "A351_", "CG3M").flags == {"CG", "SQ121"}
+    assert index.row("ASTM", "A351_", "CF3M").flags == {"SQ121"}
+    assert index.row("ASTM", "A216_", "WCB").flags == frozenset()
+    # Materials outside the catalog are classified on their names
+    assert index.flags("EN", "A351_", "CG3M") == {"CG", "SQ121"}
+    assert MaterialsIndex.from_frame(_frame()).flags("ASTM", "A351_", "CG3M") == frozenset()
@@ -0,0 +1,27 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.natural_sort import natural_key, sorted_options
+
+
+def test_natural_order_of_sizes():
+    options = ["", '1-1/4"', '1/2"-13UNC', "M10", '5/16"-18UNC', "M8", '1"', "Ø10", "Ø1.5",
+               "#10-24UNC"]
+    assert sorted_options(options) == (
+        "", "#10-24UNC", '5/16"-18UNC', '1/2"-13UNC', '1"', '1-1/4"', "M8", "M10", "Ø1.5", "Ø10",
+    )
+
+
+def test_numbers_before_text_and_ties_by_text():
+    assert sorted_options(["b", 10, "2.5", "a", 3, "A"]) == ("2.5", 3, 10, "A", "a", "b")
+    assert natural_key("M12x1.75") < natural_key("M12x2")
+
+
+def test_sorted_lists_are_cached():
+    options = [f"M{n}" for n in range(40, 0, -1)]
+    first = sorted_options(options)
+    assert sorted_options(list(options)) is first
+    # Unhashable options are still sorted
+    assert sorted_options([["b"], ["a"]]) == (["a"], ["b"])
@@ -0,0 +1,22 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import part_names
+from src.parts import PART_MODULES, PART_SECTIONS, renderer
+
+
+def test_every_part_has_a_renderer():
+    assert set(PART_MODULES) == set(part_names())
+    assert set(PART_SECTIONS) <= set(PART_MODULES)
+    for part in PART_MODULES:
+        assert callable(renderer(part))
+
+
+def test_renderer_imports_module_on_first_use():
+    sys.modules.pop("src.parts.gusset", None)
+    assert renderer("") is None
+    assert "src.parts.gusset" not in sys.modules
+    renderer("Gusset, Other")
+    assert "src.parts.gusset" in sys.modules
@@ -0,0 +1,42 @@
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.pumps import PumpCatalog
+
+
+def _catalog():
+    size_df = pd.DataFrame(
+        {
+            "Pump Model": ["HPX", "HPX", "DMX", "HPX"],
+            "Size": ["3HPX12A", "1.5HPX10A", "4x6x11", "3HPX12A"],
+        }
+    )
+    features_df = pd.DataFrame(
+        {
+            "Pump Model": ["HPX", "HPX", "HPX", "DMX"],
+            "Feature Type": ["features1", "features1", "features2", "features1"],
+            "Feature": ["STD", "INDUCER", "Plugged discharge nozzle", "BB3"],
+        }
+    )
+    return PumpCatalog.from_frames(size_df, features_df)
+
+
+def test_models_are_sorted():
+    assert _catalog().models == ("DMX", "HPX")
+
+
+def test_sizes_keep_catalog_order_without_duplicates():
+    catalog = _catalog()
+    assert catalog.sizes("HPX") == ("3HPX12A", "1.5HPX10A")
+    assert catalog.sizes("") == ()
+
+
+def test_features_by_model_and_type():
+    catalog = _catalog()
+    assert catalog.features("HPX") == ("STD", "INDUCER")
+    assert catalog.features("HPX", "features2") == ("Plugged discharge nozzle",)
+    assert catalog.features("DMX", "features2") == ()
@@ -0,0 +1,85 @@
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import part_names
+from src.utils.data import load_data
+from src.utils.quality_rules import QualityResult, QualityRules, compile_part, default_rules
+
+RULES = {
+    "materials": {"CG": {"pairs": [["A351_", "CG3M"]]}},
+    "lines": {"[A]": "A - standard", "[B]": "B - flag", "[C]": "C - material"},
+    "rulesets": {
+        "demo": {
+            "parts": ["Part, One", "Part, Two"],
+            "lines_first": ["[C]"],
+            "rules": [
+                {"tag": "[A]", "standard": True},
+                {"tag": "[B]", "flag": "hf_service", "except_parts": ["Part, Two"]},
+                {"tag": "[C]", "material": "CG", "spec": {"model": ["QL"]}},
+            ],
+        }
+    },
+}
+
+
+def test_rules_compile_to_masks():
+    rules = compile_part(RULES, "demo", "Part, One")
+    assert len(rules.conditions) == 3
+    assert rules.standard == 0b001
+
+    spec = {"hf_service": "Yes", "model": "QL",
+            "material_prefix": "A351_", "material_name": "CG3M"}
+    facts = rules.facts(spec)
+    assert facts == 0b111
+    assert rules.mask(facts) == 0b111
+    # Lines listed in "lines_first" lead the quality text, tags keep rule order
+    result = rules.evaluate(spec)
+    assert result.tags == ("[A]", "[B]", "[C]")
+    assert result.lines == ("C - material", "A - standard", "B - flag")
+    assert rules.evaluate({"model": "QL"}) == QualityResult(("[A]",), ("A - standard",))
+
+
+def test_part_conditions_resolve_at_compile_time():
+    rules = QualityRules.from_data(RULES)
+    assert rules.parts == ("Part, One", "Part, Two")
+    assert rules.evaluate("Part, Two", {"hf_service": True}).tags == ("[A]",)
+
+
+def test_frame_evaluation_matches_items():
+    rules = default_rules().part("Impeller casting")
+    specs = [
+        {"material_prefix": "A747_", "material_name": "Tp. CB7Cu-1 (H1150 DBL)",
+         "impeller_pump_type": "DMX", "water": "yes"},
+        {"material_prefix": "A351_", "material_name": "CF3M", "hf_service": True},
+        {"material_type": "ASTM", "stamicarbon": "no"},
+    ] * 50
+    frame = pd.DataFrame(specs)
+    assert rules.evaluate_frame(frame) == [rules.evaluate(spec) for spec in specs]
+
+
+def test_every_generated_part_has_rules():
+    rules = default_rules()
+    data = load_data("quality_rules")
+    names = [part for ruleset in data["rulesets"].values() for part in ruleset["parts"]]
+    assert len(names) == len(set(names))
+    assert set(names) <= set(part_names())
+    assert "Casing, Pump" in rules.parts and "Shaft, Pump" in rules.parts
+
+
+def test_quality_result_renders_once_and_is_shared():
+    rules = compile_part(RULES, "demo", "Part, One")
+    first = rules.evaluate({"hf_service": True})
+    assert rules.evaluate({"hf_service": "yes"}) is first
+    assert first.tag_text == "[A] [B]" and first.suffix == " [A] [B]"
+    assert first.text == "A - standard\nB - flag"
+    assert first.tag_text is first.tag_text
+    assert rules.render(0).suffix == "" and not rules.render(0)
+
+    extra = first.inserted((("[X]", "X - extra"),), before="[B]")
+    assert extra.tags == ("[A]", "[X]", "[B]")
+    assert extra.lines == ("A - standard", "X - extra", "B - flag")
+    assert hash(extra) == hash(QualityResult(extra.tags, extra.lines))
@@ -0,0 +1,45 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import build_catalog
+from src.utils.search_index import SearchIndex, material_entries
+
+LABELS = ["M12x1.75", "M120x6", "M10x1.5", '1/2"-13UNC', "HM12", "m12"]
+
+
+def test_ranking_and_limit():
+    index = SearchIndex(LABELS)
+    # Whole label, then label prefixes (shorter first), then anywhere
+    assert index.search("M12") == ["m12", "M120x6", "M12x1.75", "HM12"]
+    assert index.search("m12", k=2) == ["m12", "M120x6"]
+    assert index.search("x1.") == ["M10x1.5", "M12x1.75"]
+    assert index.search("13unc") == ['1/2"-13UNC']
+    assert index.search("zz") == []
+    assert index.search("") == LABELS[:20]
+
+
+def test_every_token_must_match_and_values_are_returned():
+    labels = ["ASTM A351_ CG3M", "ASTM A743_ CG3M", "ASTM A351_ CF3M"]
+    index = SearchIndex(labels, values=["a", "b", "c"])
+    assert index.search("cg3m a351") == ["a"]
+    assert index.search("  astm   cf3m ") == ["c"]
+
+
+def test_long_tokens_match_like_a_scan():
+    index = SearchIndex(f"ASTM A{n}_ TP. {n % 7}16L" for n in range(100, 600))
+    for query in ("astm", "tp. 3", "a12", "216l", "516", "9_ tp"):
+        expected = [label for label in index.labels
+                    if all(token in label.casefold() for token in query.split())]
+        found = index.search(query, k=len(index))
+        assert sorted(found) == sorted(expected)
+
+
+def test_catalog_search_indexes():
+    catalog = build_catalog()
+    assert catalog.search.skf_models.search("7210")[0] == "7210"
+    assert "M12x1.75" in catalog.search.bolt_sizes.search("m12")
+    entries = material_entries(catalog.materials)
+    assert len(catalog.search.materials) == len(entries)
+    assert catalog.search.materials.search("a351 cg3m")[0] == ("ASTM", "A351_", "CG3M")
@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import build_catalog
+from src.utils.sizes import INCH, METRIC, SizeTable, parse_size
+
+
+def test_parse_formats():
+    assert parse_size("M20x2.5")[1:] == (METRIC, 20.0, 2.5, "M")
+    size = parse_size('1-1/8"-12UNF')
+    assert size.system == INCH and size.thread == "UNF" and size.tpi == 12
+    assert size.nominal_mm == pytest.approx(28.575)
+    assert parse_size("#10-24UNC").nominal_mm == pytest.approx(0.19 * 25.4)
+    assert parse_size('2-1/4"in').nominal_mm == pytest.approx(57.15)
+    assert parse_size("1-1/4”").nominal_mm == pytest.approx(31.75)
+    assert parse_size('5/32"')[1] == INCH
+    assert parse_size("Ø1.5 mm")[1:3] == (METRIC, 1.5)
+    assert parse_size("Ø1.5")[1:3] == (METRIC, 1.5)
+    assert parse_size("50mm")[1:3] == (METRIC, 50.0)
+    for bad in ("", "12", "abc", "Mx2"):
+        with pytest.raises(ValueError):
+            parse_size(bad)
+
+
+def test_range_filter_and_validation():
+    table = SizeTable(["M24x3", "M10x1.5", '1/2"-13UNC', "M12x1.75", '1"-12UNF'])
+    assert table.between("M12", "M24") == ("M12x1.75", '1/2"-13UNC', "M24x3")
+    assert table.between("M12", "M24", system=METRIC) == ("M12x1.75", "M24x3")
+    assert table.between(low=25, thread="UNF") == ('1"-12UNF',)
+    assert table.invalid(["M10x1.5", "M11", '1"-12UNF']) == ["M11"]
+
+
+def test_every_catalog_size_parses():
+    catalog = build_catalog()
+    sizes = catalog.sizes
+    assert sizes.bolt_sizes.labels == catalog.bolts["sizes"]
+    assert sizes.bolt_sizes.between("M12", "M24", system=METRIC) == (
+        "M12x1.75", "M16x2", "M20x2.5", "M24x3",
+    )
+    assert sizes.dowel_diameters["Ø1.5 mm"].nominal_mm == 1.5
+    assert sizes.flange_sizes.between(high='1/2"') == ("1/8”", "1/4”", "3/8”", "1/2”")
+    assert sizes.bolt_lengths.between(100, 108) == (
+        "100mm", '4"in', '4-1/8"in', "105mm", '4-1/4"in',
+    )
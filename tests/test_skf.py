@@ -0,0 +1,62 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.engine import generate_item
+from src.utils.catalog import build_catalog
+from src.utils.skf import DECODE_CACHE_SIZE, SkfDecoder, Trie
+
+OPTIONS = {
+    "models": ["6205", "7210", "NU202"],
+    "seals": ["", "2RSH", "2Z"],
+    "design": ["", "BE (40° AC, paired)", "E (high capacity)"],
+    "pairing": ["", "CB (light preload)", "CC (medium preload)"],
+    "cages": ["", "M (machined brass)", "CC (polyamide)"],
+    "clearances": ["", "C3"],
+}
+
+
+def test_trie_matches_longest_first():
+    trie = Trie([("C", 1), ("CC", 2), ("CCD", 3)])
+    assert trie.matches("CCX") == [(2, 2), (1, 1)]
+    assert trie.longest("XCC", 1) == (3, 2)
+    assert trie.longest("X") is None
+
+
+def test_decode_designation():
+    decoder = SkfDecoder.from_options(OPTIONS)
+    result = decoder.decode("7210BECBM/C3")
+    assert (result.model, result.series) == ("7210", "72")
+    assert (result.design, result.pairing, result.cage, result.clearance) == ("BE", "CB", "M", "C3")
+    assert result.extra == ""
+    assert result.descriptions[0] == "Angular contact ball bearing – 15°"
+
+    # A code of two groups goes to the earlier one
+    assert decoder.decode("7210BECC").pairing == "CC"
+    assert decoder.decode("6205-2RSH/C3")[3:5] == ("Deep groove ball bearing – medium series", "2RSH")
+    # Unknown models are a series and its bore digits
+    result = decoder.decode("NU2020ECM/C3X")
+    assert (result.model, result.design, result.cage, result.extra) == ("NU2020", "EC", "M", "X")
+
+
+def test_decode_many_round_trips_generated_codes():
+    catalog = build_catalog()
+    decoder = catalog.skf_decoder
+    spec = {"model": "7210", "design": "BE (40° AC, paired)", "pairing": "CB (light preload)",
+            "cage": "M (machined brass)", "clearance": "C3", "tolerance": "P6"}
+    description = generate_item("Bearing, Rolling", spec, catalog).description
+    code = description.split(" - ")[1].split(" (")[0]
+
+    first, second = decoder.decode_many([code, code])
+    assert first is second
+    decoded = decoder.spec(first)
+    assert {key: decoded[key] for key in spec} == spec
+    assert generate_item("Bearing, Rolling", decoded, catalog).description == description
+
+
+def test_decoded_designations_are_bounded():
+    decoder = SkfDecoder.from_options(OPTIONS)
+    for bore in range(DECODE_CACHE_SIZE + 10):
+        decoder.decode(f"NU2{bore:03d}ECM")
+    assert decoder._decoded.cache_info().currsize == DECODE_CACHE_SIZE
@@ -0,0 +1,44 @@
+from pathlib import Path
+import json
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import WORKBOOK_PATH, read_workbook
+from src.utils.snapshot import MANIFEST, build_snapshot, ensure_snapshot, is_fresh, read_snapshot
+
+
+def test_snapshot_round_trips_workbook(tmp_path):
+    """Tables read from the snapshot match a direct parse of the workbook."""
+    build_snapshot(WORKBOOK_PATH, tmp_path)
+    expected = read_workbook(WORKBOOK_PATH)
+    loaded = read_snapshot(tmp_path)
+    for name, df in expected.items():
+        pd.testing.assert_frame_equal(
+            loaded[name].astype(object), df.astype(object), check_dtype=False
+        )
+
+
+def test_snapshot_is_rebuilt_when_hash_changes(tmp_path):
+    """A manifest recording another workbook hash marks the snapshot stale."""
+    build_snapshot(WORKBOOK_PATH, tmp_path)
+    assert is_fresh(WORKBOOK_PATH, tmp_path)
+
+    manifest_path = tmp_path / MANIFEST
+    manifest = json.loads(manifest_path.read_text())
+    manifest["source_hash"] = "0" * 64
+    manifest_path.write_text(json.dumps(manifest))
+    assert not is_fresh(WORKBOOK_PATH, tmp_path)
+
+    ensure_snapshot(WORKBOOK_PATH, tmp_path)
+    assert is_fresh(WORKBOOK_PATH, tmp_path)
+
+
+def test_mixed_columns_are_stored_as_text():
+    materials = read_workbook(WORKBOOK_PATH)["materials"]
+    for column in ["Name", "Casting code"]:
+        values = materials[column].dropna()
+        assert all(isinstance(v, str) for v in values)
+    assert "6351" in set(materials["Name"].dropna())
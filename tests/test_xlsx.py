@@ -0,0 +1,62 @@
+from pathlib import Path
+import sys
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.catalog import SHEETS, WORKBOOK_PATH
+from src.utils.xlsx import XlsxReader
+
+
+def _openpyxl_rows(path, sheet):
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return [
+            tuple(row)
+            for row in wb[sheet].iter_rows(values_only=True)
+            if any(v is not None for v in row)
+        ]
+    finally:
+        wb.close()
+
+
+def _trim(row):
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return tuple(row)
+
+
+def test_rows_match_openpyxl(tmp_path):
+    path = tmp_path / "book.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Qty", "Ratio", "Flag"])
+    ws.append(["bolt", 7003, 1.5, True])
+    ws.append([])
+    ws.append([None, None, 2.0, False])
+    ws["F6"] = "far"
+    wb.save(path)
+
+    with XlsxReader(path) as reader:
+        assert reader.sheet_names == ["Data"]
+        rows = list(reader.rows("Data"))
+    assert rows == [_trim(r) for r in _openpyxl_rows(path, "Data")]
+    assert rows[1] == ("bolt", 7003, 1.5, True)
+    assert rows[3] == (None, None, None, None, None, "far")
+
+
+def test_catalog_sheets_match_openpyxl():
+    with XlsxReader(WORKBOOK_PATH) as reader:
+        for sheet in SHEETS.values():
+            expected = [_trim(r) for r in _openpyxl_rows(WORKBOOK_PATH, sheet)]
+            assert [_trim(r) for r in reader.rows(sheet)] == expected
+
+
+def test_unknown_sheet():
+    with XlsxReader(WORKBOOK_PATH) as reader:
+        with pytest.raises(KeyError, match="Nope"):
+            next(reader.rows("Nope"))